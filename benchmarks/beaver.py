@@ -0,0 +1,94 @@
+import asyncio
+import time
+from datetime import timedelta
+
+import typer
+from rich.console import Console
+
+from benchmarks.utils.beaver import StandInBeaver
+from benchmarks.utils.server import BackgroundServer
+from benchmarks.utils.stats import Summary, build_table
+from octopus.cli import CliBuilder
+from octopus.config.models import BeaverCacheConfig, BeaverConfig, BeaverHTTPConfig
+from octopus.services.apis.beaver import models as bm
+from octopus.services.apis.beaver.service import BeaverService
+
+cli = CliBuilder().build()
+
+
+async def _measure(
+    beaver: BeaverService,
+    request: bm.InstancesGetRequest,
+    requests: int,
+    concurrency: int,
+) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    samples: list[float] = []
+
+    async def _get() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await beaver.instances.get(request)
+            samples.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(_get() for _ in range(requests)))
+    return samples
+
+
+async def _run(
+    config: BeaverConfig,
+    request: bm.InstancesGetRequest,
+    requests: int,
+    concurrency: int,
+) -> dict[str, Summary]:
+    summaries: dict[str, Summary] = {}
+    uncached = config.model_copy(update={"cache": BeaverCacheConfig(size=0)})
+
+    variants = (
+        ("per-request client", uncached, False),
+        ("pooled client", uncached, True),
+        ("pooled client with cache", config, True),
+    )
+
+    for variant, variant_config, pooled in variants:
+        beaver = BeaverService(variant_config)
+
+        if pooled:
+            await beaver.open()
+
+        try:
+            await _measure(beaver, request, concurrency, concurrency)
+            samples = await _measure(beaver, request, requests, concurrency)
+        finally:
+            await beaver.close()
+
+        summaries[variant] = Summary.of(samples)
+
+    return summaries
+
+
+@cli.command()
+def main(
+    requests: int = typer.Option(1000, help="Number of requests per variant."),
+    concurrency: int = typer.Option(10, help="Number of concurrent requests."),
+    delay: float = typer.Option(0, help="Stand-in processing delay in seconds."),
+) -> None:
+    """Measure latency of reserve lookups in beaver with and without pooling."""
+    console = Console()
+    standin = StandInBeaver(delay=timedelta(seconds=delay))
+
+    with BackgroundServer(standin.build()) as server:
+        config = BeaverConfig(http=BeaverHTTPConfig(host=server.host, port=server.port))
+        request = bm.InstancesGetRequest(
+            event_id=standin.event,
+            start=standin.start,
+            include={"event": {"include": {"show": True}}},
+        )
+
+        summaries = asyncio.run(_run(config, request, requests, concurrency))
+
+    console.print(build_table("Beaver instance lookup latency", summaries))
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,146 @@
+import asyncio
+import time
+from typing import override
+
+import typer
+from rich.console import Console
+
+from benchmarks.utils.stats import Summary, build_table
+from octopus.cli import CliBuilder
+from octopus.stores.base import Versioned, VersionedStore
+from octopus.stores.memory import MemoryVersionedStore
+
+cli = CliBuilder().build()
+
+type Reservations = tuple[int | None, ...]
+
+
+class _LockedSlots:
+    """Previous scheme with a lock around reads and writes of each slot."""
+
+    def __init__(self, slots: int, delay: float) -> None:
+        self._values: list[int | None] = [None] * slots
+        self._locks = [asyncio.Lock() for _ in range(slots)]
+        self._delay = delay
+
+    async def check(self) -> Reservations:
+        values = []
+
+        for slot, lock in enumerate(self._locks):
+            async with lock:
+                values.append(self._values[slot])
+
+        return tuple(values)
+
+    async def toggle(self, slot: int, owner: int) -> None:
+        async with self._locks[slot]:
+            # Simulate waiting for the store while holding the lock
+            await asyncio.sleep(self._delay)
+            self._values[slot] = owner if self._values[slot] is None else None
+
+
+class _DelayedStore(VersionedStore[Reservations]):
+    """Versioned store with simulated latency of writes."""
+
+    def __init__(self, store: VersionedStore[Reservations], delay: float) -> None:
+        self._store = store
+        self._delay = delay
+
+    @override
+    async def get(self) -> Versioned[Reservations]:
+        return await self._store.get()
+
+    @override
+    async def compare_and_set(
+        self, version: int, value: Reservations
+    ) -> Versioned[Reservations] | None:
+        await asyncio.sleep(self._delay)
+        return await self._store.compare_and_set(version, value)
+
+
+class _VersionedSlots:
+    """New scheme with optimistic compare-and-set writes and lock-free reads."""
+
+    def __init__(self, slots: int, delay: float) -> None:
+        self._store = _DelayedStore(MemoryVersionedStore((None,) * slots), delay)
+
+    async def check(self) -> Reservations:
+        return (await self._store.get()).value
+
+    async def toggle(self, slot: int, owner: int) -> None:
+        while True:
+            current = await self._store.get()
+            value = owner if current.value[slot] is None else None
+            reservations = (*current.value[:slot], value, *current.value[slot + 1 :])
+
+            if await self._store.compare_and_set(current.version, reservations):
+                return
+
+
+type Slots = _LockedSlots | _VersionedSlots
+
+
+async def _reserve(slots: Slots, owner: int, count: int, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        await slots.toggle(owner % count, owner)
+
+
+async def _measure(
+    slots: Slots, count: int, reservers: int, checks: int
+) -> list[float]:
+    stop = asyncio.Event()
+    tasks = [
+        asyncio.create_task(_reserve(slots, owner, count, stop))
+        for owner in range(reservers)
+    ]
+    samples: list[float] = []
+
+    try:
+        for _ in range(checks):
+            start = time.perf_counter()
+            await slots.check()
+            samples.append(time.perf_counter() - start)
+
+            # Let the reservations make progress between checks
+            await asyncio.sleep(0)
+    finally:
+        stop.set()
+        await asyncio.gather(*tasks)
+
+    return samples
+
+
+async def _run(
+    count: int, reservers: int, checks: int, delay: float
+) -> dict[str, Summary]:
+    summaries: dict[str, Summary] = {}
+
+    variants: tuple[tuple[str, Slots], ...] = (
+        ("per-slot locks", _LockedSlots(count, delay)),
+        ("compare-and-set", _VersionedSlots(count, delay)),
+    )
+
+    for variant, slots in variants:
+        samples = await _measure(slots, count, reservers, checks)
+        summaries[variant] = Summary.of(samples)
+
+    return summaries
+
+
+@cli.command()
+def main(
+    slots: int = typer.Option(4, help="Number of slots."),
+    reservers: int = typer.Option(16, help="Number of concurrent reservers."),
+    checks: int = typer.Option(1000, help="Number of availability checks."),
+    delay: float = typer.Option(0.001, help="Simulated store latency in seconds."),
+) -> None:
+    """Measure latency of availability checks while reservations race."""
+    console = Console()
+
+    summaries = asyncio.run(_run(slots, reservers, checks, delay))
+
+    console.print(build_table("Availability check latency under contention", summaries))
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,193 @@
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+
+import typer
+from httpx import AsyncClient, HTTPError, Limits
+from rich.console import Console
+
+from benchmarks.utils.server import find_free_port
+from benchmarks.utils.stats import Summary, build_table
+from octopus.cli import CliBuilder
+
+cli = CliBuilder().build()
+
+PROFILES: Mapping[str, Mapping[str, str]] = {
+    "asyncio + h11": {"loop": "asyncio", "http": "h11"},
+    "asyncio + httptools": {"loop": "asyncio", "http": "httptools"},
+    "uvloop + h11": {"loop": "uvloop", "http": "h11"},
+    "uvloop + httptools": {"loop": "uvloop", "http": "httptools"},
+}
+
+
+@contextmanager
+def _serve(
+    profile: Mapping[str, str], port: int, workers: int, subscribers: int
+) -> Iterator[str]:
+    env = {
+        **os.environ,
+        # All subscribers connect from the same address
+        "OCTOPUS__EVENTS__CONNECTIONS__CLIENT": str(subscribers),
+        "OCTOPUS__MIRROR__ENABLED": "false",
+        "OCTOPUS__SERVER__HOST": "127.0.0.1",
+        "OCTOPUS__SERVER__PORTS__HTTP": str(port),
+        "OCTOPUS__SERVER__WORKERS__COUNT": str(workers),
+        **{
+            f"OCTOPUS__SERVER__RUNTIME__{key.upper()}": value
+            for key, value in profile.items()
+        },
+    }
+
+    # Run in a separate process, so the load generator doesn't compete for the GIL
+    process = subprocess.Popen(  # noqa: S603
+        [sys.executable, "-m", "octopus"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        process.terminate()
+        process.wait()
+
+
+async def _wait(client: AsyncClient) -> None:
+    async with asyncio.timeout(30):
+        while True:
+            try:
+                response = await client.get("/ping")
+                response.raise_for_status()
+            except HTTPError:
+                await asyncio.sleep(0.1)
+            else:
+                return
+
+
+async def _measure_requests(
+    client: AsyncClient, path: str, requests: int, concurrency: int
+) -> tuple[list[float], float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    samples: list[float] = []
+
+    async def _get() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.get(path)
+            response.raise_for_status()
+            samples.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_get() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    return samples, requests / elapsed
+
+
+async def _listen(
+    client: AsyncClient, ready: asyncio.Event, received: list[asyncio.Queue[float]]
+) -> None:
+    queue = asyncio.Queue[float]()
+    received.append(queue)
+
+    async with client.stream("GET", "/sse") as response:
+        ready.set()
+
+        async for line in response.aiter_lines():
+            if line.startswith("data:"):
+                queue.put_nowait(time.perf_counter())
+
+
+async def _measure_fanout(
+    client: AsyncClient, subscribers: int, events: int
+) -> list[float]:
+    received: list[asyncio.Queue[float]] = []
+    readiness = [asyncio.Event() for _ in range(subscribers)]
+    listeners = [
+        asyncio.create_task(_listen(client, ready, received)) for ready in readiness
+    ]
+    samples: list[float] = []
+
+    try:
+        await asyncio.gather(*(ready.wait() for ready in readiness))
+
+        for index in range(events):
+            parameters = json.dumps({"message": f"event {index % 1000}"})
+
+            start = time.perf_counter()
+            response = await client.get("/test", params={"parameters": parameters})
+            response.raise_for_status()
+
+            # Latency of an event is the time until the last subscriber got it
+            arrivals = await asyncio.gather(*(queue.get() for queue in received))
+            samples.append(max(arrivals) - start)
+    finally:
+        for listener in listeners:
+            listener.cancel()
+
+        await asyncio.gather(*listeners, return_exceptions=True)
+
+    return samples
+
+
+async def _run_profile(  # noqa: PLR0913
+    url: str,
+    variant: str,
+    requests: int,
+    concurrency: int,
+    subscribers: int,
+    events: int,
+) -> dict[str, Summary]:
+    summaries: dict[str, Summary] = {}
+    limits = Limits(max_connections=concurrency + subscribers)
+
+    async with AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+        await _wait(client)
+
+        for path in ("/ping", "/check"):
+            await _measure_requests(client, path, concurrency, concurrency)
+            samples, throughput = await _measure_requests(
+                client, path, requests, concurrency
+            )
+            summaries[f"{path} {variant} ({throughput:.0f} req/s)"] = Summary.of(
+                samples
+            )
+
+        samples = await _measure_fanout(client, subscribers, events)
+        summaries[f"/sse {variant} ({subscribers} subscribers)"] = Summary.of(samples)
+
+    return summaries
+
+
+@cli.command()
+def main(  # noqa: PLR0913
+    profiles: list[str] = typer.Option(  # noqa: B008
+        list(PROFILES), help="Runtime profiles to measure."
+    ),
+    requests: int = typer.Option(5000, help="Number of requests per endpoint."),
+    concurrency: int = typer.Option(50, help="Number of concurrent requests."),
+    subscribers: int = typer.Option(200, help="Number of SSE subscribers."),
+    events: int = typer.Option(100, help="Number of events to fan out."),
+    workers: int = typer.Option(1, help="Number of worker processes."),
+) -> None:
+    """Measure latency of the HTTP API and SSE fan-out under runtime profiles."""
+    console = Console()
+    summaries: dict[str, Summary] = {}
+
+    for profile in profiles:
+        with _serve(PROFILES[profile], find_free_port(), workers, subscribers) as url:
+            summaries |= asyncio.run(
+                _run_profile(url, profile, requests, concurrency, subscribers, events)
+            )
+
+    console.print(build_table("Server latency by runtime profile", summaries))
+
+
+if __name__ == "__main__":
+    cli()
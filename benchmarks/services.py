@@ -0,0 +1,121 @@
+import asyncio
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import cast
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.utils.stats import Summary, build_table
+from octopus.api.app import AppBuilder
+from octopus.api.lifespans import ServicesBuilder
+from octopus.api.routes.check.service import Service
+from octopus.cli import CliBuilder
+from octopus.config.models import Config
+from octopus.services.apis.beaver.service import BeaverInstancesService
+from octopus.state import State
+
+cli = CliBuilder().build()
+
+type Builder = Callable[[], object]
+
+
+def _build_per_request(builder: ServicesBuilder, state: State) -> Builder:
+    def _build() -> object:
+        # Previously beaver built its instances service on every access
+        instances = BeaverInstancesService(state.beaver.client, state.beaver.cache)
+        return Service(streaming=builder.build().streaming), instances
+
+    return _build
+
+
+def _build_from_container(state: State) -> Builder:
+    def _build() -> object:
+        return Service(streaming=state.services.streaming), state.beaver.instances
+
+    return _build
+
+
+def _measure_latency(build: Builder, requests: int) -> list[float]:
+    samples: list[float] = []
+
+    for _ in range(requests):
+        start = time.perf_counter()
+        build()
+        samples.append(time.perf_counter() - start)
+
+    return samples
+
+
+def _measure_memory(build: Builder, requests: int) -> float:
+    tracemalloc.start()
+
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+
+        # Keep the results alive, so that all their allocations are counted
+        results = [build() for _ in range(requests)]
+
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del results
+    return (after - before) / requests
+
+
+def _build_memory_table(memory: dict[str, float]) -> Table:
+    table = Table(title="Memory allocated per request")
+
+    table.add_column("Variant")
+    table.add_column("Allocated [B]", justify="right")
+
+    for variant, allocated in memory.items():
+        table.add_row(variant, f"{allocated:.0f}")
+
+    return table
+
+
+async def _run(
+    config: Config, requests: int
+) -> tuple[dict[str, Summary], dict[str, float]]:
+    app = AppBuilder(config).build()
+    state = cast("State", app.state)
+
+    latency: dict[str, Summary] = {}
+    memory: dict[str, float] = {}
+
+    # Services are wired by the same lifespans that the server runs
+    async with app.lifespan():
+        variants = (
+            (
+                "per-request construction",
+                _build_per_request(ServicesBuilder(app), state),
+            ),
+            ("shared container", _build_from_container(state)),
+        )
+
+        for variant, build in variants:
+            latency[variant] = Summary.of(_measure_latency(build, requests))
+            memory[variant] = _measure_memory(build, requests)
+
+    return latency, memory
+
+
+@cli.command()
+def main(
+    requests: int = typer.Option(100000, help="Number of requests per variant."),
+) -> None:
+    """Measure the cost of building services for each request to /check."""
+    console = Console()
+
+    latency, memory = asyncio.run(_run(Config(), requests))
+
+    console.print(build_table("Service construction latency per request", latency))
+    console.print(_build_memory_table(memory))
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,174 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Sequence
+
+import typer
+from litestar.channels import ChannelsPlugin, Subscriber
+from litestar.response import ServerSentEventMessage
+from rich.console import Console
+
+from benchmarks.utils.stats import Summary, build_table
+from octopus.cli import CliBuilder
+from octopus.config.models import EventsConnectionsConfig, EventsReplayConfig
+from octopus.models.base import Serializable
+from octopus.models.events import test as ev
+from octopus.models.events.enums import EventType
+from octopus.models.events.types import Event
+from octopus.services.events import models as evm
+from octopus.services.events.backends import MemoryEventsBackend
+from octopus.services.events.channels import EventChannels
+from octopus.services.events.history import EventsHistory
+from octopus.services.events.registry import ConnectionsRegistry
+from octopus.services.events.service import EventsService
+
+cli = CliBuilder().build()
+
+_history = EventsHistory(config=EventsReplayConfig())
+_connections = ConnectionsRegistry(config=EventsConnectionsConfig())
+
+type Publisher = Callable[[ChannelsPlugin, Event], Awaitable[None]]
+type Processor = Callable[[bytes], bytes | None]
+
+
+async def _publish_json(channels: ChannelsPlugin, event: Event) -> None:
+    channels.publish(event.model_dump_json(round_trip=True), "events")
+
+
+async def _publish_frame(channels: ChannelsPlugin, event: Event) -> None:
+    events = EventsService(
+        channels=channels, history=_history, connections=_connections
+    )
+    await events.publish(evm.PublishRequest(event=event))
+
+
+def _build_reencoding_processor(types: set[EventType]) -> Processor:
+    def _process(data: bytes) -> bytes | None:
+        event = Serializable[Event].model_validate_json(data).root
+
+        if event.type not in types:
+            return None
+
+        return ServerSentEventMessage(
+            data=event.model_dump_json(round_trip=True)
+        ).encode()
+
+    return _process
+
+
+def _build_forwarding_processor(types: set[EventType]) -> Processor:
+    # Subscribers receive only frames from channels of the requested types
+    del types
+
+    def _process(frame: bytes) -> bytes | None:
+        return frame
+
+    return _process
+
+
+class _Fanout:
+    """Tracks delivery of a single event to all subscribers."""
+
+    def __init__(self, subscribers: int) -> None:
+        self._remaining = subscribers
+        self._delivered = asyncio.Event()
+
+    def deliver(self) -> None:
+        self._remaining -= 1
+        if self._remaining == 0:
+            self._delivered.set()
+
+    async def wait(self) -> None:
+        await self._delivered.wait()
+
+
+async def _consume(
+    subscriber: Subscriber, process: Processor, fanouts: Sequence[_Fanout]
+) -> None:
+    events = subscriber.iter_events()
+
+    for fanout in fanouts:
+        data = await anext(events)
+        process(data)
+        fanout.deliver()
+
+
+async def _measure(
+    publish: Publisher,
+    process: Processor,
+    subscriptions: Sequence[str],
+    subscribers: int,
+    events: int,
+) -> list[float]:
+    fanouts = [_Fanout(subscribers) for _ in range(events)]
+    samples: list[float] = []
+
+    async with ChannelsPlugin(
+        backend=MemoryEventsBackend(history=_history),
+        channels=["events", *EventChannels().all()],
+    ) as channels:
+        consumers = [
+            asyncio.create_task(
+                _consume(await channels.subscribe(subscriptions), process, fanouts)
+            )
+            for _ in range(subscribers)
+        ]
+
+        for index, fanout in enumerate(fanouts):
+            event = ev.TestEvent(data=ev.TestEventData(message=f"event {index}"))
+
+            start = time.perf_counter()
+            await publish(channels, event)
+            await fanout.wait()
+            samples.append(time.perf_counter() - start)
+
+        await asyncio.gather(*consumers)
+
+    return samples
+
+
+async def _run(counts: Sequence[int], events: int) -> dict[str, Summary]:
+    summaries: dict[str, Summary] = {}
+    types = {EventType.TEST}
+
+    variants = (
+        (
+            "decode and encode per subscriber",
+            _publish_json,
+            _build_reencoding_processor,
+            ["events"],
+        ),
+        (
+            "encode once",
+            _publish_frame,
+            _build_forwarding_processor,
+            EventChannels().of(types),
+        ),
+    )
+
+    for subscribers in counts:
+        for variant, publish, build_processor, subscriptions in variants:
+            samples = await _measure(
+                publish, build_processor(types), subscriptions, subscribers, events
+            )
+            summaries[f"{variant} ({subscribers} subscribers)"] = Summary.of(samples)
+
+    return summaries
+
+
+@cli.command()
+def main(
+    subscribers: list[int] = typer.Option(  # noqa: B008
+        [1000, 10000], help="Numbers of subscribers to measure."
+    ),
+    events: int = typer.Option(100, help="Number of events per variant."),
+) -> None:
+    """Measure latency of fanning out events to subscribers of the SSE stream."""
+    console = Console()
+
+    summaries = asyncio.run(_run(subscribers, events))
+
+    console.print(build_table("Event fan-out latency", summaries))
+
+
+if __name__ == "__main__":
+    cli()
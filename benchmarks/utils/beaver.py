@@ -0,0 +1,55 @@
+import asyncio
+from datetime import timedelta
+from uuid import UUID, uuid4
+
+from litestar import Litestar, get
+from litestar.exceptions import NotFoundException
+
+from octopus.utils.time import isoparse, isostringify
+
+
+class StandInBeaver:
+    """Minimal stand-in for the beaver service serving a single instance.
+
+    Args:
+        delay: Artificial processing time of each request.
+
+    """
+
+    def __init__(self, delay: timedelta = timedelta()) -> None:
+        self.delay = delay
+        self.event = uuid4()
+        self.show = uuid4()
+        self.start = isoparse("2000-01-01T00:00:00")
+        self.requests = 0
+
+    def _build_instance(self) -> dict:
+        return {
+            "start": isostringify(self.start),
+            "duration": "PT1H",
+            "eventId": str(self.event),
+            "event": {
+                "id": str(self.event),
+                "type": "live",
+                "showId": str(self.show),
+                "timezone": "UTC",
+                "show": {"id": str(self.show), "title": "Benchmark"},
+            },
+        }
+
+    def build(self) -> Litestar:
+        """Build the app."""
+
+        @get("/instances/{event_id:uuid}/{start:str}")
+        async def get_instance(event_id: UUID, start: str) -> dict:
+            self.requests += 1
+
+            if self.delay:
+                await asyncio.sleep(self.delay.total_seconds())
+
+            if event_id != self.event or isoparse(start) != self.start:
+                raise NotFoundException
+
+            return self._build_instance()
+
+        return Litestar(route_handlers=[get_instance])
@@ -0,0 +1,64 @@
+import socket
+import threading
+import time
+from types import TracebackType
+from typing import Self
+
+import uvicorn
+from litestar import Litestar
+
+
+def find_free_port(host: str = "127.0.0.1") -> int:
+    """Find a free TCP port on the given host."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+class BackgroundServer:
+    """Runs an app with uvicorn in a background thread.
+
+    Args:
+        app: The application.
+        host: Host to run the server on.
+        port: Port to run the server on. If not given, a free port is used.
+
+    """
+
+    def __init__(
+        self, app: Litestar, host: str = "127.0.0.1", port: int | None = None
+    ) -> None:
+        self.host = host
+        self.port = port or find_free_port(host)
+        self._server = uvicorn.Server(
+            uvicorn.Config(app, host=self.host, port=self.port, log_level="warning")
+        )
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """URL of the server."""
+        return f"http://{self.host}:{self.port}"
+
+    def __enter__(self) -> Self:
+        """Start the server and wait until it accepts connections."""
+        self._thread.start()
+
+        while not self._server.started:
+            if not self._thread.is_alive():
+                msg = "Server failed to start."
+                raise RuntimeError(msg)
+
+            time.sleep(0.01)
+
+        return self
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop the server."""
+        self._server.should_exit = True
+        self._thread.join()
@@ -0,0 +1,74 @@
+import statistics
+from collections.abc import Sequence
+from typing import Self
+
+from rich.table import Table
+
+from octopus.models.base import datamodel
+
+
+@datamodel
+class Summary:
+    """Summary of latency samples in milliseconds."""
+
+    count: int
+    """Number of samples."""
+
+    mean: float
+    """Mean latency."""
+
+    p50: float
+    """Median latency."""
+
+    p90: float
+    """90th percentile of latency."""
+
+    p99: float
+    """99th percentile of latency."""
+
+    max: float
+    """Maximum latency."""
+
+    @classmethod
+    def of(cls, samples: Sequence[float]) -> Self:
+        """Summarize samples given in seconds."""
+        milliseconds = [sample * 1000 for sample in samples]
+        percentiles = statistics.quantiles(milliseconds, n=100, method="inclusive")
+
+        return cls(
+            count=len(milliseconds),
+            mean=statistics.fmean(milliseconds),
+            p50=percentiles[49],
+            p90=percentiles[89],
+            p99=percentiles[98],
+            max=max(milliseconds),
+        )
+
+
+def build_table(title: str, summaries: dict[str, Summary]) -> Table:
+    """Build a table comparing summaries of different variants."""
+    table = Table(title=title)
+
+    table.add_column("Variant")
+    for column in (
+        "Count",
+        "Mean [ms]",
+        "P50 [ms]",
+        "P90 [ms]",
+        "P99 [ms]",
+        "Max [ms]",
+    ):
+        table.add_column(column, justify="right")
+
+    for variant, summary in summaries.items():
+        table.add_row(
+            variant,
+            str(summary.count),
+            f"{summary.mean:.3f}",
+            f"{summary.p50:.3f}",
+            f"{summary.p90:.3f}",
+            f"{summary.p99:.3f}",
+            f"{summary.max:.3f}",
+        )
+
+    return table
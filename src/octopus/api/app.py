@@ -1,22 +1,41 @@
 from collections.abc import Callable, Sequence
 from contextlib import AbstractAsyncContextManager
+from functools import partial
 
 from litestar import Litestar
 from litestar.channels import ChannelsPlugin
-from litestar.channels.backends.memory import MemoryChannelsBackend
+from litestar.channels.backends.base import ChannelsBackend
 from litestar.openapi import OpenAPIConfig
 from litestar.plugins import PluginProtocol
-from pylocks.asyncio import AsyncioLock
-from pystores.memory import MemoryStore
+from pydantic import TypeAdapter
 
-from octopus.api.lifespans import SuppressHTTPXLoggingLifespan, TestLifespan
+from octopus.api.lifespans import (
+    BackgroundTaskLifespan,
+    BeaverLifespan,
+    ReservationsLifespan,
+    ServicesLifespan,
+    SuppressHTTPXLoggingLifespan,
+    TestLifespan,
+)
 from octopus.api.openapi import OpenAPIConfigBuilder
 from octopus.api.plugins.pydantic import PydanticPlugin
 from octopus.api.routes.router import router
 from octopus.config.models import Config
 from octopus.services.apis.beaver.service import BeaverService
-from octopus.services.streaming.models import Instance
+from octopus.services.events.backends import HubEventsBackend, MemoryEventsBackend
+from octopus.services.events.channels import EventChannels
+from octopus.services.events.history import EventsHistory
+from octopus.services.events.registry import ConnectionsRegistry
+from octopus.services.events.subscriber import EventsSubscriber
+from octopus.services.mirror.service import MirrorService
+from octopus.services.recordings.service import RecordingsService
+from octopus.services.resolver.service import ResolverService
+from octopus.services.streaming.models import Reservations
+from octopus.services.streaming.view import AvailabilityView
 from octopus.state import State
+from octopus.stores.base import VersionedStore
+from octopus.stores.memory import MemoryVersionedStore
+from octopus.stores.remote import RemoteVersionedStore
 
 
 class AppBuilder:
@@ -36,34 +55,92 @@ class AppBuilder:
         return [
             TestLifespan,
             SuppressHTTPXLoggingLifespan,
+            BeaverLifespan,
+            # Keep the schedule mirror up to date
+            partial(BackgroundTaskLifespan, run=lambda state: state.mirror.run()),
+            # Keep resolved hosts up to date
+            partial(BackgroundTaskLifespan, run=lambda state: state.resolver.run()),
+            # Upload finished recordings
+            partial(BackgroundTaskLifespan, run=lambda state: state.recordings.run()),
+            ReservationsLifespan,
+            ServicesLifespan,
         ]
 
     def _build_openapi_config(self) -> OpenAPIConfig:
         return OpenAPIConfigBuilder().build()
 
-    def _build_plugins(self) -> Sequence[PluginProtocol]:
+    def _build_channels_backend(self, history: EventsHistory) -> ChannelsBackend:
+        workers = self._config.server.workers
+
+        if workers.count > 1:
+            return HubEventsBackend(path=workers.hub, history=history)
+
+        return MemoryEventsBackend(history=history)
+
+    def _build_plugins(self, history: EventsHistory) -> Sequence[PluginProtocol]:
         return [
-            ChannelsPlugin(backend=MemoryChannelsBackend(), channels=["events"]),
+            ChannelsPlugin(
+                backend=self._build_channels_backend(history),
+                channels=EventChannels().all(),
+                subscriber_class=EventsSubscriber.configured(
+                    self._config.events.backlog
+                ),
+            ),
             PydanticPlugin(),
         ]
 
-    def _build_initial_state(self) -> State:
+    def _build_reservations_store(self) -> VersionedStore[Reservations]:
+        default: Reservations = (None,) * self._config.streaming.slots
+
+        adapter = TypeAdapter[Reservations](Reservations)
+        workers = self._config.server.workers
+
+        match self._config.store.backend:
+            case "memory" if workers.count > 1:
+                # Workers share the store kept in memory of the main process
+                return RemoteVersionedStore(
+                    config=self._config.store.http.model_copy(
+                        update={"socket": workers.store}
+                    ),
+                    adapter=adapter,
+                    default=default,
+                )
+            case "memory":
+                return MemoryVersionedStore(default)
+            case "remote":
+                return RemoteVersionedStore(
+                    config=self._config.store.http, adapter=adapter, default=default
+                )
+
+    def _build_initial_state(self, history: EventsHistory) -> State:
+        beaver = BeaverService(config=self._config.beaver)
+
         return State(
             {
+                "availability": AvailabilityView(),
                 "config": self._config,
-                "beaver": BeaverService(config=self._config.beaver),
-                "lock": AsyncioLock(),
-                "store": MemoryStore[Instance | None](None),
+                "beaver": beaver,
+                "connections": ConnectionsRegistry(
+                    config=self._config.events.connections,
+                    workers=self._config.server.workers.count,
+                ),
+                "history": history,
+                "mirror": MirrorService(config=self._config.mirror, beaver=beaver),
+                "recordings": RecordingsService(config=self._config),
+                "reservations": self._build_reservations_store(),
+                "resolver": ResolverService(config=self._config.resolver),
             }
         )
 
     def build(self) -> Litestar:
         """Build the app."""
+        history = EventsHistory(config=self._config.events.replay)
+
         return Litestar(
             route_handlers=[router],
             debug=self._config.debug,
             lifespan=self._build_lifespan(),
             openapi_config=self._build_openapi_config(),
-            plugins=self._build_plugins(),
-            state=self._build_initial_state(),
+            plugins=self._build_plugins(history),
+            state=self._build_initial_state(history),
         )
@@ -17,6 +17,8 @@ class ConflictException(le.ClientException):
     detail = "Conflict"
 
 
+TooManyRequestsException = le.TooManyRequestsException
+
 InternalServerErrorException = le.InternalServerException
 
 ServiceUnavailableException = le.ServiceUnavailableException
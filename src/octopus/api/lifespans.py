@@ -1,10 +1,20 @@
+import asyncio
 import logging
-from contextlib import AbstractAsyncContextManager
+from collections.abc import Callable, Coroutine
+from contextlib import AbstractAsyncContextManager, suppress
 from types import TracebackType
-from typing import cast, override
+from typing import Any, cast, override
 
 from litestar import Litestar
+from litestar.channels import ChannelsPlugin
 
+from octopus.services.container import Services
+from octopus.services.events.service import EventsService
+from octopus.services.latency.service import LatencyService
+from octopus.services.ping.service import PingService
+from octopus.services.stats.service import StatsService
+from octopus.services.streaming.service import StreamingService
+from octopus.services.test.service import TestService
 from octopus.state import State
 
 
@@ -58,3 +68,137 @@ class SuppressHTTPXLoggingLifespan(Lifespan):
         traceback: TracebackType | None,
     ) -> None:
         self.logger.disabled = self.previously_disabled
+
+
+class BeaverLifespan(Lifespan):
+    """Lifespan that manages connections to the beaver service."""
+
+    @override
+    async def __aenter__(self) -> None:
+        await self.state.beaver.open()
+
+    @override
+    async def __aexit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.state.beaver.close()
+
+
+class BackgroundTaskLifespan(Lifespan):
+    """Lifespan that runs a task in the background while the app is running.
+
+    Args:
+        app: The app.
+        run: Function that starts the task for the app state.
+
+    """
+
+    def __init__(
+        self, app: Litestar, run: Callable[[State], Coroutine[Any, Any, None]]
+    ) -> None:
+        super().__init__(app)
+        self._run = run
+
+    @override
+    async def __aenter__(self) -> None:
+        self.task = asyncio.create_task(self._run(self.state))
+
+    @override
+    async def __aexit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await self.task
+
+
+class ReservationsLifespan(Lifespan):
+    """Lifespan that manages connections to the store of reservations."""
+
+    @override
+    async def __aenter__(self) -> None:
+        await self.state.reservations.open()
+
+    @override
+    async def __aexit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.state.reservations.close()
+
+
+class ServicesBuilder:
+    """Builder for the services shared by all requests."""
+
+    def __init__(self, app: Litestar) -> None:
+        self._app = app
+
+    @property
+    def _state(self) -> State:
+        return cast("State", self._app.state)
+
+    def _build_events(self) -> EventsService:
+        return EventsService(
+            channels=self._app.plugins.get(ChannelsPlugin),
+            history=self._state.history,
+            connections=self._state.connections,
+        )
+
+    def _build_streaming(
+        self, events: EventsService, stats: StatsService, latency: LatencyService
+    ) -> StreamingService:
+        return StreamingService(
+            config=self._state.config,
+            reservations=self._state.reservations,
+            beaver=self._state.beaver,
+            mirror=self._state.mirror,
+            events=events,
+            view=self._state.availability,
+            resolver=self._state.resolver,
+            stats=stats,
+            latency=latency,
+            recordings=self._state.recordings,
+        )
+
+    def build(self) -> Services:
+        """Build the services."""
+        events = self._build_events()
+        stats = StatsService(config=self._state.config.stats)
+        latency = LatencyService(config=self._state.config)
+
+        return Services(
+            events=events,
+            latency=latency,
+            ping=PingService(),
+            stats=stats,
+            streaming=self._build_streaming(events, stats, latency),
+            test=TestService(events=events),
+        )
+
+
+class ServicesLifespan(Lifespan):
+    """Lifespan that builds services shared by all requests."""
+
+    @override
+    async def __aenter__(self) -> None:
+        self.state.services = ServicesBuilder(self.app).build()
+        await self.state.services.streaming.open()
+
+    @override
+    async def __aexit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        # Streams need the store and the uploader, which are torn down after this
+        await self.state.services.streaming.close()
@@ -1,31 +1,27 @@
 from collections.abc import Mapping
+from datetime import timedelta
+from typing import Annotated
 
 from litestar import Controller as BaseController
 from litestar import handlers
-from litestar.channels import ChannelsPlugin
 from litestar.di import Provide
+from litestar.enums import MediaType
+from litestar.openapi.datastructures import ResponseSpec
+from litestar.params import Parameter
 from litestar.response import Response
+from litestar.status_codes import HTTP_200_OK, HTTP_304_NOT_MODIFIED
 
 from octopus.api.routes.check import models as m
 from octopus.api.routes.check.service import Service
 from octopus.models.base import Serializable
-from octopus.services.streaming.service import StreamingService
 from octopus.state import State
 
 
 class DependenciesBuilder:
     """Builder for the dependencies of the controller."""
 
-    async def _build_service(self, channels: ChannelsPlugin, state: State) -> Service:
-        return Service(
-            streaming=StreamingService(
-                config=state.config,
-                store=state.store,
-                lock=state.lock,
-                beaver=state.beaver,
-                channels=channels,
-            ),
-        )
+    async def _build_service(self, state: State) -> Service:
+        return Service(streaming=state.services.streaming)
 
     def build(self) -> Mapping[str, Provide]:
         """Build the dependencies."""
@@ -39,15 +35,61 @@ class Controller(BaseController):
 
     dependencies = DependenciesBuilder().build()
 
+    def _parse_version(self, etag: str | None) -> m.CheckRequestVersion:
+        if etag is None:
+            return None
+
+        tag = etag.split(",")[0].strip().removeprefix("W/").strip('"')
+        return int(tag) if tag.isdigit() else None
+
+    def _build_etag(self, version: int) -> str:
+        return f'"{version}"'
+
     @handlers.get(
         summary="Check availability",
+        responses={
+            HTTP_200_OK: ResponseSpec(
+                data_container=Serializable[m.CheckResponseAvailability],
+                description="Request fulfilled, document follows",
+            ),
+            HTTP_304_NOT_MODIFIED: ResponseSpec(
+                data_container=None,
+                description="Availability did not change",
+            ),
+        },
     )
     async def check(
-        self, service: Service
-    ) -> Response[Serializable[m.CheckResponseAvailability]]:
-        """Check the availability of the stream."""
-        request = m.CheckRequest()
+        self,
+        service: Service,
+        if_none_match: Annotated[
+            str | None,
+            Parameter(
+                header="If-None-Match",
+                description="Entity tag of the availability already known to the client.",
+            ),
+        ] = None,
+        wait: Annotated[
+            float | None,
+            Parameter(
+                description="Maximum number of seconds to wait for the availability to change.",
+                ge=0,
+                le=60,
+            ),
+        ] = None,
+    ) -> Response[bytes]:
+        """Check the availability of streams."""
+        request = m.CheckRequest(
+            version=self._parse_version(if_none_match),
+            wait=timedelta(seconds=wait) if wait is not None else None,
+        )
 
         response = await service.check(request)
 
-        return Response(Serializable(response.availability))
+        headers = {"ETag": self._build_etag(response.version)}
+
+        if response.version == request.version:
+            return Response(b"", status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+
+        return Response(
+            response.availability, media_type=MediaType.JSON, headers=headers
+        )
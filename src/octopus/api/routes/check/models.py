@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+from datetime import timedelta
 from typing import Self
 from uuid import UUID
 
@@ -21,11 +23,35 @@ class Instance(SerializableModel):
         return cls(event=instance.event, start=instance.start)
 
 
-class Availability(SerializableModel):
-    """Availability of a stream."""
+class SlotAvailability(SerializableModel):
+    """Availability of a slot."""
+
+    id: int
+    """Identifier of the slot."""
+
+    port: int
+    """Port to listen for SRT connections on."""
 
     instance: Instance | None
-    """Instance that is currently being streamed."""
+    """Instance that is currently being streamed in the slot."""
+
+    @classmethod
+    def map(cls, availability: sm.SlotAvailability) -> Self:
+        """Map from internal representation."""
+        return cls(
+            id=availability.slot.id,
+            port=availability.slot.port,
+            instance=Instance.map(availability.instance)
+            if availability.instance
+            else None,
+        )
+
+
+class Availability(SerializableModel):
+    """Availability of streams."""
+
+    slots: Sequence[SlotAvailability]
+    """Availability of each slot."""
 
     checked_at: UTCDatetime
     """Datetime in UTC at which the availability was checked."""
@@ -34,9 +60,7 @@ class Availability(SerializableModel):
     def map(cls, availability: sm.Availability) -> Self:
         """Map from internal representation."""
         return cls(
-            instance=Instance.map(availability.instance)
-            if availability.instance
-            else None,
+            slots=[SlotAvailability.map(slot) for slot in availability.slots],
             checked_at=availability.checked_at,
         )
 
@@ -44,14 +68,28 @@ class Availability(SerializableModel):
 type CheckResponseAvailability = Availability
 
 
+type CheckRequestVersion = int | None
+
+type CheckRequestWait = timedelta | None
+
+
 @datamodel
 class CheckRequest:
-    """Request to check the availability of a stream."""
+    """Request to check the availability of streams."""
+
+    version: CheckRequestVersion
+    """Version of the availability already known to the client."""
+
+    wait: CheckRequestWait
+    """Maximum time to wait for the availability to change."""
 
 
 @datamodel
 class CheckResponse:
-    """Response for checking the availability of a stream."""
+    """Response for checking the availability of streams."""
+
+    version: int
+    """Version of the availability."""
 
-    availability: CheckResponseAvailability
-    """Availability of the stream."""
+    availability: bytes
+    """Availability of streams encoded as JSON."""
@@ -1,16 +1,22 @@
 from collections.abc import Generator
 from contextlib import contextmanager
+from datetime import datetime
+
+from pydantic import TypeAdapter
 
 from octopus.api.routes.check import errors as e
 from octopus.api.routes.check import models as m
 from octopus.services.streaming import errors as se
 from octopus.services.streaming import models as sm
 from octopus.services.streaming.service import StreamingService
+from octopus.utils.time import UTCDatetime, awareutcnow
 
 
 class Service:
     """Service for the check endpoint."""
 
+    _checked_at = TypeAdapter[datetime](UTCDatetime)
+
     def __init__(self, streaming: StreamingService) -> None:
         self._streaming = streaming
 
@@ -21,13 +27,24 @@ class Service:
         except se.ServiceError as ex:
             raise e.ServiceError from ex
 
+    def _encode(self, slots: bytes, checked_at: datetime) -> bytes:
+        # Slots are encoded in advance, only the time of the check is new
+        return (
+            b'{"slots":'
+            + slots
+            + b',"checkedAt":'
+            + self._checked_at.dump_json(checked_at)
+            + b"}"
+        )
+
     async def check(self, request: m.CheckRequest) -> m.CheckResponse:
-        """Check the availability of the stream."""
-        check_request = sm.CheckRequest()
+        """Check the availability of streams."""
+        check_request = sm.CheckRequest(version=request.version, wait=request.wait)
 
         with self._handle_errors():
             check_response = await self._streaming.check(check_request)
 
         return m.CheckResponse(
-            availability=m.Availability.map(check_response.availability)
+            version=check_response.snapshot.version,
+            availability=self._encode(check_response.snapshot.slots, awareutcnow()),
         )
@@ -0,0 +1,43 @@
+from collections.abc import Mapping
+
+from litestar import Controller as BaseController
+from litestar import handlers
+from litestar.di import Provide
+from litestar.response import Response
+
+from octopus.api.routes.metrics import models as m
+from octopus.api.routes.metrics.service import Service
+from octopus.state import State
+
+
+class DependenciesBuilder:
+    """Builder for the dependencies of the controller."""
+
+    async def _build_service(self, state: State) -> Service:
+        return Service(
+            stats=state.services.stats, beaver=state.beaver, resolver=state.resolver
+        )
+
+    def build(self) -> Mapping[str, Provide]:
+        """Build the dependencies."""
+        return {
+            "service": Provide(self._build_service),
+        }
+
+
+class Controller(BaseController):
+    """Controller for the metrics endpoint."""
+
+    dependencies = DependenciesBuilder().build()
+
+    @handlers.get(
+        summary="Get metrics",
+        media_type="text/plain; version=0.0.4",
+    )
+    async def metrics(self, service: Service) -> Response[str]:
+        """Get metrics of streams in the Prometheus text format."""
+        request = m.MetricsRequest()
+
+        response = await service.metrics(request)
+
+        return Response(response.metrics)
@@ -0,0 +1,14 @@
+from octopus.models.base import datamodel
+
+
+@datamodel
+class MetricsRequest:
+    """Request to get metrics."""
+
+
+@datamodel
+class MetricsResponse:
+    """Response for getting metrics."""
+
+    metrics: str
+    """Metrics in the Prometheus text format."""
@@ -0,0 +1,227 @@
+from collections.abc import Callable, Generator, Iterable, Sequence
+from contextlib import contextmanager
+
+from octopus.api.routes.metrics import errors as e
+from octopus.api.routes.metrics import models as m
+from octopus.services.apis.beaver.cache import CacheStats
+from octopus.services.apis.beaver.service import BeaverService
+from octopus.services.resolver import models as rvm
+from octopus.services.resolver.service import ResolverService
+from octopus.services.stats import errors as ste
+from octopus.services.stats import models as stm
+from octopus.services.stats.service import StatsService
+
+type Getter = Callable[[stm.Sample], float | None]
+
+type CacheGetter = Callable[[CacheStats], float]
+
+type ResolverGetter = Callable[[rvm.StatsResponse], float]
+
+
+def _get_duration(sample: stm.Sample) -> float | None:
+    return None if sample.duration is None else sample.duration.total_seconds()
+
+
+STREAM_METRICS: Sequence[tuple[str, str, Getter]] = (
+    (
+        "octopus_stream_bitrate_kilobits_per_second",
+        "Bitrate of the outgoing stream.",
+        lambda sample: sample.bitrate,
+    ),
+    (
+        "octopus_stream_size_bytes",
+        "Total size of the outgoing stream.",
+        lambda sample: sample.size,
+    ),
+    (
+        "octopus_stream_duration_seconds",
+        "Duration of the audio that was streamed so far.",
+        _get_duration,
+    ),
+    (
+        "octopus_stream_speed_ratio",
+        "Processing speed of the stream relative to real time.",
+        lambda sample: sample.speed,
+    ),
+)
+
+CACHE_METRICS: Sequence[tuple[str, str, str, CacheGetter]] = (
+    (
+        "octopus_beaver_cache_hits_total",
+        "counter",
+        "Number of instance lookups answered from the cache.",
+        lambda stats: stats.hits,
+    ),
+    (
+        "octopus_beaver_cache_misses_total",
+        "counter",
+        "Number of instance lookups that required a request to beaver.",
+        lambda stats: stats.misses,
+    ),
+    (
+        "octopus_beaver_cache_coalesced_total",
+        "counter",
+        "Number of instance lookups that joined a request already in flight.",
+        lambda stats: stats.coalesced,
+    ),
+    (
+        "octopus_beaver_cache_evictions_total",
+        "counter",
+        "Number of cached instances removed because the cache was full or they expired.",
+        lambda stats: stats.evictions,
+    ),
+    (
+        "octopus_beaver_cache_entries",
+        "gauge",
+        "Number of instances currently in the cache.",
+        lambda stats: stats.size,
+    ),
+)
+
+
+RESOLVER_METRICS: Sequence[tuple[str, str, str, ResolverGetter]] = (
+    (
+        "octopus_resolver_hits_total",
+        "counter",
+        "Number of resolutions of hosts served from the cache.",
+        lambda stats: stats.hits,
+    ),
+    (
+        "octopus_resolver_misses_total",
+        "counter",
+        "Number of resolutions of hosts that had to wait for a lookup.",
+        lambda stats: stats.misses,
+    ),
+    (
+        "octopus_resolver_lookups_total",
+        "counter",
+        "Number of lookups made, including background refreshes.",
+        lambda stats: stats.lookups,
+    ),
+    (
+        "octopus_resolver_failures_total",
+        "counter",
+        "Number of lookups that failed.",
+        lambda stats: stats.failures,
+    ),
+    (
+        "octopus_resolver_stale_total",
+        "counter",
+        "Number of failed lookups that fell back to a previously resolved address.",
+        lambda stats: stats.stale,
+    ),
+    (
+        "octopus_resolver_lookup_latency_seconds",
+        "gauge",
+        "Mean time taken by lookups.",
+        lambda stats: stats.latency.total_seconds(),
+    ),
+    (
+        "octopus_resolver_lookup_peak_seconds",
+        "gauge",
+        "Maximum time taken by a lookup.",
+        lambda stats: stats.peak.total_seconds(),
+    ),
+)
+
+
+class Service:
+    """Service for the metrics endpoint."""
+
+    def __init__(
+        self, stats: StatsService, beaver: BeaverService, resolver: ResolverService
+    ) -> None:
+        self._stats = stats
+        self._beaver = beaver
+        self._resolver = resolver
+
+    @contextmanager
+    def _handle_errors(self) -> Generator[None]:
+        try:
+            yield
+        except ste.ServiceError as ex:
+            raise e.ServiceError from ex
+
+    def _build_labels(self, stream: stm.StreamStats) -> str:
+        labels = {
+            "slot": str(stream.slot),
+            "event": str(stream.instance.event),
+            "start": stream.instance.start.isoformat(),
+        }
+
+        return ",".join(f'{key}="{value}"' for key, value in labels.items())
+
+    def _render_metric(
+        self,
+        name: str,
+        kind: str,
+        description: str,
+        values: Iterable[tuple[str | None, float]],
+    ) -> Sequence[str]:
+        lines = [f"# HELP {name} {description}", f"# TYPE {name} {kind}"]
+
+        for labels, value in values:
+            lines.append(f"{name}{{{labels}}} {value}" if labels else f"{name} {value}")
+
+        return lines
+
+    def _collect_streams(
+        self, streams: Sequence[stm.StreamStats], get: Getter
+    ) -> Sequence[tuple[str | None, float]]:
+        values: list[tuple[str | None, float]] = []
+
+        for stream in streams:
+            # Only the latest sample is exposed, scrapers keep their own history
+            if not stream.samples:
+                continue
+
+            value = get(stream.samples[-1])
+            if value is not None:
+                values.append((self._build_labels(stream), value))
+
+        return values
+
+    def _render_streams(self, streams: Sequence[stm.StreamStats]) -> Sequence[str]:
+        return [
+            line
+            for name, description, get in STREAM_METRICS
+            for line in self._render_metric(
+                name, "gauge", description, self._collect_streams(streams, get)
+            )
+        ]
+
+    def _render_cache(self, stats: CacheStats) -> Sequence[str]:
+        return [
+            line
+            for name, kind, description, get in CACHE_METRICS
+            for line in self._render_metric(
+                name, kind, description, [(None, get(stats))]
+            )
+        ]
+
+    def _render_resolver(self, stats: rvm.StatsResponse) -> Sequence[str]:
+        return [
+            line
+            for name, kind, description, get in RESOLVER_METRICS
+            for line in self._render_metric(
+                name, kind, description, [(None, get(stats))]
+            )
+        ]
+
+    async def metrics(self, request: m.MetricsRequest) -> m.MetricsResponse:
+        """Get metrics."""
+        get_request = stm.GetRequest()
+
+        with self._handle_errors():
+            get_response = await self._stats.get(get_request)
+
+        resolver_stats_request = rvm.StatsRequest()
+        resolver_stats_response = await self._resolver.stats(resolver_stats_request)
+
+        lines = [
+            *self._render_streams(get_response.streams),
+            *self._render_cache(self._beaver.instances.cache.stats),
+            *self._render_resolver(resolver_stats_response),
+        ]
+
+        return m.MetricsResponse(metrics="\n".join(lines) + "\n")
@@ -8,14 +8,14 @@ from litestar.status_codes import HTTP_204_NO_CONTENT
 
 from octopus.api.routes.ping import models as m
 from octopus.api.routes.ping.service import Service
-from octopus.services.ping.service import PingService
+from octopus.state import State
 
 
 class DependenciesBuilder:
     """Builder for the dependencies of the controller."""
 
-    async def _build_service(self) -> Service:
-        return Service(ping=PingService())
+    async def _build_service(self, state: State) -> Service:
+        return Service(ping=state.services.ping)
 
     def build(self) -> Mapping[str, Provide]:
         """Build the dependencies."""
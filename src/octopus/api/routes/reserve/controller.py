@@ -3,7 +3,6 @@ from typing import Annotated
 
 from litestar import Controller as BaseController
 from litestar import handlers
-from litestar.channels import ChannelsPlugin
 from litestar.di import Provide
 from litestar.params import Body
 from litestar.response import Response
@@ -13,23 +12,14 @@ from octopus.api.routes.reserve import errors as e
 from octopus.api.routes.reserve import models as m
 from octopus.api.routes.reserve.service import Service
 from octopus.models.base import Serializable
-from octopus.services.streaming.service import StreamingService
 from octopus.state import State
 
 
 class DependenciesBuilder:
     """Builder for the dependencies of the controller."""
 
-    async def _build_service(self, channels: ChannelsPlugin, state: State) -> Service:
-        return Service(
-            streaming=StreamingService(
-                config=state.config,
-                store=state.store,
-                lock=state.lock,
-                beaver=state.beaver,
-                channels=channels,
-            ),
-        )
+    async def _build_service(self, state: State) -> Service:
+        return Service(streaming=state.services.streaming)
 
     def build(self) -> Mapping[str, Provide]:
         """Build the dependencies."""
@@ -52,12 +52,30 @@ class Credentials(SerializableModel):
         return cls(token=credentials.token, expires_at=credentials.expires_at)
 
 
+class Slot(SerializableModel):
+    """Slot data."""
+
+    id: int
+    """Identifier of the slot."""
+
+    port: int
+    """Port to connect to the stream on."""
+
+    @classmethod
+    def map(cls, slot: sm.Slot) -> Self:
+        """Map from internal representation."""
+        return cls(id=slot.id, port=slot.port)
+
+
 class Reservation(SerializableModel):
     """Reservation of a stream."""
 
     credentials: Credentials
     """Credentials to use to connect to the stream."""
 
+    slot: Slot
+    """Slot that was reserved for the stream."""
+
 
 type ReserveRequestData = ReservationInput
 
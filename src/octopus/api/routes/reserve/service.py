@@ -24,6 +24,8 @@ class Service:
             raise e.ValidationError from ex
         except se.StreamBusyError as ex:
             raise e.ConflictError from ex
+        except se.NoFreeSlotError as ex:
+            raise e.ConflictError from ex
         except se.ServiceError as ex:
             raise e.ServiceError from ex
 
@@ -41,6 +43,7 @@ class Service:
 
         return m.ReserveResponse(
             reservation=m.Reservation(
-                credentials=m.Credentials.map(reserve_response.credentials)
+                credentials=m.Credentials.map(reserve_response.credentials),
+                slot=m.Slot.map(reserve_response.slot),
             )
         )
@@ -1,21 +1,27 @@
+import math
 from collections.abc import Mapping
 from dataclasses import dataclass
+from datetime import timedelta
 from typing import Annotated
 
 from litestar import Controller as BaseController
-from litestar import handlers
-from litestar.channels import ChannelsPlugin
+from litestar import Request, handlers
 from litestar.datastructures import ResponseHeader
 from litestar.di import Provide
 from litestar.openapi.spec import OpenAPIResponse, OpenAPIType, Operation, Schema
 from litestar.params import Parameter
-from litestar.response import ServerSentEvent, ServerSentEventMessage
+from litestar.response import Response, Stream
 from litestar.status_codes import HTTP_200_OK
 
+from octopus.api.exceptions import (
+    ServiceUnavailableException,
+    TooManyRequestsException,
+)
+from octopus.api.routes.sse import errors as e
 from octopus.api.routes.sse import models as m
 from octopus.api.routes.sse.service import Service
-from octopus.models.base import Jsonable
-from octopus.services.events.service import EventsService
+from octopus.models.base import Jsonable, Serializable
+from octopus.state import State
 
 
 @dataclass
@@ -39,8 +45,8 @@ class SubscribeOperation(Operation):
 class DependenciesBuilder:
     """Builder for the dependencies of the controller."""
 
-    async def _build_service(self, channels: ChannelsPlugin) -> Service:
-        return Service(events=EventsService(channels=channels))
+    async def _build_service(self, state: State) -> Service:
+        return Service(events=state.services.events)
 
     def build(self) -> Mapping[str, Provide]:
         """Build the dependencies."""
@@ -54,6 +60,9 @@ class Controller(BaseController):
 
     dependencies = DependenciesBuilder().build()
 
+    def _build_retry_headers(self, retry: timedelta) -> dict[str, str]:
+        return {"Retry-After": str(math.ceil(retry.total_seconds()))}
+
     @handlers.get(
         summary="Get SSE stream",
         status_code=HTTP_200_OK,
@@ -72,23 +81,64 @@ class Controller(BaseController):
         ],
         media_type="text/event-stream",
         operation_class=SubscribeOperation,
+        raises=[ServiceUnavailableException, TooManyRequestsException],
     )
     async def subscribe(
         self,
         service: Service,
+        request: Request,
         types: Annotated[
             Jsonable[m.SubscribeRequestTypes] | None,
             Parameter(
                 description="Types of events to subscribe to.",
             ),
         ] = None,
-    ) -> ServerSentEvent:
+        last_event_id: Annotated[
+            m.SubscribeRequestLastEventId,
+            Parameter(
+                header="Last-Event-ID",
+                description="Identifier of the last event received before reconnecting.",
+            ),
+        ] = None,
+    ) -> Stream:
         """Get a stream of Server-Sent Events."""
-        request = m.SubscribeRequest(types=types.root if types else None)
+        subscribe_request = m.SubscribeRequest(
+            types=types.root if types else None,
+            last_event_id=last_event_id,
+            client=request.client.host if request.client else None,
+        )
 
-        response = await service.subscribe(request)
+        try:
+            response = await service.subscribe(subscribe_request)
+        except e.TooManyConnectionsError as ex:
+            raise ServiceUnavailableException(
+                headers=self._build_retry_headers(ex.retry)
+            ) from ex
+        except e.TooManyClientConnectionsError as ex:
+            raise TooManyRequestsException(
+                headers=self._build_retry_headers(ex.retry)
+            ) from ex
 
-        return ServerSentEvent(
-            ServerSentEventMessage(data=message.event.model_dump_json(round_trip=True))
-            async for message in response.messages
+        return Stream(
+            response.frames,
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+                "X-Accel-Buffering": "no",
+            },
         )
+
+    @handlers.get(
+        "/stats",
+        summary="Get SSE statistics",
+    )
+    async def stats(
+        self, service: Service
+    ) -> Response[Serializable[m.StatsResponseStats]]:
+        """Get statistics of Server-Sent Events, including the lag of each subscriber."""
+        request = m.StatsRequest()
+
+        response = await service.stats(request)
+
+        return Response(Serializable(response.stats))
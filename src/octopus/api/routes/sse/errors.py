@@ -1,2 +1,21 @@
+from datetime import timedelta
+
+
 class ServiceError(Exception):
     """Base class for service errors."""
+
+
+class LimitError(ServiceError):
+    """Raised when a limit of connections is reached."""
+
+    def __init__(self, retry: timedelta) -> None:
+        super().__init__()
+        self.retry = retry
+
+
+class TooManyConnectionsError(LimitError):
+    """Raised when the limit of connections is reached."""
+
+
+class TooManyClientConnectionsError(LimitError):
+    """Raised when the limit of connections from a single client is reached."""
@@ -1,20 +1,62 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from collections.abc import Set as AbstractSet
-from typing import Annotated
+from typing import Annotated, Self
+from uuid import UUID
 
 from pydantic import BeforeValidator
 
-from octopus.models.base import datamodel
+from octopus.models.base import SerializableModel, datamodel
 from octopus.models.events.enums import EventType
 from octopus.services.events import models as em
+from octopus.utils.time import UTCDatetime
 
 
-@datamodel
-class EventMessage:
-    """Event message data."""
+class ConnectionStats(SerializableModel):
+    """Statistics of a connection."""
+
+    id: UUID
+    """Identifier of the connection."""
+
+    client: str | None
+    """Address of the client."""
+
+    opened_at: UTCDatetime
+    """Datetime in UTC at which the connection was opened."""
+
+    backlog: int
+    """Number of events waiting to be sent."""
+
+    peak: int
+    """Maximum number of events that were waiting to be sent at once."""
+
+    dropped: int
+    """Number of events dropped because the backlog was full."""
 
-    event: em.Event
-    """Event that occurred."""
+    resyncs: int
+    """Number of times the subscriber had to catch up from the history of events."""
+
+    @classmethod
+    def map(cls, stats: em.ConnectionStats) -> Self:
+        """Map from internal representation."""
+        return cls(
+            id=stats.id,
+            client=stats.client,
+            opened_at=stats.opened_at,
+            backlog=stats.subscriber.backlog if stats.subscriber else 0,
+            peak=stats.subscriber.peak if stats.subscriber else 0,
+            dropped=stats.subscriber.dropped if stats.subscriber else 0,
+            resyncs=stats.subscriber.resyncs if stats.subscriber else 0,
+        )
+
+
+class Stats(SerializableModel):
+    """Statistics of Server-Sent Events."""
+
+    count: int
+    """Number of active connections."""
+
+    connections: Sequence[ConnectionStats]
+    """Statistics of active connections."""
 
 
 type SubscribeRequestTypes = Annotated[
@@ -25,7 +67,11 @@ type SubscribeRequestTypes = Annotated[
     ),
 ]
 
-type SubscribeResponseMessages = AsyncIterator[EventMessage]
+type SubscribeRequestLastEventId = int | None
+
+type SubscribeRequestClient = str | None
+
+type SubscribeResponseFrames = AsyncIterator[bytes]
 
 
 @datamodel
@@ -35,10 +81,32 @@ class SubscribeRequest:
     types: SubscribeRequestTypes
     """Types of events to subscribe to."""
 
+    last_event_id: SubscribeRequestLastEventId
+    """Identifier of the last event received before reconnecting."""
+
+    client: SubscribeRequestClient
+    """Address of the client."""
+
 
 @datamodel
 class SubscribeResponse:
     """Response for subscribe."""
 
-    messages: SubscribeResponseMessages
-    """Stream of event messages."""
+    frames: SubscribeResponseFrames
+    """Stream of Server-Sent Events frames."""
+
+
+type StatsResponseStats = Stats
+
+
+@datamodel
+class StatsRequest:
+    """Request to get statistics."""
+
+
+@datamodel
+class StatsResponse:
+    """Response for getting statistics."""
+
+    stats: StatsResponseStats
+    """Statistics of Server-Sent Events."""
@@ -1,4 +1,4 @@
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import Generator
 from contextlib import contextmanager
 
 from octopus.api.routes.sse import errors as e
@@ -18,20 +18,38 @@ class Service:
     def _handle_errors(self) -> Generator[None]:
         try:
             yield
+        except ee.TooManyConnectionsError as ex:
+            raise e.TooManyConnectionsError(ex.retry) from ex
+        except ee.TooManyClientConnectionsError as ex:
+            raise e.TooManyClientConnectionsError(ex.retry) from ex
         except ee.ServiceError as ex:
             raise e.ServiceError from ex
 
-    async def _subscribe(
-        self, types: m.SubscribeRequestTypes
-    ) -> AsyncGenerator[m.EventMessage]:
-        subscribe_request = em.SubscribeRequest(types=types)
+    async def subscribe(self, request: m.SubscribeRequest) -> m.SubscribeResponse:
+        """Subscribe to Server-Sent Events frames."""
+        subscribe_request = em.SubscribeRequest(
+            types=request.types,
+            last_event_id=request.last_event_id,
+            client=request.client,
+        )
 
         with self._handle_errors():
             subscribe_response = await self._events.subscribe(subscribe_request)
 
-            async for event in subscribe_response.events:
-                yield m.EventMessage(event=event)
+        return m.SubscribeResponse(frames=subscribe_response.frames)
 
-    async def subscribe(self, request: m.SubscribeRequest) -> m.SubscribeResponse:
-        """Subscribe to event messages."""
-        return m.SubscribeResponse(messages=self._subscribe(request.types))
+    async def stats(self, request: m.StatsRequest) -> m.StatsResponse:
+        """Get statistics of Server-Sent Events."""
+        stats_request = em.StatsRequest()
+
+        with self._handle_errors():
+            stats_response = await self._events.stats(stats_request)
+
+        return m.StatsResponse(
+            stats=m.Stats(
+                count=stats_response.count,
+                connections=[
+                    m.ConnectionStats.map(stats) for stats in stats_response.connections
+                ],
+            )
+        )
@@ -0,0 +1,43 @@
+from collections.abc import Mapping
+
+from litestar import Controller as BaseController
+from litestar import handlers
+from litestar.di import Provide
+from litestar.response import Response
+
+from octopus.api.routes.stats import models as m
+from octopus.api.routes.stats.service import Service
+from octopus.models.base import Serializable
+from octopus.state import State
+
+
+class DependenciesBuilder:
+    """Builder for the dependencies of the controller."""
+
+    async def _build_service(self, state: State) -> Service:
+        return Service(stats=state.services.stats)
+
+    def build(self) -> Mapping[str, Provide]:
+        """Build the dependencies."""
+        return {
+            "service": Provide(self._build_service),
+        }
+
+
+class Controller(BaseController):
+    """Controller for the stats endpoint."""
+
+    dependencies = DependenciesBuilder().build()
+
+    @handlers.get(
+        summary="Get pipeline statistics",
+    )
+    async def stats(
+        self, service: Service
+    ) -> Response[Serializable[m.StatsResponseStats]]:
+        """Get recent statistics of the ffmpeg pipelines of streams."""
+        request = m.StatsRequest()
+
+        response = await service.stats(request)
+
+        return Response(Serializable(response.stats))
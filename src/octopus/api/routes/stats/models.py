@@ -0,0 +1,102 @@
+from collections.abc import Sequence
+from typing import Self
+from uuid import UUID
+
+from octopus.models.base import SerializableModel, datamodel
+from octopus.services.stats import models as stm
+from octopus.services.streaming import models as sm
+from octopus.utils.time import NaiveDatetime, Timedelta, UTCDatetime
+
+
+class Instance(SerializableModel):
+    """Instance data."""
+
+    event: UUID
+    """Identifier of the event the instance belongs to."""
+
+    start: NaiveDatetime
+    """Start datetime of the instance in event timezone."""
+
+    @classmethod
+    def map(cls, instance: sm.Instance) -> Self:
+        """Map from internal representation."""
+        return cls(event=instance.event, start=instance.start)
+
+
+class Sample(SerializableModel):
+    """Sample of statistics of the ffmpeg pipeline of a stream."""
+
+    sampled_at: UTCDatetime
+    """Datetime in UTC at which the sample was taken."""
+
+    bitrate: float | None
+    """Bitrate of the outgoing stream in kilobits per second."""
+
+    size: int | None
+    """Total size of the outgoing stream in bytes."""
+
+    duration: Timedelta | None
+    """Duration of the audio that was streamed so far."""
+
+    speed: float | None
+    """Processing speed relative to real time."""
+
+    @classmethod
+    def map(cls, sample: stm.Sample) -> Self:
+        """Map from internal representation."""
+        return cls(
+            sampled_at=sample.sampled_at,
+            bitrate=sample.bitrate,
+            size=sample.size,
+            duration=sample.duration,
+            speed=sample.speed,
+        )
+
+
+class StreamStats(SerializableModel):
+    """Statistics of a stream."""
+
+    slot: int
+    """Identifier of the slot that the stream is handled in."""
+
+    instance: Instance
+    """Instance that the stream is for."""
+
+    started_at: UTCDatetime
+    """Datetime in UTC at which the stream was started."""
+
+    samples: Sequence[Sample]
+    """Recent samples of statistics, from oldest to newest."""
+
+    @classmethod
+    def map(cls, stats: stm.StreamStats) -> Self:
+        """Map from internal representation."""
+        return cls(
+            slot=stats.slot,
+            instance=Instance.map(stats.instance),
+            started_at=stats.started_at,
+            samples=[Sample.map(sample) for sample in stats.samples],
+        )
+
+
+class Stats(SerializableModel):
+    """Statistics of streams."""
+
+    streams: Sequence[StreamStats]
+    """Statistics of the latest stream in each slot."""
+
+
+type StatsResponseStats = Stats
+
+
+@datamodel
+class StatsRequest:
+    """Request to get statistics of streams."""
+
+
+@datamodel
+class StatsResponse:
+    """Response for getting statistics of streams."""
+
+    stats: StatsResponseStats
+    """Statistics of streams."""
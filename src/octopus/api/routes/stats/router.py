@@ -0,0 +1,11 @@
+from litestar import Router
+
+from octopus.api.routes.stats.controller import Controller
+
+router = Router(
+    path="/stats",
+    tags=["Stats"],
+    route_handlers=[
+        Controller,
+    ],
+)
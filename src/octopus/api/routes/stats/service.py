@@ -0,0 +1,35 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+
+from octopus.api.routes.stats import errors as e
+from octopus.api.routes.stats import models as m
+from octopus.services.stats import errors as ste
+from octopus.services.stats import models as stm
+from octopus.services.stats.service import StatsService
+
+
+class Service:
+    """Service for the stats endpoint."""
+
+    def __init__(self, stats: StatsService) -> None:
+        self._stats = stats
+
+    @contextmanager
+    def _handle_errors(self) -> Generator[None]:
+        try:
+            yield
+        except ste.ServiceError as ex:
+            raise e.ServiceError from ex
+
+    async def stats(self, request: m.StatsRequest) -> m.StatsResponse:
+        """Get statistics of streams."""
+        get_request = stm.GetRequest()
+
+        with self._handle_errors():
+            get_response = await self._stats.get(get_request)
+
+        return m.StatsResponse(
+            stats=m.Stats(
+                streams=[m.StreamStats.map(stream) for stream in get_response.streams]
+            )
+        )
@@ -3,7 +3,6 @@ from typing import Annotated
 
 from litestar import Controller as BaseController
 from litestar import handlers
-from litestar.channels import ChannelsPlugin
 from litestar.di import Provide
 from litestar.params import Parameter
 from litestar.response import Response
@@ -13,14 +12,14 @@ from octopus.api.routes.test import errors as e
 from octopus.api.routes.test import models as m
 from octopus.api.routes.test.service import Service
 from octopus.models.base import Jsonable, Serializable
-from octopus.services.test.service import TestService
+from octopus.state import State
 
 
 class DependenciesBuilder:
     """Builder for the dependencies of the controller."""
 
-    async def _build_service(self, channels: ChannelsPlugin) -> Service:
-        return Service(test=TestService(channels=channels))
+    async def _build_service(self, state: State) -> Service:
+        return Service(test=state.services.test)
 
     def build(self) -> Mapping[str, Provide]:
         """Build the dependencies."""
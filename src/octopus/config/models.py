@@ -1,13 +1,44 @@
 from collections.abc import Sequence
 from datetime import timedelta
-from socket import gethostbyname
+from pathlib import Path
+from tempfile import gettempdir
+from typing import Literal, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from octopus.config.base import BaseConfig
 from octopus.utils.time import Timedelta
 
 
+class BeaverHTTPPoolConfig(BaseModel):
+    """Configuration for the connection pool of the HTTP API of the beaver service."""
+
+    connections: int | None = Field(default=100, ge=1)
+    """Maximum number of concurrent connections."""
+
+    keepalive: int | None = Field(default=20, ge=0)
+    """Maximum number of idle connections to keep alive."""
+
+    expiry: Timedelta | None = Field(default=timedelta(seconds=5), ge=timedelta())
+    """Time after which idle connections are closed."""
+
+
+class BeaverHTTPTimeoutsConfig(BaseModel):
+    """Configuration for the timeouts of the HTTP API of the beaver service."""
+
+    connect: Timedelta | None = Field(default=timedelta(seconds=5), ge=timedelta())
+    """Timeout for establishing a connection."""
+
+    read: Timedelta | None = Field(default=timedelta(seconds=5), ge=timedelta())
+    """Timeout for receiving data."""
+
+    write: Timedelta | None = Field(default=timedelta(seconds=5), ge=timedelta())
+    """Timeout for sending data."""
+
+    pool: Timedelta | None = Field(default=timedelta(seconds=5), ge=timedelta())
+    """Timeout for acquiring a connection from the pool."""
+
+
 class BeaverHTTPConfig(BaseModel):
     """Configuration for the HTTP API of the beaver service."""
 
@@ -23,6 +54,12 @@ class BeaverHTTPConfig(BaseModel):
     path: str | None = None
     """Path of the HTTP API."""
 
+    pool: BeaverHTTPPoolConfig = BeaverHTTPPoolConfig()
+    """Configuration for the connection pool."""
+
+    timeouts: BeaverHTTPTimeoutsConfig = BeaverHTTPTimeoutsConfig()
+    """Configuration for the timeouts."""
+
     @property
     def url(self) -> str:
         """URL of the HTTP API."""
@@ -36,9 +73,25 @@ class BeaverHTTPConfig(BaseModel):
         return url
 
 
+class BeaverCacheConfig(BaseModel):
+    """Configuration for the cache of the beaver service."""
+
+    size: int = Field(default=1024, ge=0)
+    """Maximum number of cached responses."""
+
+    ttl: Timedelta = Field(default=timedelta(seconds=10), ge=timedelta())
+    """Time for which found resources are cached."""
+
+    negative: Timedelta = Field(default=timedelta(seconds=2), ge=timedelta())
+    """Time for which missing resources are cached."""
+
+
 class BeaverConfig(BaseModel):
     """Configuration for the beaver service."""
 
+    cache: BeaverCacheConfig = BeaverCacheConfig()
+    """Configuration for the cache."""
+
     http: BeaverHTTPConfig = BeaverHTTPConfig()
     """Configuration for the HTTP API."""
 
@@ -52,14 +105,6 @@ class DingoSRTConfig(BaseModel):
     port: int = Field(default=10100, ge=1, le=65535)
     """Port of the SRT stream."""
 
-    @property
-    def url(self) -> str:
-        """URL of the SRT stream."""
-        host = gethostbyname(self.host)
-        port = self.port
-
-        return f"srt://{host}:{port}"
-
 
 class DingoConfig(BaseModel):
     """Configuration for the dingo service."""
@@ -68,6 +113,61 @@ class DingoConfig(BaseModel):
     """Configuration for the SRT stream."""
 
 
+class EventsBacklogConfig(BaseModel):
+    """Configuration for backlogs of events waiting to be sent to subscribers."""
+
+    size: int = Field(default=100, ge=1)
+    """Maximum number of events waiting to be sent to a single subscriber."""
+
+    policy: Literal["coalesce", "disconnect", "drop-oldest"] = "coalesce"
+    """What to do with a subscriber whose backlog is full."""
+
+
+class EventsConnectionsConfig(BaseModel):
+    """Configuration for connections of subscribers to events."""
+
+    limit: int | None = Field(default=10000, ge=1)
+    """Maximum number of connections in total, split evenly between workers."""
+
+    client: int | None = Field(default=100, ge=1)
+    """Maximum number of connections from a single client address, split evenly between workers."""
+
+    heartbeat: Timedelta = Field(default=timedelta(seconds=15), gt=timedelta())
+    """Time without events after which a heartbeat comment is sent."""
+
+    idle: Timedelta | None = Field(default=timedelta(minutes=10), gt=timedelta())
+    """Time without events after which a connection is closed."""
+
+    lifetime: Timedelta | None = Field(default=timedelta(hours=1), gt=timedelta())
+    """Time after which a connection is closed."""
+
+    retry: Timedelta = Field(default=timedelta(seconds=5), ge=timedelta())
+    """Base time that clients should wait before reconnecting."""
+
+    jitter: Timedelta = Field(default=timedelta(seconds=5), ge=timedelta())
+    """Maximum random time added to the time clients should wait before reconnecting."""
+
+
+class EventsReplayConfig(BaseModel):
+    """Configuration for replaying missed events."""
+
+    size: int = Field(default=100, ge=0)
+    """Maximum number of recent events kept for replay for each type of events."""
+
+
+class EventsConfig(BaseModel):
+    """Configuration for events."""
+
+    backlog: EventsBacklogConfig = EventsBacklogConfig()
+    """Configuration for backlogs of events waiting to be sent to subscribers."""
+
+    connections: EventsConnectionsConfig = EventsConnectionsConfig()
+    """Configuration for connections of subscribers to events."""
+
+    replay: EventsReplayConfig = EventsReplayConfig()
+    """Configuration for replaying missed events."""
+
+
 class GeckoHTTPConfig(BaseModel):
     """Configuration for the HTTP API of the gecko service."""
 
@@ -103,6 +203,189 @@ class GeckoConfig(BaseModel):
     """Configuration for the HTTP API."""
 
 
+class LatencyConfig(BaseModel):
+    """Configuration for choosing latency of streams."""
+
+    adaptive: bool = False
+    """Whether to adapt latency to how previous streams went."""
+
+    floor: Timedelta = Field(
+        default=timedelta(milliseconds=120),
+        ge=timedelta(milliseconds=20),
+        le=timedelta(milliseconds=8000),
+    )
+    """Lowest latency that can be chosen."""
+
+    ceiling: Timedelta = Field(
+        default=timedelta(milliseconds=2000),
+        ge=timedelta(milliseconds=20),
+        le=timedelta(milliseconds=8000),
+    )
+    """Highest latency that can be chosen."""
+
+    increase: float = Field(default=2.0, gt=1)
+    """Factor that latency is multiplied by after a stream with dropouts."""
+
+    decrease: float = Field(default=0.9, gt=0, lt=1)
+    """Factor that latency is multiplied by after a stream without dropouts."""
+
+    lag: float = Field(default=0.95, gt=0, le=1)
+    """Speed of audio between two samples relative to real time below which it counts as a dropout."""
+
+    tolerance: float = Field(default=0.01, ge=0, le=1)
+    """Fraction of intervals between samples of a stream that can be dropouts without raising latency."""
+
+    window: int = Field(default=5, ge=1)
+    """Number of recent streams that must all have dropouts to raise egress latency."""
+
+    events: int = Field(default=1000, ge=1)
+    """Maximum number of events to remember ingest latency for."""
+
+    @model_validator(mode="after")
+    def validate_bounds(self) -> Self:
+        """Validate that the floor is not above the ceiling."""
+        if self.floor > self.ceiling:
+            msg = f"Latency floor {self.floor} is above latency ceiling {self.ceiling}."
+            raise ValueError(msg)
+
+        return self
+
+
+class MirrorConfig(BaseModel):
+    """Configuration for the schedule mirror."""
+
+    enabled: bool = True
+    """Whether to mirror the schedule from the beaver service."""
+
+    interval: Timedelta = Field(default=timedelta(minutes=1), gt=timedelta())
+    """Time between refreshes of the mirror."""
+
+    expiry: Timedelta = Field(default=timedelta(minutes=5), ge=timedelta())
+    """Time after a successful refresh after which the mirror is not used."""
+
+    lookbehind: Timedelta = Field(default=timedelta(days=1), ge=timedelta())
+    """How far into the past to mirror instances."""
+
+    lookahead: Timedelta = Field(default=timedelta(days=1), ge=timedelta())
+    """How far into the future to mirror instances."""
+
+    page: int = Field(default=100, ge=1)
+    """Number of schedules to request from the beaver service at once."""
+
+
+class RecordingsIndexConfig(BaseModel):
+    """Configuration for seek indexes of recordings."""
+
+    enabled: bool = False
+    """Whether to upload a seek index next to recordings."""
+
+    interval: Timedelta = Field(default=timedelta(seconds=5), gt=timedelta())
+    """Duration of audio between entries in the seek index."""
+
+
+class RecordingsManifestConfig(BaseModel):
+    """Configuration for manifests of recordings."""
+
+    enabled: bool = False
+    """Whether to upload a manifest next to recordings that are not segmented."""
+
+    interval: Timedelta = Field(default=timedelta(seconds=1), gt=timedelta())
+    """How often to update checksums and seek indexes of recordings while they are written."""
+
+    verify: bool = False
+    """Whether to download uploaded recordings to verify them against the manifest."""
+
+
+class RecordingsPeaksConfig(BaseModel):
+    """Configuration for waveform peaks of recordings."""
+
+    enabled: bool = False
+    """Whether to upload waveform peaks next to recordings, which requires NumPy."""
+
+    rate: int = Field(default=8000, ge=1)
+    """Sample rate in Hz that recordings are decoded at to compute peaks."""
+
+    resolution: int = Field(default=256, ge=1)
+    """Number of samples per peak at the most detailed zoom level."""
+
+    factor: int = Field(default=4, ge=2)
+    """Number of peaks combined into one at each next zoom level."""
+
+    levels: int = Field(default=4, ge=1)
+    """Number of zoom levels."""
+
+
+class RecordingsSegmentsConfig(BaseModel):
+    """Configuration for uploading recordings in segments."""
+
+    enabled: bool = False
+    """Whether to upload recordings in segments instead of as a whole."""
+
+    duration: Timedelta = Field(default=timedelta(minutes=10), gt=timedelta())
+    """Duration of audio in each segment."""
+
+    concurrency: int = Field(default=4, ge=1)
+    """Maximum number of segments of a recording uploaded concurrently."""
+
+
+class RecordingsSpoolConfig(BaseModel):
+    """Configuration for the spool of recordings."""
+
+    path: Path = Path(gettempdir()) / "octopus" / "recordings"
+    """Directory that recordings are written to before they are uploaded."""
+
+    limit: int = Field(default=10 * 1024**3, ge=0)
+    """Maximum total size of recordings in the spool in bytes."""
+
+
+class RecordingsUploadConfig(BaseModel):
+    """Configuration for uploading recordings."""
+
+    delay: Timedelta = Field(default=timedelta(seconds=1), gt=timedelta())
+    """Delay before retrying a failed upload, doubled after each failure."""
+
+    backoff: Timedelta = Field(default=timedelta(minutes=5), gt=timedelta())
+    """Maximum delay before retrying a failed upload."""
+
+    timeout: Timedelta = Field(default=timedelta(seconds=30), gt=timedelta())
+    """Timeout for waiting for the gecko service during an upload."""
+
+
+class RecordingsConfig(BaseModel):
+    """Configuration for recordings."""
+
+    index: RecordingsIndexConfig = RecordingsIndexConfig()
+    """Configuration for seek indexes of recordings."""
+
+    manifest: RecordingsManifestConfig = RecordingsManifestConfig()
+    """Configuration for manifests of recordings."""
+
+    peaks: RecordingsPeaksConfig = RecordingsPeaksConfig()
+    """Configuration for waveform peaks of recordings."""
+
+    segments: RecordingsSegmentsConfig = RecordingsSegmentsConfig()
+    """Configuration for uploading recordings in segments."""
+
+    spool: RecordingsSpoolConfig = RecordingsSpoolConfig()
+    """Configuration for the spool of recordings."""
+
+    upload: RecordingsUploadConfig = RecordingsUploadConfig()
+    """Configuration for uploading recordings."""
+
+
+class ResolverConfig(BaseModel):
+    """Configuration for resolving hosts."""
+
+    ttl: Timedelta = Field(default=timedelta(minutes=5), gt=timedelta())
+    """Time after which resolved addresses are resolved again before use."""
+
+    refresh: Timedelta = Field(default=timedelta(minutes=1), gt=timedelta())
+    """Time between background refreshes of resolved addresses."""
+
+    timeout: Timedelta = Field(default=timedelta(seconds=5), gt=timedelta())
+    """Timeout for resolving a host."""
+
+
 class ServerPortsConfig(BaseModel):
     """Configuration for the server ports."""
 
@@ -110,7 +393,43 @@ class ServerPortsConfig(BaseModel):
     """Port to listen for HTTP requests on."""
 
     srt: int = Field(default=10300, ge=0, le=65535)
-    """Port to listen for SRT connections on."""
+    """First port to listen for SRT connections on."""
+
+
+class ServerRuntimeConfig(BaseModel):
+    """Configuration for the runtime of the server."""
+
+    loop: Literal["asyncio", "auto", "uvloop"] = "auto"
+    """Event loop implementation, auto prefers uvloop if installed."""
+
+    http: Literal["auto", "h11", "httptools"] = "auto"
+    """HTTP parser implementation, auto prefers httptools if installed."""
+
+    backlog: int = Field(default=2048, ge=1)
+    """Maximum number of connections waiting to be accepted."""
+
+    keepalive: Timedelta = Field(default=timedelta(seconds=5), ge=timedelta())
+    """Time after which idle keep-alive connections are closed."""
+
+
+class ServerWorkersConfig(BaseModel):
+    """Configuration for the worker processes of the server."""
+
+    count: int = Field(default=1, ge=1)
+    """Number of worker processes to handle requests with."""
+
+    sockets: Path = Path(gettempdir()) / "octopus"
+    """Directory for Unix sockets used for communication between workers."""
+
+    @property
+    def hub(self) -> Path:
+        """Path of the Unix socket of the hub that broadcasts events between workers."""
+        return self.sockets / "hub.sock"
+
+    @property
+    def store(self) -> Path:
+        """Path of the Unix socket of the store that workers share state through."""
+        return self.sockets / "store.sock"
 
 
 class ServerConfig(BaseModel):
@@ -122,19 +441,106 @@ class ServerConfig(BaseModel):
     ports: ServerPortsConfig = ServerPortsConfig()
     """Configuration for the server ports."""
 
+    runtime: ServerRuntimeConfig = ServerRuntimeConfig()
+    """Configuration for the runtime of the server."""
+
     trusted: str | Sequence[str] | None = "*"
     """Trusted IP addresses."""
 
+    workers: ServerWorkersConfig = ServerWorkersConfig()
+    """Configuration for the worker processes."""
+
+
+class StatsConfig(BaseModel):
+    """Configuration for statistics of streams."""
+
+    samples: int = Field(default=300, ge=1)
+    """Maximum number of recent samples of statistics kept for each stream."""
+
+
+class StoreHTTPConfig(BaseModel):
+    """Configuration for the HTTP API of the store server."""
+
+    scheme: str = "http"
+    """Scheme of the HTTP API."""
+
+    host: str = "localhost"
+    """Host of the HTTP API."""
+
+    port: int | None = Field(default=10310, ge=1, le=65535)
+    """Port of the HTTP API."""
+
+    path: str | None = None
+    """Path of the HTTP API."""
+
+    socket: Path | None = None
+    """Path of a Unix socket to connect through instead of the host and port."""
+
+    timeout: Timedelta | None = Field(default=timedelta(seconds=5), ge=timedelta())
+    """Timeout for requests to the store server."""
+
+    @property
+    def url(self) -> str:
+        """URL of the HTTP API."""
+        url = f"{self.scheme}://{self.host}"
+        if self.port:
+            url = f"{url}:{self.port}"
+        if self.path:
+            path = self.path if self.path.startswith("/") else f"/{self.path}"
+            path = path.rstrip("/")
+            url = f"{url}{path}"
+        return url
+
+
+class StoreConfig(BaseModel):
+    """Configuration for the store of shared state."""
+
+    backend: Literal["memory", "remote"] = "memory"
+    """Where to keep shared state, remote allows running several replicas."""
+
+    http: StoreHTTPConfig = StoreHTTPConfig()
+    """Configuration for the HTTP API of the store server."""
+
+
+class StreamingProgressConfig(BaseModel):
+    """Configuration for reporting progress of streams."""
+
+    interval: Timedelta = Field(default=timedelta(seconds=5), ge=timedelta())
+    """Minimum time between reports of statistics of a stream."""
+
+    period: Timedelta = Field(
+        default=timedelta(seconds=1), ge=timedelta(milliseconds=100)
+    )
+    """Time between progress updates written by the stream pipeline."""
+
+    sockets: Path = Path(gettempdir()) / "octopus" / "progress"
+    """Directory for Unix sockets that progress of streams is received through."""
+
 
 class StreamingConfig(BaseModel):
     """Configuration for the streaming service."""
 
+    background: bool = False
+    """Whether to respond to reservations before the stream is started."""
+
     latency: Timedelta = Field(
         default=timedelta(milliseconds=200),
         ge=timedelta(milliseconds=20),
         le=timedelta(milliseconds=8000),
     )
-    """Target latency for buffering outgoing stream."""
+    """Latency for buffering outgoing streams and the starting point of adapted latency."""
+
+    lease: Timedelta = Field(default=timedelta(seconds=30), gt=timedelta())
+    """Time after which a reservation of a slot expires unless it is renewed."""
+
+    progress: StreamingProgressConfig = StreamingProgressConfig()
+    """Configuration for reporting progress of streams."""
+
+    refresh: Timedelta = Field(default=timedelta(seconds=1), gt=timedelta())
+    """How often to refresh the availability from the store of reservations."""
+
+    slots: int = Field(default=1, ge=1)
+    """Number of streams that can be handled concurrently."""
 
     timeout: Timedelta = Field(default=timedelta(minutes=1), ge=timedelta())
     """Time after which a stream will be stopped if no connections are made."""
@@ -152,11 +558,43 @@ class Config(BaseConfig):
     dingo: DingoConfig = DingoConfig()
     """Configuration for the dingo service."""
 
+    events: EventsConfig = EventsConfig()
+    """Configuration for events."""
+
     gecko: GeckoConfig = GeckoConfig()
     """Configuration for the gecko service."""
 
+    latency: LatencyConfig = LatencyConfig()
+    """Configuration for choosing latency of streams."""
+
+    mirror: MirrorConfig = MirrorConfig()
+    """Configuration for the schedule mirror."""
+
+    recordings: RecordingsConfig = RecordingsConfig()
+    """Configuration for recordings."""
+
+    resolver: ResolverConfig = ResolverConfig()
+    """Configuration for resolving hosts."""
+
     server: ServerConfig = ServerConfig()
     """Configuration for the server."""
 
+    stats: StatsConfig = StatsConfig()
+    """Configuration for statistics of streams."""
+
+    store: StoreConfig = StoreConfig()
+    """Configuration for the store of shared state."""
+
     streaming: StreamingConfig = StreamingConfig()
     """Configuration for the streaming service."""
+
+    @model_validator(mode="after")
+    def validate_srt_ports(self) -> Self:
+        """Validate that there is an SRT port for each streaming slot."""
+        last = self.server.ports.srt + self.streaming.slots - 1
+
+        if last > 65535:  # noqa: PLR2004
+            msg = f"Not enough SRT ports for {self.streaming.slots} slots, last port would be {last}."
+            raise ValueError(msg)
+
+        return self
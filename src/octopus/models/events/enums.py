@@ -6,3 +6,8 @@ class EventType(StrEnum):
 
     TEST = "test"
     AVAILABILITY_CHANGED = "availability-changed"
+    STREAM_READY = "stream-ready"
+    STREAM_FAILED = "stream-failed"
+    STREAM_CONNECTED = "stream-connected"
+    STREAM_STATS = "stream-stats"
+    STREAM_ENDED = "stream-ended"
@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+from datetime import timedelta
 from typing import Literal, Self
 from uuid import UUID
 
@@ -25,11 +27,76 @@ class Instance(SerializableModel):
         return cls(event=instance.event, start=instance.start)
 
 
-class Availability(SerializableModel):
-    """Availability of a stream."""
+class Slot(SerializableModel):
+    """Slot data."""
+
+    id: int
+    """Identifier of the slot."""
+
+    port: int
+    """Port to listen for SRT connections on."""
+
+    @classmethod
+    def map(cls, slot: sm.Slot) -> Self:
+        """Map from internal representation."""
+        return cls(id=slot.id, port=slot.port)
+
+
+class Stats(SerializableModel):
+    """Statistics of a stream."""
+
+    bitrate: float | None
+    """Bitrate of the outgoing stream in kilobits per second."""
+
+    size: int | None
+    """Total size of the outgoing stream in bytes."""
+
+    duration: timedelta | None
+    """Duration of the audio that was streamed so far."""
+
+    speed: float | None
+    """Processing speed relative to real time."""
+
+    @classmethod
+    def map(cls, progress: sm.Progress) -> Self:
+        """Map from internal representation."""
+        return cls(
+            bitrate=progress.bitrate,
+            size=progress.size,
+            duration=progress.duration,
+            speed=progress.speed,
+        )
+
+
+class SlotAvailability(SerializableModel):
+    """Availability of a slot."""
+
+    id: int
+    """Identifier of the slot."""
+
+    port: int
+    """Port to listen for SRT connections on."""
 
     instance: Instance | None
-    """Instance that is currently being streamed."""
+    """Instance that is currently being streamed in the slot."""
+
+    @classmethod
+    def map(cls, availability: sm.SlotAvailability) -> Self:
+        """Map from internal representation."""
+        return cls(
+            id=availability.slot.id,
+            port=availability.slot.port,
+            instance=Instance.map(availability.instance)
+            if availability.instance
+            else None,
+        )
+
+
+class Availability(SerializableModel):
+    """Availability of streams."""
+
+    slots: Sequence[SlotAvailability]
+    """Availability of each slot."""
 
     checked_at: UTCDatetime
     """Datetime in UTC at which the availability was checked."""
@@ -38,9 +105,7 @@ class Availability(SerializableModel):
     def map(cls, availability: sm.Availability) -> Self:
         """Map from internal representation."""
         return cls(
-            instance=Instance.map(availability.instance)
-            if availability.instance
-            else None,
+            slots=[SlotAvailability.map(slot) for slot in availability.slots],
             checked_at=availability.checked_at,
         )
 
@@ -51,12 +116,111 @@ class AvailabilityChangedEventData(SerializableModel):
     availability: Availability
     """New availability."""
 
+    version: int
+    """Version of the new availability."""
+
 
 class AvailabilityChangedEvent(SerializableModel):
-    """Event emitted when the availability of a stream changes."""
+    """Event emitted when the availability of streams changes."""
 
     type: TypeField[Literal[EventType.AVAILABILITY_CHANGED]] = (
         EventType.AVAILABILITY_CHANGED
     )
     created_at: CreatedAtField = Field(default_factory=awareutcnow)
     data: DataField[AvailabilityChangedEventData]
+
+
+class StreamReadyEventData(SerializableModel):
+    """Data of a stream-ready event."""
+
+    instance: Instance
+    """Instance that the stream is for."""
+
+    slot: Slot
+    """Slot that the stream is handled in."""
+
+
+class StreamReadyEvent(SerializableModel):
+    """Event emitted when a reserved stream is ready for connections."""
+
+    type: TypeField[Literal[EventType.STREAM_READY]] = EventType.STREAM_READY
+    created_at: CreatedAtField = Field(default_factory=awareutcnow)
+    data: DataField[StreamReadyEventData]
+
+
+class StreamFailedEventData(SerializableModel):
+    """Data of a stream-failed event."""
+
+    instance: Instance
+    """Instance that the stream was for."""
+
+    slot: Slot
+    """Slot that was freed after the failure."""
+
+
+class StreamFailedEvent(SerializableModel):
+    """Event emitted when a reserved stream fails to start."""
+
+    type: TypeField[Literal[EventType.STREAM_FAILED]] = EventType.STREAM_FAILED
+    created_at: CreatedAtField = Field(default_factory=awareutcnow)
+    data: DataField[StreamFailedEventData]
+
+
+class StreamConnectedEventData(SerializableModel):
+    """Data of a stream-connected event."""
+
+    instance: Instance
+    """Instance that the stream is for."""
+
+    slot: Slot
+    """Slot that the stream is handled in."""
+
+
+class StreamConnectedEvent(SerializableModel):
+    """Event emitted when a broadcaster connects to a stream."""
+
+    type: TypeField[Literal[EventType.STREAM_CONNECTED]] = EventType.STREAM_CONNECTED
+    created_at: CreatedAtField = Field(default_factory=awareutcnow)
+    data: DataField[StreamConnectedEventData]
+
+
+class StreamStatsEventData(SerializableModel):
+    """Data of a stream-stats event."""
+
+    instance: Instance
+    """Instance that the stream is for."""
+
+    slot: Slot
+    """Slot that the stream is handled in."""
+
+    stats: Stats
+    """Latest statistics of the stream."""
+
+
+class StreamStatsEvent(SerializableModel):
+    """Event emitted periodically with statistics of a connected stream."""
+
+    type: TypeField[Literal[EventType.STREAM_STATS]] = EventType.STREAM_STATS
+    created_at: CreatedAtField = Field(default_factory=awareutcnow)
+    data: DataField[StreamStatsEventData]
+
+
+class StreamEndedEventData(SerializableModel):
+    """Data of a stream-ended event."""
+
+    instance: Instance
+    """Instance that the stream was for."""
+
+    slot: Slot
+    """Slot that was freed after the stream ended."""
+
+    reason: sm.EndReason
+    """Reason why the stream ended."""
+
+
+class StreamEndedEvent(SerializableModel):
+    """Event emitted when a started stream ends."""
+
+    type: TypeField[Literal[EventType.STREAM_ENDED]] = EventType.STREAM_ENDED
+    created_at: CreatedAtField = Field(default_factory=awareutcnow)
+    data: DataField[StreamEndedEventData]
@@ -5,6 +5,12 @@ from pydantic import Field
 from octopus.models.events import stream, test
 
 type Event = Annotated[
-    test.TestEvent | stream.AvailabilityChangedEvent,
+    test.TestEvent
+    | stream.AvailabilityChangedEvent
+    | stream.StreamReadyEvent
+    | stream.StreamFailedEvent
+    | stream.StreamConnectedEvent
+    | stream.StreamStatsEvent
+    | stream.StreamEndedEvent,
     Field(discriminator="type"),
 ]
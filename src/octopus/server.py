@@ -1,9 +1,16 @@
+import asyncio
+import multiprocessing
+import socket
 from collections.abc import Sequence
+from math import ceil
+from multiprocessing.process import BaseProcess
 
 import uvicorn
 from litestar import Litestar
 
 from octopus.config.models import ServerConfig
+from octopus.services.events.hub import EventsHub
+from octopus.stores.server import StoreServerBuilder
 
 
 class Server:
@@ -19,13 +26,106 @@ class Server:
         self._app = app
         self._config = config
 
-    def run(self) -> None:
-        """Run the server."""
-        uvicorn.run(
+    def _build_config(self) -> uvicorn.Config:
+        runtime = self._config.runtime
+
+        return uvicorn.Config(
             self._app,
             host=self._config.host,
             port=self._config.ports.http,
+            loop=runtime.loop,
+            http=runtime.http,
+            backlog=runtime.backlog,
+            timeout_keep_alive=ceil(runtime.keepalive.total_seconds()),
             forwarded_allow_ips=list(self._config.trusted)
             if isinstance(self._config.trusted, Sequence)
             else self._config.trusted,
         )
+
+    def _build_store_server(self) -> uvicorn.Server:
+        return uvicorn.Server(
+            uvicorn.Config(
+                StoreServerBuilder().build(),
+                uds=str(self._config.workers.store),
+                log_level="warning",
+            )
+        )
+
+    def _serve_worker(self, config: uvicorn.Config, sock: socket.socket) -> None:
+        uvicorn.Server(config).run(sockets=[sock])
+
+    def _start_workers(
+        self, config: uvicorn.Config, sock: socket.socket
+    ) -> Sequence[BaseProcess]:
+        # Workers are forked, so they inherit the app without serializing it
+        context = multiprocessing.get_context("fork")
+
+        workers = [
+            context.Process(target=self._serve_worker, args=(config, sock))
+            for _ in range(self._config.workers.count)
+        ]
+
+        for worker in workers:
+            worker.start()
+
+        return workers
+
+    def _stop_workers(self, workers: Sequence[BaseProcess]) -> None:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+
+        for worker in workers:
+            worker.join()
+
+    async def _watch_workers(
+        self, workers: Sequence[BaseProcess], store: uvicorn.Server
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        exited = asyncio.Event()
+
+        # Sentinels become readable when processes exit
+        for worker in workers:
+            loop.add_reader(worker.sentinel, exited.set)
+
+        try:
+            await exited.wait()
+        finally:
+            for worker in workers:
+                loop.remove_reader(worker.sentinel)
+
+        # Stop everything if any of the workers dies
+        store.should_exit = True
+
+    async def _coordinate(self, workers: Sequence[BaseProcess]) -> None:
+        store = self._build_store_server()
+
+        async with EventsHub(self._config.workers.hub):
+            watcher = asyncio.create_task(self._watch_workers(workers, store))
+
+            try:
+                # Runs until the server is interrupted
+                await store.serve()
+            finally:
+                watcher.cancel()
+
+    def _run_workers(self) -> None:
+        config = self._build_config()
+        sock = config.bind_socket()
+
+        self._config.workers.sockets.mkdir(parents=True, exist_ok=True)
+
+        workers = self._start_workers(config, sock)
+
+        try:
+            asyncio.run(self._coordinate(workers))
+        finally:
+            self._stop_workers(workers)
+            sock.close()
+
+    def run(self) -> None:
+        """Run the server."""
+        if self._config.workers.count > 1:
+            self._run_workers()
+        else:
+            uvicorn.Server(self._build_config()).run()
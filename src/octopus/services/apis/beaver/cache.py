@@ -0,0 +1,138 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+
+from octopus.config.models import BeaverCacheConfig
+from octopus.models.base import datamodel
+from octopus.services.apis.beaver import errors as e
+
+
+@datamodel
+class CacheStats:
+    """Statistics of a cache."""
+
+    hits: int
+    """Number of lookups answered from the cache."""
+
+    misses: int
+    """Number of lookups that required a request."""
+
+    coalesced: int
+    """Number of lookups that joined a request already in flight."""
+
+    evictions: int
+    """Number of entries removed because the cache was full or they expired."""
+
+    size: int
+    """Number of entries currently in the cache."""
+
+
+@datamodel
+class CacheEntry[V]:
+    """Entry of a cache."""
+
+    value: V | None
+    """Cached value or None if the value was not found."""
+
+    expires_at: float
+    """Monotonic time at which the entry expires."""
+
+
+class Cache[K: Hashable, V]:
+    """Bounded LRU cache with per-entry TTL, negative entries and request coalescing.
+
+    Values are fetched at most once at a time for each key.
+    Fetches that raise a not found error are cached as negative entries.
+    Other errors are passed to all waiting callers and not cached.
+
+    Args:
+        config: Configuration for the cache.
+
+    """
+
+    def __init__(self, config: BeaverCacheConfig) -> None:
+        self._config = config
+        self._entries = OrderedDict[K, CacheEntry[V]]()
+        self._inflight = dict[K, asyncio.Task[V]]()
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Statistics of the cache."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            coalesced=self._coalesced,
+            evictions=self._evictions,
+            size=len(self._entries),
+        )
+
+    def _lookup(self, key: K) -> CacheEntry[V] | None:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            self._evictions += 1
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: K, value: V | None) -> None:
+        ttl = self._config.ttl if value is not None else self._config.negative
+
+        if self._config.size == 0 or not ttl:
+            return
+
+        self._entries[key] = CacheEntry(
+            value=value, expires_at=time.monotonic() + ttl.total_seconds()
+        )
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._config.size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _on_fetched(self, key: K, task: asyncio.Task[V]) -> None:
+        self._inflight.pop(key, None)
+
+        if task.cancelled():
+            return
+
+        match task.exception():
+            case None:
+                self._store(key, task.result())
+            case e.NotFoundError():
+                self._store(key, None)
+
+    async def get(self, key: K, fetch: Callable[[], Awaitable[V]]) -> V:
+        """Get the value for the key, fetching it if it is not cached."""
+        if (entry := self._lookup(key)) is not None:
+            self._hits += 1
+
+            if entry.value is None:
+                raise e.NotFoundError
+
+            return entry.value
+
+        if (task := self._inflight.get(key)) is not None:
+            self._coalesced += 1
+        else:
+            self._misses += 1
+
+            async def _fetch() -> V:
+                return await fetch()
+
+            task = asyncio.create_task(_fetch())
+            task.add_done_callback(lambda task: self._on_fetched(key, task))
+            self._inflight[key] = task
+
+        # Shield the fetch, so that cancelling one caller doesn't cancel the others
+        return await asyncio.shield(task)
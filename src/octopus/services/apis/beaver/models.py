@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from enum import StrEnum
 from typing import TypedDict
 from uuid import UUID
@@ -74,6 +75,42 @@ class InstanceWithEventWithShow(Instance):
     """Event the instance belongs to."""
 
 
+class ScheduleInstance(SerializableModel):
+    """Instance data in a schedule."""
+
+    start: NaiveDatetime
+    """Start datetime of the instance in event timezone."""
+
+    end: NaiveDatetime
+    """End datetime of the instance in event timezone."""
+
+
+class Schedule(SerializableModel):
+    """Schedule data."""
+
+    event: EventWithShow | Event
+    """Event the schedule belongs to."""
+
+    instances: Sequence[ScheduleInstance]
+    """Instances of the event."""
+
+
+class ScheduleList(SerializableModel):
+    """List of schedules."""
+
+    count: int
+    """Number of schedules that match the query."""
+
+    limit: int | None
+    """Maximum number of returned schedules."""
+
+    offset: int | None
+    """Number of schedules skipped."""
+
+    schedules: Sequence[Schedule]
+    """Schedules that match the query."""
+
+
 class EventInclude(TypedDict, total=False):
     """Relations to include when querying events."""
 
@@ -126,3 +163,44 @@ class InstancesGetResponse:
 
     instance: InstancesGetResponseInstance
     """Instance that matched the request."""
+
+
+type ScheduleListRequestStart = NaiveDatetime | None
+
+type ScheduleListRequestEnd = NaiveDatetime | None
+
+type ScheduleListRequestLimit = int | None
+
+type ScheduleListRequestOffset = int | None
+
+type ScheduleListRequestInclude = EventInclude | None
+
+type ScheduleListResponseResults = ScheduleList
+
+
+@datamodel
+class ScheduleListRequest:
+    """Request to list schedules."""
+
+    start: ScheduleListRequestStart
+    """Start datetime in UTC to filter events instances."""
+
+    end: ScheduleListRequestEnd
+    """End datetime in UTC to filter events instances."""
+
+    limit: ScheduleListRequestLimit
+    """Maximum number of schedules to return."""
+
+    offset: ScheduleListRequestOffset
+    """Number of schedules to skip."""
+
+    include: ScheduleListRequestInclude
+    """Relations to include in the response."""
+
+
+@datamodel
+class ScheduleListResponse:
+    """Response for listing schedules."""
+
+    results: ScheduleListResponseResults
+    """List of schedules."""
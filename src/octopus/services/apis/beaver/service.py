@@ -1,13 +1,20 @@
-from collections.abc import Mapping
+from collections.abc import AsyncGenerator, Mapping
+from contextlib import asynccontextmanager
+from datetime import timedelta
 from http import HTTPMethod, HTTPStatus
 from typing import Any
 
-from httpx import AsyncClient, HTTPError, HTTPStatusError, Response
+from httpx import AsyncClient, HTTPError, HTTPStatusError, Limits, Response, Timeout
 
 from octopus.config.models import BeaverConfig, BeaverHTTPConfig
 from octopus.models.base import Jsonable, Serializable
 from octopus.services.apis.beaver import errors as e
 from octopus.services.apis.beaver import models as m
+from octopus.services.apis.beaver.cache import Cache
+
+type InstancesCacheKey = tuple[
+    m.InstancesGetRequestEventId, m.InstancesGetRequestStart, str
+]
 
 
 class BeaverClient:
@@ -15,6 +22,53 @@ class BeaverClient:
 
     def __init__(self, config: BeaverHTTPConfig) -> None:
         self.config = config
+        self._client: AsyncClient | None = None
+
+    def _seconds(self, value: timedelta | None) -> float | None:
+        return value.total_seconds() if value is not None else None
+
+    def _build_limits(self) -> Limits:
+        return Limits(
+            max_connections=self.config.pool.connections,
+            max_keepalive_connections=self.config.pool.keepalive,
+            keepalive_expiry=self._seconds(self.config.pool.expiry),
+        )
+
+    def _build_timeout(self) -> Timeout:
+        return Timeout(
+            connect=self._seconds(self.config.timeouts.connect),
+            read=self._seconds(self.config.timeouts.read),
+            write=self._seconds(self.config.timeouts.write),
+            pool=self._seconds(self.config.timeouts.pool),
+        )
+
+    def _build_client(self) -> AsyncClient:
+        return AsyncClient(
+            base_url=self.config.url,
+            limits=self._build_limits(),
+            timeout=self._build_timeout(),
+        )
+
+    @asynccontextmanager
+    async def _get_client(self) -> AsyncGenerator[AsyncClient]:
+        if self._client is not None:
+            yield self._client
+            return
+
+        async with self._build_client() as client:
+            yield client
+
+    async def open(self) -> None:
+        """Open a pooled client that is reused by all requests."""
+        if self._client is None:
+            self._client = self._build_client()
+
+    async def close(self) -> None:
+        """Close the pooled client."""
+        client, self._client = self._client, None
+
+        if client is not None:
+            await client.aclose()
 
     async def request(
         self,
@@ -27,7 +81,7 @@ class BeaverClient:
     ) -> Response:
         """Make a request and return the response."""
         try:
-            async with AsyncClient(base_url=self.config.url) as client:
+            async with self._get_client() as client:
                 return await client.request(
                     method,
                     path,
@@ -42,8 +96,13 @@ class BeaverClient:
 class BeaverInstancesService:
     """Service for instances in beaver API."""
 
-    def __init__(self, client: BeaverClient) -> None:
+    def __init__(
+        self,
+        client: BeaverClient,
+        cache: Cache[InstancesCacheKey, m.InstancesGetResponse],
+    ) -> None:
         self.client = client
+        self.cache = cache
 
     def _dump(self, value: Serializable) -> Any:
         return value.model_dump(mode="json", round_trip=True)
@@ -51,6 +110,28 @@ class BeaverInstancesService:
     def _dump_json(self, value: Jsonable) -> str:
         return value.model_dump_json(round_trip=True)
 
+    async def _get(
+        self, event_id: str, start: str, include: str
+    ) -> m.InstancesGetResponse:
+        response = await self.client.request(
+            HTTPMethod.GET,
+            f"/instances/{event_id}/{start}",
+            params={"include": include},
+        )
+
+        try:
+            response.raise_for_status()
+        except HTTPStatusError as ex:
+            if ex.response.status_code == HTTPStatus.NOT_FOUND:
+                raise e.NotFoundError from ex
+            raise e.ServiceError from ex
+
+        return m.InstancesGetResponse(
+            instance=Serializable[m.InstancesGetResponseInstance]
+            .model_validate_json(response.content)
+            .root
+        )
+
     async def get(self, request: m.InstancesGetRequest) -> m.InstancesGetResponse:
         """Get instance."""
         event_id = self._dump(
@@ -61,21 +142,61 @@ class BeaverInstancesService:
             Jsonable[m.InstancesGetRequestInclude](request.include)
         )
 
+        return await self.cache.get(
+            (request.event_id, request.start, include),
+            lambda: self._get(event_id, start, include),
+        )
+
+
+class BeaverScheduleService:
+    """Service for schedule in beaver API."""
+
+    def __init__(self, client: BeaverClient) -> None:
+        self.client = client
+
+    def _dump(self, value: Serializable) -> Any:
+        return value.model_dump(mode="json", round_trip=True)
+
+    def _dump_json(self, value: Jsonable) -> str:
+        return value.model_dump_json(round_trip=True)
+
+    def _build_params(self, request: m.ScheduleListRequest) -> dict[str, str]:
+        params: dict[str, str] = {}
+
+        if request.start is not None:
+            params["start"] = self._dump(
+                Serializable[m.ScheduleListRequestStart](request.start)
+            )
+        if request.end is not None:
+            params["end"] = self._dump(
+                Serializable[m.ScheduleListRequestEnd](request.end)
+            )
+        if request.limit is not None:
+            params["limit"] = str(request.limit)
+        if request.offset is not None:
+            params["offset"] = str(request.offset)
+        if request.include is not None:
+            params["include"] = self._dump_json(
+                Jsonable[m.ScheduleListRequestInclude](request.include)
+            )
+
+        return params
+
+    async def list(self, request: m.ScheduleListRequest) -> m.ScheduleListResponse:
+        """List schedules."""
         response = await self.client.request(
             HTTPMethod.GET,
-            f"/instances/{event_id}/{start}",
-            params={"include": include},
+            "/schedule",
+            params=self._build_params(request),
         )
 
         try:
             response.raise_for_status()
         except HTTPStatusError as ex:
-            if ex.response.status_code == HTTPStatus.NOT_FOUND:
-                raise e.NotFoundError from ex
             raise e.ServiceError from ex
 
-        return m.InstancesGetResponse(
-            instance=Serializable[m.InstancesGetResponseInstance]
+        return m.ScheduleListResponse(
+            results=Serializable[m.ScheduleListResponseResults]
             .model_validate_json(response.content)
             .root
         )
@@ -86,8 +207,24 @@ class BeaverService:
 
     def __init__(self, config: BeaverConfig) -> None:
         self.client = BeaverClient(config.http)
+        self.cache = Cache[InstancesCacheKey, m.InstancesGetResponse](config.cache)
+        self._instances = BeaverInstancesService(self.client, self.cache)
+        self._schedule = BeaverScheduleService(self.client)
+
+    async def open(self) -> None:
+        """Open connections to beaver API."""
+        await self.client.open()
+
+    async def close(self) -> None:
+        """Close connections to beaver API."""
+        await self.client.close()
 
     @property
     def instances(self) -> BeaverInstancesService:
         """Service for instances in beaver API."""
-        return BeaverInstancesService(self.client)
+        return self._instances
+
+    @property
+    def schedule(self) -> BeaverScheduleService:
+        """Service for schedule in beaver API."""
+        return self._schedule
@@ -0,0 +1,30 @@
+from octopus.models.base import datamodel
+from octopus.services.events.service import EventsService
+from octopus.services.latency.service import LatencyService
+from octopus.services.ping.service import PingService
+from octopus.services.stats.service import StatsService
+from octopus.services.streaming.service import StreamingService
+from octopus.services.test.service import TestService
+
+
+@datamodel
+class Services:
+    """Services built once at startup and shared by all requests."""
+
+    events: EventsService
+    """Service for events."""
+
+    latency: LatencyService
+    """Service for choosing latency of streams."""
+
+    ping: PingService
+    """Service for pings."""
+
+    stats: StatsService
+    """Service for statistics of streams."""
+
+    streaming: StreamingService
+    """Service to manage streaming."""
+
+    test: TestService
+    """Service for tests."""
@@ -0,0 +1,141 @@
+import asyncio
+from collections.abc import AsyncGenerator, Iterable
+from contextlib import suppress
+from datetime import timedelta
+from pathlib import Path
+from typing import override
+
+from litestar.channels.backends.base import ChannelsBackend
+from litestar.channels.backends.memory import MemoryChannelsBackend
+
+from octopus.services.events.frames import FrameEncoder
+from octopus.services.events.history import EventsHistory, HistoryEntry
+from octopus.services.events.hub import HubProtocol
+
+
+class MemoryEventsBackend(MemoryChannelsBackend):
+    """Channels backend for events published within a single process.
+
+    The history of the base backend is not used,
+    events are recorded in the history of recent events instead.
+
+    Assigns identifiers to events as they are delivered
+    and records them in the history.
+
+    Args:
+        history: History of recent events.
+
+    """
+
+    def __init__(self, history: EventsHistory) -> None:
+        super().__init__()
+        self._recent = history
+        self._encoder = FrameEncoder()
+
+    @override
+    async def unsubscribe(self, channels: Iterable[str]) -> None:
+        # Keep receiving events without subscribers, so that the history is complete
+        return
+
+    @override
+    async def stream_events(self) -> AsyncGenerator[tuple[str, bytes]]:
+        async for channel, frame in super().stream_events():
+            event_id = self._recent.next()
+            entry = HistoryEntry(
+                id=event_id, frame=self._encoder.identify(frame, event_id)
+            )
+            self._recent.record(channel, entry)
+            yield channel, entry.frame
+
+
+class HubEventsBackend(ChannelsBackend):
+    """Channels backend for events broadcast between workers by a hub.
+
+    Events get their identifiers from the hub,
+    so they are the same in all workers,
+    and are recorded in the history of each worker.
+
+    Args:
+        path: Path of the Unix socket of the hub.
+        history: History of recent events.
+        timeout: Time to wait for the hub to become available.
+
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        history: EventsHistory,
+        timeout: timedelta = timedelta(seconds=10),
+    ) -> None:
+        self._path = path
+        self._recent = history
+        self._timeout = timeout
+        self._encoder = FrameEncoder()
+        self._protocol = HubProtocol()
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def _connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        async with asyncio.timeout(self._timeout.total_seconds()):
+            while True:
+                try:
+                    return await asyncio.open_unix_connection(self._path)
+                except (FileNotFoundError, ConnectionRefusedError):
+                    # The hub might still be starting
+                    await asyncio.sleep(0.1)
+
+    @override
+    async def on_startup(self) -> None:
+        self._reader, self._writer = await self._connect()
+
+    @override
+    async def on_shutdown(self) -> None:
+        writer, self._reader, self._writer = self._writer, None, None
+
+        if writer is not None:
+            writer.close()
+
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    @override
+    async def publish(self, data: bytes, channels: Iterable[str]) -> None:
+        if self._writer is None:
+            msg = "Backend not yet initialized."
+            raise RuntimeError(msg)
+
+        for channel in channels:
+            self._writer.write(self._protocol.encode([channel.encode(), data]))
+
+        await self._writer.drain()
+
+    @override
+    async def subscribe(self, channels: Iterable[str]) -> None:
+        # The hub sends events of all channels to every worker
+        return
+
+    @override
+    async def unsubscribe(self, channels: Iterable[str]) -> None:
+        # Keep receiving events without subscribers, so that the history is complete
+        return
+
+    @override
+    async def stream_events(self) -> AsyncGenerator[tuple[str, bytes]]:
+        if self._reader is None:
+            msg = "Backend not yet initialized."
+            raise RuntimeError(msg)
+
+        while (message := await self._protocol.read(self._reader)) is not None:
+            channel, identifier, frame = message
+            event_id = int(identifier)
+            entry = HistoryEntry(
+                id=event_id, frame=self._encoder.identify(frame, event_id)
+            )
+            self._recent.record(channel.decode(), entry)
+            yield channel.decode(), entry.frame
+
+    @override
+    async def get_history(self, channel: str, limit: int | None = None) -> list[bytes]:
+        # History is kept in the history of events instead
+        return []
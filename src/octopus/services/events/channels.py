@@ -0,0 +1,27 @@
+from collections.abc import Sequence
+from collections.abc import Set as AbstractSet
+
+from octopus.models.events.enums import EventType
+
+
+class EventChannels:
+    """Names of the channels that events are published to.
+
+    Each type of event has its own channel,
+    so subscribers receive only the events they asked for.
+    """
+
+    def get(self, kind: EventType) -> str:
+        """Get the channel for a type of events."""
+        return f"events:{kind}"
+
+    def all(self) -> Sequence[str]:
+        """Get the channels for all types of events."""
+        return [self.get(kind) for kind in EventType]
+
+    def of(self, types: AbstractSet[EventType] | None) -> Sequence[str]:
+        """Get the channels for the given types of events or all if None."""
+        if types is None:
+            return self.all()
+
+        return [self.get(kind) for kind in EventType if kind in types]
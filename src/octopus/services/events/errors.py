@@ -1,2 +1,21 @@
+from datetime import timedelta
+
+
 class ServiceError(Exception):
     """Base class for service errors."""
+
+
+class TooManyConnectionsError(ServiceError):
+    """Raised when the limit of connections is reached."""
+
+    def __init__(self, limit: int, retry: timedelta) -> None:
+        super().__init__(f"Limit of {limit} connections reached.")
+        self.retry = retry
+
+
+class TooManyClientConnectionsError(ServiceError):
+    """Raised when the limit of connections from a single client is reached."""
+
+    def __init__(self, client: str, limit: int, retry: timedelta) -> None:
+        super().__init__(f"Limit of {limit} connections from {client} reached.")
+        self.retry = retry
@@ -0,0 +1,46 @@
+from datetime import timedelta
+
+from litestar.response import ServerSentEventMessage
+from pydantic import TypeAdapter
+
+from octopus.models.events.types import Event
+
+
+class FrameEncoder:
+    """Encoder of events into Server-Sent Events frames."""
+
+    def encode(self, event: Event) -> bytes:
+        """Encode an event into a frame without an identifier."""
+        return ServerSentEventMessage(
+            data=event.model_dump_json(round_trip=True)
+        ).encode()
+
+    def identify(self, frame: bytes, id: int) -> bytes:  # noqa: A002
+        """Add an identifier to a frame without one."""
+        # The identifier goes first, just like in frames encoded with one
+        return f"id: {id}\r\n".encode() + frame
+
+    def heartbeat(self) -> bytes:
+        """Encode a heartbeat comment into a frame."""
+        return ServerSentEventMessage(data=None, comment="heartbeat").encode()
+
+    def retry(self, retry: timedelta) -> bytes:
+        """Encode a hint on how long to wait before reconnecting into a frame."""
+        return ServerSentEventMessage(
+            data=None, retry=round(retry.total_seconds() * 1000)
+        ).encode()
+
+
+class FrameParser:
+    """Parser of Server-Sent Events frames produced by the encoder."""
+
+    _adapter = TypeAdapter[Event](Event)
+
+    def id(self, frame: bytes) -> int:
+        """Get the identifier of the event in the frame."""
+        return int(frame[len(b"id: ") : frame.index(b"\r\n")])
+
+    def event(self, frame: bytes) -> Event:
+        """Get the event in the frame."""
+        start = frame.index(b"data: ") + len(b"data: ")
+        return self._adapter.validate_json(frame[start : frame.index(b"\r\n", start)])
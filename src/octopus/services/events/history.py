@@ -0,0 +1,150 @@
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Sequence
+
+from octopus.config.models import EventsReplayConfig
+from octopus.models.base import datamodel
+from octopus.services.events.frames import FrameEncoder
+
+type SnapshotProvider = Callable[[], bytes | None]
+"""Provider of a frame without an identifier with the current state of a channel."""
+
+
+@datamodel
+class HistoryEntry:
+    """Entry in the history of events."""
+
+    id: int
+    """Identifier of the event."""
+
+    frame: bytes
+    """Server-Sent Events frame with the event."""
+
+
+class ChannelHistory:
+    """Bounded history of recent events published to a single channel.
+
+    Args:
+        size: Maximum number of entries to keep.
+        floor: Identifier after which all events are kept.
+
+    """
+
+    def __init__(self, size: int, floor: int) -> None:
+        self._entries = deque[HistoryEntry](maxlen=size)
+        self._floor = floor
+
+    @property
+    def floor(self) -> int:
+        """Identifier after which all events are still in the history."""
+        return self._floor
+
+    def append(self, entry: HistoryEntry) -> None:
+        """Append an entry, evicting the oldest one if the history is full."""
+        if len(self._entries) == self._entries.maxlen:
+            self._floor = self._entries[0].id if self._entries else entry.id
+
+        self._entries.append(entry)
+
+    def latest(self) -> HistoryEntry | None:
+        """Get the most recent entry."""
+        return self._entries[-1] if self._entries else None
+
+    def since(self, after: int) -> Sequence[HistoryEntry]:
+        """Get all entries after the given identifier."""
+        entries = list[HistoryEntry]()
+
+        for entry in reversed(self._entries):
+            if entry.id <= after:
+                break
+
+            entries.append(entry)
+
+        entries.reverse()
+        return entries
+
+
+class EventsHistory:
+    """History of recent events used to replay events missed by subscribers.
+
+    Identifiers of events are monotonically increasing.
+    They are never lower than the current time in microseconds,
+    so they keep increasing across restarts of the service.
+
+    Args:
+        config: Configuration for replaying events.
+
+    """
+
+    def __init__(self, config: EventsReplayConfig) -> None:
+        self._config = config
+        self._start = time.time_ns() // 1000
+        self._last = self._start
+        self._channels: dict[str, ChannelHistory] = {}
+        self._providers: dict[str, SnapshotProvider] = {}
+        self._encoder = FrameEncoder()
+
+    @property
+    def last(self) -> int:
+        """Identifier of the most recent event."""
+        return self._last
+
+    def _get_channel(self, channel: str) -> ChannelHistory:
+        if channel not in self._channels:
+            self._channels[channel] = ChannelHistory(
+                size=self._config.size, floor=self._start
+            )
+
+        return self._channels[channel]
+
+    def next(self) -> int:
+        """Generate an identifier for a new event."""
+        self._last = max(self._last + 1, time.time_ns() // 1000)
+        return self._last
+
+    def provide(self, channel: str, provider: SnapshotProvider) -> None:
+        """Register a provider of the current state of a channel.
+
+        The state is sent instead of the latest event
+        when some events published to the channel might have been missed.
+        """
+        self._providers[channel] = provider
+
+    def _snapshot(self, channel: str) -> HistoryEntry | None:
+        provider = self._providers.get(channel)
+        if provider is None or (frame := provider()) is None:
+            return self._get_channel(channel).latest()
+
+        # The snapshot reflects all events published so far
+        return HistoryEntry(
+            id=self._last, frame=self._encoder.identify(frame, self._last)
+        )
+
+    def record(self, channel: str, entry: HistoryEntry) -> None:
+        """Record an event published to a channel.
+
+        Identifiers might also come from elsewhere, e.g. from other workers.
+        """
+        self._get_channel(channel).append(entry)
+        self._last = max(self._last, entry.id)
+
+    def _replay_channel(self, channel: str, after: int) -> Sequence[HistoryEntry]:
+        history = self._get_channel(channel)
+
+        # If some events might have been missed, send a snapshot of the current state
+        # It is available even if nothing was published since the start of the service
+        if after < history.floor or after > self._last:
+            snapshot = self._snapshot(channel)
+            return [snapshot] if snapshot is not None else []
+
+        return history.since(after)
+
+    def replay(self, channels: Iterable[str], after: int) -> Sequence[HistoryEntry]:
+        """Get events from the channels published after the given identifier."""
+        entries = [
+            entry
+            for channel in channels
+            for entry in self._replay_channel(channel, after)
+        ]
+
+        return sorted(entries, key=lambda entry: entry.id)
@@ -0,0 +1,117 @@
+import asyncio
+import struct
+import time
+from collections.abc import Sequence
+from contextlib import suppress
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+
+class HubProtocol:
+    """Protocol of messages exchanged with the hub.
+
+    Each message is a sequence of parts,
+    each prefixed with its length.
+    """
+
+    _count = struct.Struct("!H")
+    _length = struct.Struct("!I")
+
+    def encode(self, parts: Sequence[bytes]) -> bytes:
+        """Encode parts into a message."""
+        return self._count.pack(len(parts)) + b"".join(
+            self._length.pack(len(part)) + part for part in parts
+        )
+
+    async def read(self, reader: asyncio.StreamReader) -> Sequence[bytes] | None:
+        """Read a message or return None if the connection was closed."""
+        try:
+            (count,) = self._count.unpack(await reader.readexactly(self._count.size))
+
+            parts = list[bytes]()
+            for _ in range(count):
+                (length,) = self._length.unpack(
+                    await reader.readexactly(self._length.size)
+                )
+                parts.append(await reader.readexactly(length))
+        except asyncio.IncompleteReadError:
+            return None
+
+        return parts
+
+
+class EventsHub:
+    """Hub that broadcasts events between workers over a Unix socket.
+
+    Workers send events as channel and frame pairs.
+    The hub assigns identifiers to the events
+    and sends them to all workers, including the one that published them,
+    so every worker sees the same events in the same order with the same identifiers.
+
+    Args:
+        path: Path of the Unix socket to listen on.
+
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._protocol = HubProtocol()
+        self._last = time.time_ns() // 1000
+        self._writers = set[asyncio.StreamWriter]()
+        self._server: asyncio.Server | None = None
+
+    async def __aenter__(self) -> Self:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._server = await asyncio.start_unix_server(self._handle, self._path)
+        return self
+
+    async def __aexit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        server, self._server = self._server, None
+
+        if server is not None:
+            server.close()
+
+            for writer in self._writers:
+                writer.close()
+
+            await server.wait_closed()
+
+    def _next(self) -> int:
+        self._last = max(self._last + 1, time.time_ns() // 1000)
+        return self._last
+
+    async def _broadcast(self, channel: bytes, frame: bytes) -> None:
+        message = self._protocol.encode([channel, str(self._next()).encode(), frame])
+
+        writers = list(self._writers)
+        for writer in writers:
+            writer.write(message)
+
+        # Connections that fail are cleaned up by their handlers
+        await asyncio.gather(
+            *(writer.drain() for writer in writers), return_exceptions=True
+        )
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._writers.add(writer)
+
+        try:
+            while (message := await self._protocol.read(reader)) is not None:
+                channel, frame = message
+                await self._broadcast(channel, frame)
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+            with suppress(ConnectionError):
+                await writer.wait_closed()
@@ -1,11 +1,58 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable, Sequence
 from collections.abc import Set as AbstractSet
+from datetime import datetime
+from uuid import UUID
 
 from octopus.models.base import datamodel
 from octopus.models.events.enums import EventType
 from octopus.models.events.types import Event
 
 
+@datamodel
+class PublishRequest:
+    """Request to publish."""
+
+    event: Event
+    """Event to publish."""
+
+
+@datamodel
+class PublishResponse:
+    """Response for publish."""
+
+
+@datamodel
+class ProvideRequest:
+    """Request to provide."""
+
+    type: EventType
+    """Type of events to provide a snapshot for."""
+
+    snapshot: Callable[[], Event | None]
+    """Function that returns an event with the current state or None if unknown."""
+
+
+@datamodel
+class ProvideResponse:
+    """Response for provide."""
+
+
+@datamodel
+class ListenRequest:
+    """Request to listen."""
+
+    types: AbstractSet[EventType] | None = None
+    """Types of events to listen to."""
+
+
+@datamodel
+class ListenResponse:
+    """Response for listen."""
+
+    events: AsyncIterator[Event]
+    """Stream of events."""
+
+
 @datamodel
 class SubscribeRequest:
     """Request to subscribe."""
@@ -13,10 +60,66 @@ class SubscribeRequest:
     types: AbstractSet[EventType] | None = None
     """Types of events to subscribe to."""
 
+    last_event_id: int | None = None
+    """Identifier of the last event received by the subscriber."""
+
+    client: str | None = None
+    """Address of the client."""
+
 
 @datamodel
 class SubscribeResponse:
     """Response for subscribe."""
 
-    events: AsyncIterator[Event]
-    """Stream of events."""
+    frames: AsyncIterator[bytes]
+    """Stream of Server-Sent Events frames with events."""
+
+
+@datamodel
+class SubscriberStats:
+    """Statistics of a subscriber."""
+
+    backlog: int
+    """Number of events waiting to be sent."""
+
+    peak: int
+    """Maximum number of events that were waiting to be sent at once."""
+
+    dropped: int
+    """Number of events dropped because the backlog was full."""
+
+    resyncs: int
+    """Number of times the subscriber had to catch up from the history of events."""
+
+
+@datamodel
+class ConnectionStats:
+    """Statistics of a connection."""
+
+    id: UUID
+    """Identifier of the connection."""
+
+    client: str | None
+    """Address of the client."""
+
+    opened_at: datetime
+    """Datetime in UTC at which the connection was opened."""
+
+    subscriber: SubscriberStats | None
+    """Statistics of the subscriber or None if not subscribed yet."""
+
+
+@datamodel
+class StatsRequest:
+    """Request to get statistics."""
+
+
+@datamodel
+class StatsResponse:
+    """Response for getting statistics."""
+
+    count: int
+    """Number of active connections."""
+
+    connections: Sequence[ConnectionStats]
+    """Statistics of active connections."""
@@ -0,0 +1,147 @@
+import math
+import random
+import time
+from collections import Counter
+from collections.abc import Sequence
+from datetime import timedelta
+from uuid import UUID, uuid4
+
+from octopus.config.models import EventsConnectionsConfig
+from octopus.services.events import errors as e
+from octopus.services.events import models as m
+from octopus.services.events.subscriber import EventsSubscriber  # noqa: TC001
+from octopus.utils.time import awareutcnow
+
+
+class Connection:
+    """Connection of a subscriber to events.
+
+    Args:
+        config: Configuration for connections.
+        client: Address of the client.
+
+    """
+
+    def __init__(self, config: EventsConnectionsConfig, client: str | None) -> None:
+        self._config = config
+        self.id = uuid4()
+        self.client = client
+        self.opened_at = awareutcnow()
+        self.subscriber: EventsSubscriber | None = None
+        self._opened = time.monotonic()
+        self._received = self._opened
+        self._sent = self._opened
+
+    @property
+    def stats(self) -> m.ConnectionStats:
+        """Statistics of the connection."""
+        return m.ConnectionStats(
+            id=self.id,
+            client=self.client,
+            opened_at=self.opened_at,
+            subscriber=self.subscriber.stats if self.subscriber else None,
+        )
+
+    def _deadlines(self) -> list[float]:
+        deadlines = [self._sent + self._config.heartbeat.total_seconds()]
+
+        if self._config.idle is not None:
+            deadlines.append(self._received + self._config.idle.total_seconds())
+
+        if self._config.lifetime is not None:
+            deadlines.append(self._opened + self._config.lifetime.total_seconds())
+
+        return deadlines
+
+    def timeout(self) -> float:
+        """Get the number of seconds to wait for an event before checking again."""
+        return max(min(self._deadlines()) - time.monotonic(), 0)
+
+    def received(self) -> None:
+        """Mark that an event was sent to the client."""
+        self._received = self._sent = time.monotonic()
+
+    def heartbeat(self) -> None:
+        """Mark that a heartbeat was sent to the client."""
+        self._sent = time.monotonic()
+
+    def expired(self) -> bool:
+        """Check if the connection is idle or open for too long."""
+        now = time.monotonic()
+
+        return (
+            self._config.idle is not None
+            and now - self._received >= self._config.idle.total_seconds()
+        ) or (
+            self._config.lifetime is not None
+            and now - self._opened >= self._config.lifetime.total_seconds()
+        )
+
+
+class ConnectionsRegistry:
+    """Registry of active connections of subscribers to events.
+
+    Each worker process has its own registry,
+    so limits of connections are split evenly between workers.
+
+    Args:
+        config: Configuration for connections.
+        workers: Number of worker processes that share the limits.
+
+    """
+
+    def __init__(self, config: EventsConnectionsConfig, workers: int = 1) -> None:
+        self._config = config
+        self._limit = self._share(config.limit, workers)
+        self._client = self._share(config.client, workers)
+        self._connections: dict[UUID, Connection] = {}
+        self._clients = Counter[str]()
+
+    def _share(self, limit: int | None, workers: int) -> int | None:
+        # Rounding up lets every worker accept at least one connection
+        return math.ceil(limit / workers) if limit is not None else None
+
+    @property
+    def count(self) -> int:
+        """Number of active connections."""
+        return len(self._connections)
+
+    def retry(self) -> timedelta:
+        """Get a time for a client to wait before reconnecting, spread by jitter."""
+        return self._config.retry + self._config.jitter * random.random()  # noqa: S311
+
+    def _check(self, client: str | None) -> None:
+        limit = self._limit
+        if limit is not None and self.count >= limit:
+            raise e.TooManyConnectionsError(limit, self.retry())
+
+        limit = self._client
+        if client is not None and limit is not None and self._clients[client] >= limit:
+            raise e.TooManyClientConnectionsError(client, limit, self.retry())
+
+    def open(self, client: str | None) -> Connection:
+        """Open a connection if the limits allow it."""
+        self._check(client)
+
+        connection = Connection(self._config, client)
+        self._connections[connection.id] = connection
+
+        if client is not None:
+            self._clients[client] += 1
+
+        return connection
+
+    def close(self, connection: Connection) -> None:
+        """Close a connection. Closing the same connection again has no effect."""
+        if self._connections.pop(connection.id, None) is None:
+            return
+
+        if connection.client is not None:
+            self._clients[connection.client] -= 1
+
+            if self._clients[connection.client] <= 0:
+                del self._clients[connection.client]
+
+    def stats(self) -> Sequence[m.ConnectionStats]:
+        """Get statistics of all active connections."""
+        return [connection.stats for connection in self._connections.values()]
@@ -1,32 +1,154 @@
-from collections.abc import AsyncGenerator
+import asyncio
+import weakref
+from collections.abc import AsyncGenerator, Callable, Sequence
 from collections.abc import Set as AbstractSet
+from functools import partial
+from typing import cast
 
 from litestar.channels import ChannelsPlugin
 
-from octopus.models.base import Serializable
 from octopus.models.events.enums import EventType
 from octopus.models.events.types import Event
 from octopus.services.events import models as m
+from octopus.services.events.channels import EventChannels
+from octopus.services.events.frames import FrameEncoder, FrameParser
+from octopus.services.events.history import EventsHistory
+from octopus.services.events.registry import Connection, ConnectionsRegistry
+from octopus.services.events.subscriber import RESYNC, EventsSubscriber
 
 
 class EventsService:
     """Service for events."""
 
-    def __init__(self, channels: ChannelsPlugin) -> None:
+    def __init__(
+        self,
+        channels: ChannelsPlugin,
+        history: EventsHistory,
+        connections: ConnectionsRegistry,
+    ) -> None:
         self._channels = channels
+        self._history = history
+        self._connections = connections
+        self._names = EventChannels()
+        self._encoder = FrameEncoder()
+        self._parser = FrameParser()
+
+    async def publish(self, request: m.PublishRequest) -> m.PublishResponse:
+        """Publish an app event."""
+        channel = self._names.get(request.event.type)
+
+        # Identifiers are assigned by the backend in the order events are delivered
+        self._channels.publish(self._encoder.encode(request.event), channel)
+
+        return m.PublishResponse()
+
+    def _provide(self, snapshot: Callable[[], Event | None]) -> bytes | None:
+        event = snapshot()
+        return self._encoder.encode(event) if event is not None else None
+
+    async def provide(self, request: m.ProvideRequest) -> m.ProvideResponse:
+        """Provide snapshots of the current state for missed events of a type."""
+        channel = self._names.get(request.type)
+        self._history.provide(channel, partial(self._provide, request.snapshot))
+
+        return m.ProvideResponse()
+
+    async def _listen(self, names: Sequence[str]) -> AsyncGenerator[Event]:
+        async with self._channels.start_subscription(names) as subscriber:
+            subscriber = cast("EventsSubscriber", subscriber)
+            position = self._history.last
+
+            while (received := await subscriber.receive()) is not None:
+                # Events dropped from the backlog are caught up from the history
+                frames = (
+                    [entry.frame for entry in self._history.replay(names, position)]
+                    if received == RESYNC
+                    else [received]
+                )
+
+                for frame in frames:
+                    if (event_id := self._parser.id(frame)) > position:
+                        position = event_id
+                        yield self._parser.event(frame)
+
+    async def listen(self, request: m.ListenRequest) -> m.ListenResponse:
+        """Listen to app events from all workers from within the app."""
+        events = self._listen(self._names.of(request.types))
+        return m.ListenResponse(events=events)
+
+    async def _stream(
+        self,
+        connection: Connection,
+        subscriber: EventsSubscriber,
+        names: Sequence[str],
+        last_event_id: int | None,
+    ) -> AsyncGenerator[bytes]:
+        # Events up to this position were either replayed or already seen
+        position = self._history.last
+
+        if last_event_id is not None:
+            for entry in self._history.replay(names, last_event_id):
+                yield entry.frame
+
+        while not connection.expired():
+            try:
+                async with asyncio.timeout(connection.timeout()):
+                    frame = await subscriber.receive()
+            except TimeoutError:
+                if not connection.expired():
+                    connection.heartbeat()
+                    yield self._encoder.heartbeat()
+
+                continue
+
+            if frame is None:
+                break
+
+            if frame == RESYNC:
+                for entry in self._history.replay(names, position):
+                    connection.received()
+                    yield entry.frame
+
+                position = self._history.last
+            elif (event_id := self._parser.id(frame)) > position:
+                position = event_id
+                connection.received()
+                yield frame
+
+        # Spread reconnections of evicted clients in time
+        yield self._encoder.retry(self._connections.retry())
 
     async def _subscribe(
-        self, types: AbstractSet[EventType] | None
-    ) -> AsyncGenerator[Event]:
-        subscription = self._channels.start_subscription("events")
+        self,
+        connection: Connection,
+        types: AbstractSet[EventType] | None,
+        last_event_id: int | None,
+    ) -> AsyncGenerator[bytes]:
+        names = self._names.of(types)
 
-        async with subscription as subscriber:
-            async for data in subscriber.iter_events():
-                event = Serializable[Event].model_validate_json(data).root
+        try:
+            async with self._channels.start_subscription(names) as subscriber:
+                connection.subscriber = cast("EventsSubscriber", subscriber)
 
-                if types is None or event.type in types:
-                    yield event
+                async for frame in self._stream(
+                    connection, connection.subscriber, names, last_event_id
+                ):
+                    yield frame
+        finally:
+            self._connections.close(connection)
 
     async def subscribe(self, request: m.SubscribeRequest) -> m.SubscribeResponse:
         """Subscribe to app events."""
-        return m.SubscribeResponse(events=self._subscribe(request.types))
+        connection = self._connections.open(request.client)
+        frames = self._subscribe(connection, request.types, request.last_event_id)
+
+        # Release the connection even if the stream is never started
+        weakref.finalize(frames, self._connections.close, connection)
+
+        return m.SubscribeResponse(frames=frames)
+
+    async def stats(self, request: m.StatsRequest) -> m.StatsResponse:
+        """Get statistics of active connections."""
+        return m.StatsResponse(
+            count=self._connections.count, connections=self._connections.stats()
+        )
@@ -0,0 +1,112 @@
+from typing import Self, cast
+
+from litestar.channels import ChannelsPlugin, Subscriber
+from litestar.channels.subscriber import AsyncDeque, BacklogStrategy
+
+from octopus.config.models import EventsBacklogConfig
+from octopus.services.events import models as m
+
+RESYNC = b""
+"""Marker telling the consumer to catch up from the history of events."""
+
+
+class EventsSubscriber(Subscriber):
+    """Subscriber with a bounded backlog of events.
+
+    When the backlog is full, the configured policy decides what happens:
+
+    - `drop-oldest` drops the oldest waiting event,
+    - `coalesce` drops all waiting events
+      and lets the consumer catch up from the history of events,
+    - `disconnect` drops all waiting events and ends the stream.
+    """
+
+    config = EventsBacklogConfig()
+
+    def __init__(
+        self,
+        plugin: ChannelsPlugin,
+        max_backlog: int | None = None,
+        backlog_strategy: BacklogStrategy = "backoff",
+    ) -> None:
+        super().__init__(plugin, max_backlog, backlog_strategy)
+
+        # The bound is enforced here, so the end of the stream can always be signalled
+        self._queue = AsyncDeque[bytes | None](maxsize=None)
+        self._peak = 0
+        self._dropped = 0
+        self._resyncs = 0
+        self._closed = False
+
+    @classmethod
+    def configured(cls, config: EventsBacklogConfig) -> type[Self]:
+        """Create a subclass with the given configuration."""
+        return cast("type[Self]", type(cls.__name__, (cls,), {"config": config}))
+
+    @property
+    def stats(self) -> m.SubscriberStats:
+        """Statistics of the subscriber."""
+        return m.SubscriberStats(
+            backlog=self.qsize,
+            peak=self._peak,
+            dropped=self._dropped,
+            resyncs=self._resyncs,
+        )
+
+    def _drop_oldest(self) -> None:
+        self._queue.get_nowait()
+        self._queue.task_done()
+        self._dropped += 1
+
+    def _drop_all(self) -> None:
+        while not self._queue.empty():
+            self._drop_oldest()
+
+    def _overflow(self) -> bool:
+        """Apply the policy to a full backlog and tell if a new item still fits."""
+        match self.config.policy:
+            case "drop-oldest":
+                self._drop_oldest()
+                return True
+            case "coalesce":
+                self._drop_all()
+                self._dropped += 1
+                self._resyncs += 1
+                self._queue.put_nowait(RESYNC)
+                return False
+            case "disconnect":
+                self._drop_all()
+                self._dropped += 1
+                self._closed = True
+                self._queue.put_nowait(None)
+                return False
+
+    async def receive(self) -> bytes | None:
+        """Wait for the next item in the subscriber's stream.
+
+        None means the end of the stream.
+        Cancelling the wait does not lose any items.
+        """
+        item = await self._queue.get()
+        self._queue.task_done()
+        return item
+
+    async def put(self, item: bytes | None) -> None:
+        """Put an item in the subscriber's stream without blocking."""
+        self.put_nowait(item)
+
+    def put_nowait(self, item: bytes | None) -> bool:
+        """Put an item in the subscriber's stream, applying the policy if full."""
+        if item is None:
+            self._queue.put_nowait(None)
+            return True
+
+        if self._closed:
+            return False
+
+        if self.qsize >= self.config.size and not self._overflow():
+            return False
+
+        self._queue.put_nowait(item)
+        self._peak = max(self._peak, self.qsize)
+        return True
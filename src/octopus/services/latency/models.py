@@ -0,0 +1,49 @@
+from collections.abc import Sequence
+from datetime import timedelta
+from uuid import UUID
+
+from octopus.models.base import datamodel
+from octopus.services.stats import models as stm
+
+
+@datamodel
+class Latency:
+    """Latency for buffering a stream."""
+
+    ingest: timedelta | None
+    """Latency of the connection from the broadcaster or None for the default."""
+
+    egress: timedelta
+    """Latency of the connection to the dingo service."""
+
+
+@datamodel
+class ChooseRequest:
+    """Request to choose latency for a stream."""
+
+    event: UUID
+    """Identifier of the event that the stream is for."""
+
+
+@datamodel
+class ChooseResponse:
+    """Response for choosing latency for a stream."""
+
+    latency: Latency
+    """Chosen latency."""
+
+
+@datamodel
+class ObserveRequest:
+    """Request to observe how a stream went."""
+
+    event: UUID
+    """Identifier of the event that the stream was for."""
+
+    samples: Sequence[stm.Sample]
+    """Samples of statistics of the stream."""
+
+
+@datamodel
+class ObserveResponse:
+    """Response for observing how a stream went."""
@@ -0,0 +1,103 @@
+from collections import OrderedDict, deque
+from collections.abc import Sequence
+from datetime import timedelta
+from itertools import pairwise
+from uuid import UUID
+
+from octopus.config.models import Config
+from octopus.services.latency import models as m
+from octopus.services.stats import models as stm
+
+
+class LatencyService:
+    """Service for choosing latency of streams based on how previous streams went.
+
+    Latency is multiplied up after streams with dropouts
+    and slowly brought back down after streams without them,
+    always staying between the configured floor and ceiling.
+
+    A dropout is an interval between two samples
+    in which the audio advanced slower than real time by more than the allowed lag.
+    The cumulative speed reported by ffmpeg is not used,
+    because it averages over the whole stream and hides stalls late in it.
+
+    Ingest latency is tracked for each event,
+    because its broadcasters usually connect from the same network every time.
+    Only the most recently streamed events are remembered.
+    Egress latency is shared by all streams, because they all go to dingo,
+    so it is raised only if all recent streams had dropouts.
+    """
+
+    def __init__(self, config: Config) -> None:
+        self._config = config
+        self._ingest = OrderedDict[UUID, timedelta]()
+        self._egress = self._initial()
+        self._recent = deque[float](maxlen=config.latency.window)
+
+    def _clamp(self, latency: timedelta) -> timedelta:
+        config = self._config.latency
+        return min(max(latency, config.floor), config.ceiling)
+
+    def _initial(self) -> timedelta:
+        return self._clamp(self._config.streaming.latency)
+
+    def _measure_speeds(self, samples: Sequence[stm.Sample]) -> Sequence[float]:
+        timed = [
+            (sample.sampled_at, sample.duration)
+            for sample in samples
+            if sample.duration is not None
+        ]
+
+        speeds = []
+        for (start, streamed), (end, total) in pairwise(timed):
+            # Samples taken at the same time say nothing about the speed
+            if end <= start:
+                continue
+
+            speeds.append((total - streamed) / (end - start))
+
+        return speeds
+
+    def _measure_dropouts(self, samples: Sequence[stm.Sample]) -> float | None:
+        speeds = self._measure_speeds(samples)
+        if not speeds:
+            return None
+
+        dropouts = sum(1 for speed in speeds if speed < self._config.latency.lag)
+        return dropouts / len(speeds)
+
+    def _adjust(self, latency: timedelta, dropouts: float) -> timedelta:
+        config = self._config.latency
+
+        factor = config.increase if dropouts > config.tolerance else config.decrease
+        return self._clamp(latency * factor)
+
+    async def choose(self, request: m.ChooseRequest) -> m.ChooseResponse:
+        """Choose latency for a stream."""
+        if not self._config.latency.adaptive:
+            # Listener keeps the default latency of ffmpeg, like before adaptation
+            latency = m.Latency(ingest=None, egress=self._config.streaming.latency)
+            return m.ChooseResponse(latency=latency)
+
+        ingest = self._ingest.get(request.event, self._initial())
+        return m.ChooseResponse(latency=m.Latency(ingest=ingest, egress=self._egress))
+
+    async def observe(self, request: m.ObserveRequest) -> m.ObserveResponse:
+        """Observe how a stream went to adapt latency of later streams."""
+        if (dropouts := self._measure_dropouts(request.samples)) is None:
+            return m.ObserveResponse()
+
+        ingest = self._ingest.pop(request.event, self._initial())
+        self._ingest[request.event] = self._adjust(ingest, dropouts)
+
+        # Events that weren't streamed for a long time fall back to the initial latency
+        if len(self._ingest) > self._config.latency.events:
+            self._ingest.popitem(last=False)
+
+        self._recent.append(dropouts)
+
+        # Dropouts of a single broadcaster shouldn't slow down everyone else
+        shared = min(self._recent) if len(self._recent) == self._recent.maxlen else 0.0
+        self._egress = self._adjust(self._egress, shared)
+
+        return m.ObserveResponse()
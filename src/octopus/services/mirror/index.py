@@ -0,0 +1,81 @@
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Hashable, Iterator
+from datetime import datetime, timedelta
+
+from octopus.models.base import datamodel
+
+
+@datamodel
+class IndexEntry[V]:
+    """Entry of an interval index."""
+
+    start: datetime
+    """Start of the interval."""
+
+    end: datetime
+    """End of the interval."""
+
+    value: V
+    """Value associated with the interval."""
+
+
+class IntervalIndex[K: Hashable, V]:
+    """Index of intervals sorted by their start.
+
+    Supports lookups by key and queries for intervals at or around a given time.
+    """
+
+    def __init__(self) -> None:
+        self._entries = dict[K, IndexEntry[V]]()
+        self._starts = list[tuple[datetime, K]]()
+        self._longest = timedelta()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._entries)
+
+    def get(self, key: K) -> IndexEntry[V] | None:
+        """Get the entry for the key."""
+        return self._entries.get(key)
+
+    def upsert(self, key: K, entry: IndexEntry[V]) -> None:
+        """Insert or replace the entry for the key."""
+        if (current := self._entries.get(key)) is not None:
+            if current == entry:
+                return
+
+            self.remove(key)
+
+        self._entries[key] = entry
+        insort(self._starts, (entry.start, key))
+        self._longest = max(self._longest, entry.end - entry.start)
+
+    def remove(self, key: K) -> None:
+        """Remove the entry for the key if it exists."""
+        entry = self._entries.pop(key, None)
+
+        if entry is None:
+            return
+
+        index = bisect_left(self._starts, (entry.start, key))
+        del self._starts[index]
+
+        if not self._entries:
+            self._longest = timedelta()
+
+    def at(self, time: datetime) -> list[IndexEntry[V]]:
+        """Get entries with intervals that contain the given time."""
+        lower = bisect_left(self._starts, time - self._longest, key=lambda x: x[0])
+        upper = bisect_right(self._starts, time, key=lambda x: x[0])
+
+        entries = (self._entries[key] for _, key in self._starts[lower:upper])
+        return [entry for entry in entries if entry.start <= time < entry.end]
+
+    def around(self, time: datetime, tolerance: timedelta) -> list[IndexEntry[V]]:
+        """Get entries with intervals that start close to the given time."""
+        lower = bisect_left(self._starts, time - tolerance, key=lambda x: x[0])
+        upper = bisect_right(self._starts, time + tolerance, key=lambda x: x[0])
+
+        return [self._entries[key] for _, key in self._starts[lower:upper]]
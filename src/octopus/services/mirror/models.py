@@ -0,0 +1,24 @@
+from datetime import datetime
+from uuid import UUID
+
+from octopus.models.base import datamodel
+from octopus.services.apis.beaver import models as bm
+
+
+@datamodel
+class GetRequest:
+    """Request to get a mirrored instance."""
+
+    event: UUID
+    """Identifier of the event the instance belongs to."""
+
+    start: datetime
+    """Start datetime of the instance in event timezone."""
+
+
+@datamodel
+class GetResponse:
+    """Response for getting a mirrored instance."""
+
+    instance: bm.InstanceWithEventWithShow | None
+    """Mirrored instance or None if it is not mirrored."""
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import time
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from uuid import UUID
+
+from octopus.config.models import MirrorConfig
+from octopus.services.apis.beaver import errors as be
+from octopus.services.apis.beaver import models as bm
+from octopus.services.apis.beaver.service import BeaverService
+from octopus.services.mirror import models as m
+from octopus.services.mirror.index import IndexEntry, IntervalIndex
+from octopus.utils.time import naiveutcnow
+
+type Key = tuple[UUID, datetime]
+
+logger = logging.getLogger(__name__)
+
+
+class MirrorService:
+    """Service that mirrors upcoming instances from beaver."""
+
+    def __init__(self, config: MirrorConfig, beaver: BeaverService) -> None:
+        self._config = config
+        self._beaver = beaver
+        self._index = IntervalIndex[Key, bm.InstanceWithEventWithShow]()
+        self._refreshed_at: float | None = None
+
+    def _to_utc(self, dt: datetime, event: bm.Event) -> datetime:
+        return dt.replace(tzinfo=event.timezone).astimezone(UTC).replace(tzinfo=None)
+
+    def _build_entries(
+        self, schedule: bm.Schedule
+    ) -> list[tuple[Key, IndexEntry[bm.InstanceWithEventWithShow]]]:
+        if not isinstance(schedule.event, bm.EventWithShow):
+            return []
+
+        return [
+            (
+                (schedule.event.id, instance.start),
+                IndexEntry(
+                    start=self._to_utc(instance.start, schedule.event),
+                    end=self._to_utc(instance.end, schedule.event),
+                    value=bm.InstanceWithEventWithShow(
+                        start=instance.start,
+                        duration=instance.end - instance.start,
+                        event_id=schedule.event.id,
+                        event=schedule.event,
+                    ),
+                ),
+            )
+            for instance in schedule.instances
+        ]
+
+    async def _fetch(self) -> list[bm.Schedule]:
+        now = naiveutcnow()
+        schedules: list[bm.Schedule] = []
+
+        while True:
+            request = bm.ScheduleListRequest(
+                start=now - self._config.lookbehind,
+                end=now + self._config.lookahead,
+                limit=self._config.page,
+                offset=len(schedules),
+                include={"show": True},
+            )
+
+            response = await self._beaver.schedule.list(request)
+            schedules.extend(response.results.schedules)
+
+            if (
+                not response.results.schedules
+                or len(schedules) >= response.results.count
+            ):
+                return schedules
+
+    def _apply(self, schedules: Sequence[bm.Schedule]) -> None:
+        entries = dict(
+            entry for schedule in schedules for entry in self._build_entries(schedule)
+        )
+
+        for key in [key for key in self._index if key not in entries]:
+            self._index.remove(key)
+
+        for key, entry in entries.items():
+            self._index.upsert(key, entry)
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._refreshed_at is not None
+            and time.monotonic() - self._refreshed_at
+            < self._config.expiry.total_seconds()
+        )
+
+    async def refresh(self) -> None:
+        """Refresh the mirror with the current schedule from beaver."""
+        try:
+            schedules = await self._fetch()
+        except be.ServiceError:
+            return
+
+        self._apply(schedules)
+        self._refreshed_at = time.monotonic()
+
+    async def run(self) -> None:
+        """Keep refreshing the mirror in the background."""
+        if not self._config.enabled:
+            return
+
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                # A single bad refresh shouldn't leave the mirror stale for good
+                logger.exception("Failed to refresh the schedule mirror.")
+
+            await asyncio.sleep(self._config.interval.total_seconds())
+
+    async def get(self, request: m.GetRequest) -> m.GetResponse:
+        """Get a mirrored instance."""
+        entry = self._index.get((request.event, request.start))
+
+        if entry is None or not self._is_fresh():
+            return m.GetResponse(instance=None)
+
+        return m.GetResponse(instance=entry.value)
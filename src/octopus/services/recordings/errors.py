@@ -0,0 +1,28 @@
+class ServiceError(Exception):
+    """Base class for service errors."""
+
+
+class DecodingError(ServiceError):
+    """Raised when a recording can't be decoded."""
+
+
+class PeaksUnavailableError(ServiceError):
+    """Raised when peaks are enabled, but NumPy is not installed."""
+
+    def __init__(self) -> None:
+        super().__init__("NumPy is required to compute peaks of recordings.")
+
+
+class UploadError(ServiceError):
+    """Raised when the gecko service rejects an upload."""
+
+
+class UnsupportedError(UploadError):
+    """Raised when the gecko service doesn't have an endpoint to upload to."""
+
+
+class VerificationError(ServiceError):
+    """Raised when an uploaded recording doesn't match its manifest."""
+
+    def __init__(self, url: str) -> None:
+        super().__init__(f"Upload to {url} doesn't match the manifest.")
@@ -0,0 +1,133 @@
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from datetime import timedelta
+from pathlib import Path
+from typing import BinaryIO
+
+from octopus.services.recordings.ogg import OggClock, OggReader
+
+
+class SeekIndex:
+    """Index that maps granule positions of a recording to byte offsets.
+
+    Entries are kept in arrays of machine values sorted by granule position,
+    so even indexes of long recordings are small and can be searched quickly.
+    Audio starting at the granule position of an entry
+    starts at the first page after its byte offset.
+
+    The binary form starts with a header with the magic bytes, format version,
+    granule rate, pre-skip and number of entries,
+    followed by the granule positions and then the byte offsets,
+    all as little-endian integers.
+
+    Args:
+        clock: Clock of the recording.
+
+    """
+
+    _header = struct.Struct("<4sBIIQ")
+    _magic = b"OIDX"
+    _version = 1
+
+    def __init__(self, clock: OggClock) -> None:
+        self._clock = clock
+        self._granules = array("q")
+        self._offsets = array("q")
+
+    def __len__(self) -> int:
+        return len(self._granules)
+
+    def append(self, granule: int, offset: int) -> None:
+        """Append an entry after all existing ones."""
+        self._granules.append(granule)
+        self._offsets.append(offset)
+
+    def find(self, time: timedelta) -> int | None:
+        """Find the byte offset to start reading from to play audio from a time."""
+        granule = round(time.total_seconds() * self._clock.rate) + self._clock.skip
+
+        index = bisect_right(self._granules, granule) - 1
+        if index < 0:
+            return None
+
+        return self._offsets[index]
+
+    def to_bytes(self) -> bytes:
+        """Serialize the index to its binary form."""
+        granules, offsets = array("q", self._granules), array("q", self._offsets)
+
+        if sys.byteorder == "big":
+            granules.byteswap()
+            offsets.byteswap()
+
+        header = self._header.pack(
+            self._magic, self._version, self._clock.rate, self._clock.skip, len(self)
+        )
+
+        return header + granules.tobytes() + offsets.tobytes()
+
+
+class SeekIndexBuilder:
+    """Builds a seek index of a recording incrementally while it is being written.
+
+    Only headers of Ogg pages are read, so even long recordings are indexed quickly.
+    Complete pages are consumed as they appear in the file,
+    so finishing the index only reads what was written since the last update.
+    An entry is added at the start of audio and then every interval of audio.
+
+    Args:
+        interval: Duration of audio between entries.
+
+    """
+
+    def __init__(self, interval: timedelta) -> None:
+        self._interval = interval
+        self._offset = 0
+        self._clock: OggClock | None = None
+        self._index: SeekIndex | None = None
+
+    def _consume(self, file: BinaryIO) -> None:
+        reader = OggReader(file)
+
+        # Clock is known only once the first page with codec headers is complete
+        if self._clock is None or self._index is None:
+            if next(reader.pages(), None) is None:
+                return
+
+            self._clock = reader.clock()
+            self._index = SeekIndex(self._clock)
+
+        clock, index = self._clock, self._index
+
+        for page in reader.pages(self._offset):
+            self._offset = page.offset + page.size
+
+            # Pages with codec headers and pages that don't finish any packet
+            # have no meaningful granule position
+            if page.granule <= 0:
+                continue
+
+            # Audio starts at the first page that has a granule position
+            if len(index) == 0:
+                index.append(0, page.offset)
+
+            if clock.time(page.granule) >= self._interval * len(index):
+                index.append(page.granule, page.offset + page.size)
+
+    def feed(self, path: Path) -> None:
+        """Consume pages written to a recording at a path since the last update."""
+        with path.open("rb") as file:
+            self._consume(file)
+
+    def build(self, path: Path) -> SeekIndex:
+        """Finish building the seek index of a recording stored at a path."""
+        with path.open("rb") as file:
+            self._consume(file)
+
+            # Recording without a complete page still gets an empty index
+            if self._index is None:
+                self._index = SeekIndex(OggReader(file).clock())
+
+        return self._index
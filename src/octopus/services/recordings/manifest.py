@@ -0,0 +1,182 @@
+import hashlib
+from collections.abc import Iterator, Sequence
+from datetime import timedelta
+from pathlib import Path
+from typing import BinaryIO
+from uuid import UUID
+
+from octopus.models.base import SerializableModel
+from octopus.services.recordings import models as m
+from octopus.services.recordings.ogg import OggClock, OggReader
+from octopus.utils.time import NaiveDatetime
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class ManifestSegment(SerializableModel):
+    """Segment of a recording."""
+
+    index: int
+    """Position of the segment in the recording, starting from zero."""
+
+    offset: int
+    """Offset of the segment in the recording in bytes."""
+
+    size: int
+    """Size of the segment in bytes."""
+
+    packets: int
+    """Number of Ogg packets finished in the segment."""
+
+    sha256: str
+    """Hexadecimal SHA-256 checksum of the segment."""
+
+    start: timedelta
+    """Time in the recording at which the audio in the segment starts."""
+
+    end: timedelta
+    """Time in the recording at which the audio in the segment ends."""
+
+
+class Manifest(SerializableModel):
+    """Manifest that describes a recording and how to reassemble it from segments.
+
+    Concatenating the segments in order gives back the original recording.
+    """
+
+    event: UUID
+    """Identifier of the event the instance belongs to."""
+
+    start: NaiveDatetime
+    """Start datetime of the instance in event timezone."""
+
+    size: int
+    """Size of the whole recording in bytes."""
+
+    packets: int
+    """Number of Ogg packets in the whole recording."""
+
+    sha256: str
+    """Hexadecimal SHA-256 checksum of the whole recording."""
+
+    segments: Sequence[ManifestSegment]
+    """Segments of the recording in order."""
+
+
+class _Segment:
+    """Segment that is being built."""
+
+    def __init__(self, index: int, offset: int, start: timedelta) -> None:
+        self.index = index
+        self.offset = offset
+        self.start = start
+        self.packets = 0
+        self.checksum = hashlib.sha256()
+
+    def update(self, data: bytes, packets: int = 0) -> None:
+        self.packets += packets
+        self.checksum.update(data)
+
+    def finish(self, end: int, time: timedelta) -> ManifestSegment:
+        return ManifestSegment(
+            index=self.index,
+            offset=self.offset,
+            size=end - self.offset,
+            packets=self.packets,
+            sha256=self.checksum.hexdigest(),
+            start=self.start,
+            end=max(time, self.start),
+        )
+
+
+class ManifestBuilder:
+    """Builds a manifest of a recording incrementally while it is being written.
+
+    Complete Ogg pages are consumed as they appear in the file,
+    so checksums and counts are updated while the audio flows
+    and finishing the manifest only reads what was written since the last update.
+    The recording is never loaded into memory as a whole.
+    If a duration is given, the recording is cut into segments on Ogg page boundaries.
+
+    Args:
+        duration: Duration of audio in each segment or None to keep a single segment.
+
+    """
+
+    def __init__(self, duration: timedelta | None) -> None:
+        self._duration = duration
+        self._segments: list[ManifestSegment] = []
+        self._checksum = hashlib.sha256()
+        self._packets = 0
+        self._offset = 0
+        self._time = timedelta()
+        self._clock: OggClock | None = None
+        self._current = _Segment(index=0, offset=0, start=self._time)
+
+    def _is_due(self, time: timedelta) -> bool:
+        return self._duration is not None and time >= self._duration * (
+            len(self._segments) + 1
+        )
+
+    def _read_rest(self, file: BinaryIO, offset: int) -> Iterator[bytes]:
+        file.seek(offset)
+        return iter(lambda: file.read(CHUNK_SIZE), b"")
+
+    def _consume(self, file: BinaryIO) -> None:
+        reader = OggReader(file)
+
+        # Clock is known only once the first page with codec headers is complete
+        if self._clock is None:
+            if next(reader.pages(), None) is None:
+                return
+
+            self._clock = reader.clock()
+
+        for page in reader.pages(self._offset):
+            data = reader.read(page)
+            self._offset = page.offset + page.size
+
+            self._checksum.update(data)
+            self._packets += page.packets
+            self._current.update(data, page.packets)
+
+            # Pages that don't finish any packet have no granule position
+            if page.granule < 0:
+                continue
+
+            self._time = self._clock.time(page.granule)
+            if not self._is_due(self._time):
+                continue
+
+            self._segments.append(self._current.finish(self._offset, self._time))
+            self._current = _Segment(
+                index=len(self._segments), offset=self._offset, start=self._time
+            )
+
+    def feed(self, path: Path) -> None:
+        """Consume pages written to a recording at a path since the last update."""
+        with path.open("rb") as file:
+            self._consume(file)
+
+    def build(self, recording: m.Recording, path: Path) -> Manifest:
+        """Finish building the manifest of a recording stored at a path."""
+        with path.open("rb") as file:
+            self._consume(file)
+
+            # Remaining bytes, including any incomplete page, go to the last segment
+            for chunk in self._read_rest(file, self._offset):
+                self._offset += len(chunk)
+                self._checksum.update(chunk)
+                self._current.update(chunk)
+
+        if self._offset > self._current.offset or not self._segments:
+            self._segments.append(self._current.finish(self._offset, self._time))
+
+        return Manifest(
+            event=recording.event,
+            start=recording.start,
+            size=self._offset,
+            packets=self._packets,
+            sha256=self._checksum.hexdigest(),
+            segments=self._segments,
+        )
@@ -0,0 +1,45 @@
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID
+
+from octopus.models.base import datamodel
+
+
+@datamodel
+class Recording:
+    """Recording of an instance of an event."""
+
+    event: UUID
+    """Identifier of the event the instance belongs to."""
+
+    start: datetime
+    """Start datetime of the instance in event timezone."""
+
+
+@datamodel
+class SpoolRequest:
+    """Request to prepare a spool file for a recording."""
+
+    recording: Recording
+    """Recording to prepare the spool file for."""
+
+
+@datamodel
+class SpoolResponse:
+    """Response for preparing a spool file for a recording."""
+
+    path: Path
+    """Path that the recording should be written to."""
+
+
+@datamodel
+class FinishRequest:
+    """Request to finish a recording and schedule its upload."""
+
+    recording: Recording
+    """Recording to finish."""
+
+
+@datamodel
+class FinishResponse:
+    """Response for finishing a recording."""
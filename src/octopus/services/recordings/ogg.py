@@ -0,0 +1,121 @@
+import os
+import struct
+from collections.abc import Iterator
+from datetime import timedelta
+from typing import BinaryIO
+
+from octopus.models.base import datamodel
+
+DEFAULT_RATE = 48000
+
+
+@datamodel
+class OggPage:
+    """Page of an Ogg file."""
+
+    offset: int
+    """Offset of the page in the file in bytes."""
+
+    size: int
+    """Size of the page, including its header, in bytes."""
+
+    granule: int
+    """Granule position of the last packet finished on the page or -1 if none."""
+
+    packets: int
+    """Number of packets finished on the page."""
+
+
+@datamodel
+class OggClock:
+    """Converts granule positions of an Ogg stream to time."""
+
+    rate: int
+    """Number of granule positions per second."""
+
+    skip: int
+    """Number of granule positions at the start that are not played."""
+
+    def time(self, granule: int) -> timedelta:
+        """Get the time of the audio at a granule position."""
+        return timedelta(seconds=max(granule - self.skip, 0) / self.rate)
+
+
+class OggReader:
+    """Reader of pages of an Ogg file.
+
+    Only headers of pages are read, their bodies are skipped,
+    so even long files can be scanned quickly.
+    Reading stops at the first incomplete or invalid page.
+
+    Args:
+        file: File opened in binary mode.
+
+    """
+
+    _header = struct.Struct("<4sBBqIIIB")
+    _capture = b"OggS"
+
+    def __init__(self, file: BinaryIO) -> None:
+        self._file = file
+
+    def _read_page(self, offset: int, end: int) -> OggPage | None:
+        self._file.seek(offset)
+
+        header = self._file.read(self._header.size)
+        if len(header) < self._header.size:
+            return None
+
+        capture, _, _, granule, _, _, _, count = self._header.unpack(header)
+        if capture != self._capture:
+            return None
+
+        lacing = self._file.read(count)
+        if len(lacing) < count:
+            return None
+
+        size = self._header.size + count + sum(lacing)
+        if offset + size > end:
+            return None
+
+        # Lacing values below the maximum finish a packet
+        packets = sum(1 for value in lacing if value < 255)  # noqa: PLR2004
+
+        return OggPage(offset=offset, size=size, granule=granule, packets=packets)
+
+    def pages(self, offset: int = 0) -> Iterator[OggPage]:
+        """Iterate over complete pages of the file, starting at an offset."""
+        end = os.fstat(self._file.fileno()).st_size
+
+        while (page := self._read_page(offset, end)) is not None:
+            yield page
+            offset += page.size
+
+    def read(self, page: OggPage) -> bytes:
+        """Read the whole page, including its header."""
+        self._file.seek(page.offset)
+        return self._file.read(page.size)
+
+    def body(self, page: OggPage) -> bytes:
+        """Read the body of a page."""
+        # Number of lacing values is the last field of the header
+        self._file.seek(page.offset + self._header.size - 1)
+        count = self._file.read(1)[0]
+        lacing = self._file.read(count)
+        return self._file.read(sum(lacing))
+
+    def clock(self) -> OggClock:
+        """Get the clock of the first stream in the file based on its codec."""
+        first = next(self.pages(), None)
+        body = self.body(first) if first is not None else b""
+
+        if body.startswith(b"OpusHead") and len(body) >= 12:  # noqa: PLR2004
+            # Opus always uses 48 kHz granule positions and declares pre-skip
+            (skip,) = struct.unpack_from("<H", body, 10)
+            return OggClock(rate=DEFAULT_RATE, skip=skip)
+
+        if body.startswith(b"\x01vorbis") and len(body) >= 16:  # noqa: PLR2004
+            (rate,) = struct.unpack_from("<I", body, 12)
+            return OggClock(rate=rate or DEFAULT_RATE, skip=0)
+
+        return OggClock(rate=DEFAULT_RATE, skip=0)
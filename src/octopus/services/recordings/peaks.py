@@ -0,0 +1,145 @@
+import struct
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
+
+# NumPy comes with the optional peaks extra
+if TYPE_CHECKING or find_spec("numpy") is not None:
+    import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+SAMPLE_SIZE = 2
+
+
+def is_available() -> bool:
+    """Check whether peaks can be computed, which requires NumPy."""
+    return find_spec("numpy") is not None
+
+
+class PeaksBuilder:
+    """Builds waveform peaks from 16-bit mono PCM audio fed in blocks.
+
+    Each block is reduced with vectorized operations as soon as it arrives,
+    so only the peaks are kept in memory, not the audio itself.
+    Peaks at the most detailed zoom level summarize a fixed number of samples
+    and each next zoom level combines a fixed number of peaks of the previous one.
+
+    The binary form starts with a header with the magic bytes, format version,
+    sample rate, number of samples per peak at the most detailed zoom level,
+    number of peaks combined between zoom levels and number of zoom levels.
+    Then each zoom level follows from the most detailed one,
+    as the number of peaks and the minimum, maximum and RMS of each peak,
+    all as little-endian integers.
+
+    Args:
+        rate: Sample rate of the audio in Hz.
+        resolution: Number of samples per peak at the most detailed zoom level.
+        factor: Number of peaks combined into one at each next zoom level.
+        levels: Number of zoom levels.
+
+    """
+
+    _header = struct.Struct("<4sBIIIB")
+    _count = struct.Struct("<Q")
+    _magic = b"OPKS"
+    _version = 1
+
+    def __init__(self, rate: int, resolution: int, factor: int, levels: int) -> None:
+        self._rate = rate
+        self._resolution = resolution
+        self._factor = factor
+        self._levels = levels
+        self._pending = b""
+        self._mins: list[NDArray[Any]] = []
+        self._maxs: list[NDArray[Any]] = []
+        self._squares: list[NDArray[Any]] = []
+        self._counts: list[NDArray[Any]] = []
+
+    def _reduce(self, samples: "NDArray[Any]", size: int) -> None:
+        # Last block can be shorter, so it is padded with values that don't count
+        blocks = -(-len(samples) // size)
+        padding = blocks * size - len(samples)
+
+        values = samples.astype(np.int32)
+        mins = np.pad(values, (0, padding), constant_values=np.iinfo(np.int16).max)
+        maxs = np.pad(values, (0, padding), constant_values=np.iinfo(np.int16).min)
+        squares = np.pad(values.astype(np.float64) ** 2, (0, padding))
+
+        self._mins.append(mins.reshape(blocks, size).min(axis=1))
+        self._maxs.append(maxs.reshape(blocks, size).max(axis=1))
+        self._squares.append(squares.reshape(blocks, size).sum(axis=1))
+        self._counts.append(np.full(blocks, size, dtype=np.int64))
+
+        if padding:
+            self._counts[-1][-1] -= padding
+
+    def feed(self, data: bytes) -> None:
+        """Feed the next block of audio."""
+        data = self._pending + data
+
+        # Peaks are computed only for whole blocks, the rest waits for more data
+        usable = len(data) - len(data) % (self._resolution * SAMPLE_SIZE)
+        self._pending = data[usable:]
+
+        if usable:
+            samples = np.frombuffer(data[:usable], dtype="<i2")
+            self._reduce(samples, self._resolution)
+
+    def _combine(self, level: "tuple[NDArray[Any], ...]") -> "tuple[NDArray[Any], ...]":
+        mins, maxs, squares, counts = level
+
+        blocks = -(-len(mins) // self._factor)
+        padding = blocks * self._factor - len(mins)
+
+        def _fold(values: "NDArray[Any]", fill: float, reduce: Any) -> "NDArray[Any]":
+            padded = np.pad(values, (0, padding), constant_values=fill)
+            return reduce(padded.reshape(blocks, self._factor), axis=1)
+
+        return (
+            _fold(mins, np.iinfo(np.int16).max, np.min),
+            _fold(maxs, np.iinfo(np.int16).min, np.max),
+            _fold(squares, 0, np.sum),
+            _fold(counts, 0, np.sum),
+        )
+
+    def _encode(self, level: "tuple[NDArray[Any], ...]") -> bytes:
+        mins, maxs, squares, counts = level
+        rms = np.sqrt(squares / np.maximum(counts, 1)).round()
+
+        peaks = np.stack([mins, maxs, np.minimum(rms, np.iinfo(np.int16).max)], axis=1)
+        return self._count.pack(len(mins)) + peaks.astype("<i2").tobytes()
+
+    def build(self) -> bytes:
+        """Finish building and get the peaks in their binary form."""
+        if usable := len(self._pending) - len(self._pending) % SAMPLE_SIZE:
+            samples = np.frombuffer(self._pending[:usable], dtype="<i2")
+            self._reduce(samples, self._resolution)
+            self._pending = b""
+
+        level = tuple(
+            np.concatenate(parts) if parts else np.zeros(0, dtype=dtype)
+            for parts, dtype in (
+                (self._mins, np.int32),
+                (self._maxs, np.int32),
+                (self._squares, np.float64),
+                (self._counts, np.int64),
+            )
+        )
+
+        data = [
+            self._header.pack(
+                self._magic,
+                self._version,
+                self._rate,
+                self._resolution,
+                self._factor,
+                self._levels,
+            )
+        ]
+
+        for _ in range(self._levels):
+            data.append(self._encode(level))
+            level = self._combine(level)
+
+        return b"".join(data)
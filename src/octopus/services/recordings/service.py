@@ -0,0 +1,605 @@
+import asyncio
+import fcntl
+import hashlib
+import logging
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Generator, Sequence
+from contextlib import contextmanager, suppress
+from http import HTTPStatus
+from pathlib import Path
+from uuid import UUID
+
+from httpx import AsyncClient, HTTPError, HTTPStatusError, Response, Timeout
+
+from octopus.config.models import Config
+from octopus.services.recordings import errors as e
+from octopus.services.recordings import models as m
+from octopus.services.recordings import peaks
+from octopus.services.recordings.index import SeekIndexBuilder
+from octopus.services.recordings.manifest import (
+    Manifest,
+    ManifestBuilder,
+    ManifestSegment,
+)
+from octopus.utils.time import isoparse, isostringify
+
+CHUNK_SIZE = 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+class _Builders:
+    """Builders of everything that is computed from a recording while it is written."""
+
+    def __init__(
+        self, manifest: ManifestBuilder, index: SeekIndexBuilder | None
+    ) -> None:
+        self.manifest = manifest
+        self.index = index
+
+    def feed(self, path: Path) -> None:
+        self.manifest.feed(path)
+        if self.index is not None:
+            self.index.feed(path)
+
+
+class RecordingsService:
+    """Service for recordings.
+
+    Recordings are written to files in a local spool first
+    and uploaded to the gecko service in the background once they are finished,
+    so slowdowns of gecko can't drop any audio.
+    Failed uploads are retried with exponential backoff
+    and recordings left in the spool by a previous run are uploaded after a restart,
+    including ones that were interrupted by a crash.
+    With several workers, only one of them takes care of the recordings left behind
+    and files are locked while they are uploaded, so that they are never evicted.
+    """
+
+    def __init__(self, config: Config) -> None:
+        # Fail at startup instead of after the first recording
+        if config.recordings.peaks.enabled and not peaks.is_available():
+            raise e.PeaksUnavailableError
+
+        self._config = config
+        self._queue = asyncio.Queue[m.Recording]()
+        self._started = time.time()
+        self._recovery: int | None = None
+        self._builders: dict[m.Recording, _Builders] = {}
+        self._followers: dict[m.Recording, tuple[asyncio.Event, asyncio.Task]] = {}
+
+    def _get_path(self, recording: m.Recording, *, partial: bool = False) -> Path:
+        name = f"{isostringify(recording.start)}.ogg"
+        if partial:
+            name = f"{name}.part"
+
+        return self._config.recordings.spool.path / str(recording.event) / name
+
+    def _parse_path(self, path: Path) -> m.Recording | None:
+        try:
+            return m.Recording(event=UUID(path.parent.name), start=isoparse(path.stem))
+        except ValueError:
+            return None
+
+    def _list_finished(self) -> Sequence[Path]:
+        paths = self._config.recordings.spool.path.glob("*/*.ogg")
+        return sorted(paths, key=lambda path: path.stat().st_mtime)
+
+    def _claim_recovery(self) -> bool:
+        """Tell if this process is the one that takes care of recordings left behind."""
+        lock = self._config.recordings.spool.path / ".recovery.lock"
+
+        try:
+            lock.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(lock, os.O_RDWR | os.O_CREAT)
+        except OSError:
+            return False
+
+        try:
+            # Lock is held until the process exits, so only one worker gets it
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+
+        self._recovery = fd
+        return True
+
+    def _release_recovery(self) -> None:
+        if self._recovery is None:
+            return
+
+        os.close(self._recovery)
+        self._recovery = None
+
+    def _recover(self) -> None:
+        """Queue recordings left behind by a previous run, including interrupted ones."""
+        spool = self._config.recordings.spool.path
+
+        # Files written since the start are handled by the workers writing them
+        for partial in spool.glob("*/*.ogg.part"):
+            path = partial.with_suffix("")
+
+            try:
+                stat = partial.stat()
+                if stat.st_mtime >= self._started:
+                    continue
+
+                if stat.st_size == 0:
+                    partial.unlink()
+                    continue
+
+                # Audio recorded before the interruption is still playable
+                partial.rename(path)
+            except OSError:
+                continue
+
+        for path in self._list_finished():
+            try:
+                if path.stat().st_mtime >= self._started:
+                    continue
+            except OSError:
+                continue
+
+            if (recording := self._parse_path(path)) is not None:
+                self._queue.put_nowait(recording)
+
+    def _get_size(self, path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    @contextmanager
+    def _lock(self, path: Path, *, shared: bool) -> Generator[bool]:
+        """Lock a file and tell if it worked, without waiting for other locks."""
+        try:
+            file = path.open("rb")
+        except FileNotFoundError:
+            yield False
+            return
+
+        with file:
+            operation = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+
+            try:
+                fcntl.flock(file, operation | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+
+            yield True
+
+    def _evict(self) -> None:
+        spool = self._config.recordings.spool
+        total = sum(self._get_size(path) for path in spool.path.glob("*/*"))
+
+        # Oldest recordings waiting for upload are dropped first,
+        # recordings that are still being written are never dropped
+        for path in self._list_finished():
+            if total <= spool.limit:
+                return
+
+            size = self._get_size(path)
+
+            # Recordings that any worker is uploading are locked
+            with self._lock(path, shared=False) as locked:
+                if not locked:
+                    continue
+
+                path.unlink(missing_ok=True)
+
+            total -= size
+
+    async def _read(
+        self, path: Path, offset: int = 0, size: int | None = None
+    ) -> AsyncIterator[bytes]:
+        remaining = size
+
+        with path.open("rb") as file:
+            file.seek(offset)
+
+            while remaining is None or remaining > 0:
+                limit = CHUNK_SIZE if remaining is None else min(CHUNK_SIZE, remaining)
+
+                chunk = await asyncio.to_thread(file.read, limit)
+                if not chunk:
+                    return
+
+                if remaining is not None:
+                    remaining -= len(chunk)
+
+                yield chunk
+
+    def _get_url(self, recording: m.Recording | Manifest) -> str:
+        return f"/recordings/{recording.event}/{isostringify(recording.start)}"
+
+    async def _put(
+        self,
+        client: AsyncClient,
+        url: str,
+        content: bytes | AsyncIterator[bytes],
+        size: int,
+        content_type: str,
+    ) -> None:
+        response = await client.put(
+            url,
+            content=content,
+            headers={"Content-Length": str(size), "Content-Type": content_type},
+        )
+        response.raise_for_status()
+
+    async def _verify(
+        self, client: AsyncClient, url: str, size: int, sha256: str
+    ) -> None:
+        checksum = hashlib.sha256()
+        received = 0
+
+        async with client.stream("GET", url) as response:
+            # Uploads can't be verified if gecko doesn't serve them back
+            if self._is_unsupported(response):
+                logger.warning("Skipping verification of %s, it can't be read.", url)
+                return
+
+            response.raise_for_status()
+
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                received += len(chunk)
+                checksum.update(chunk)
+
+        if received != size or checksum.hexdigest() != sha256:
+            raise e.VerificationError(url)
+
+    async def _send(  # noqa: PLR0913
+        self,
+        client: AsyncClient,
+        url: str,
+        path: Path,
+        offset: int,
+        size: int,
+        sha256: str,
+    ) -> None:
+        await self._put(client, url, self._read(path, offset, size), size, "audio/ogg")
+
+        if self._config.recordings.manifest.verify:
+            await self._verify(client, url, size, sha256)
+
+    def _is_unsupported(self, response: Response) -> bool:
+        return response.status_code in (
+            HTTPStatus.NOT_FOUND,
+            HTTPStatus.METHOD_NOT_ALLOWED,
+        )
+
+    def _is_permanent(self, ex: HTTPStatusError) -> bool:
+        return ex.response.is_client_error and ex.response.status_code not in (
+            HTTPStatus.REQUEST_TIMEOUT,
+            HTTPStatus.TOO_MANY_REQUESTS,
+        )
+
+    async def _retry(self, upload: Callable[[], Awaitable[None]]) -> None:
+        config = self._config.recordings.upload
+        delay = config.delay
+
+        while True:
+            try:
+                await upload()
+            except FileNotFoundError as ex:
+                # Recording was removed, so retrying would never succeed
+                raise e.UploadError from ex
+            except HTTPStatusError as ex:
+                if self._is_unsupported(ex.response):
+                    raise e.UnsupportedError from ex
+
+                if self._is_permanent(ex):
+                    raise e.UploadError from ex
+            except (HTTPError, OSError, e.VerificationError):
+                # Corrupted uploads are simply uploaded again
+                pass
+            else:
+                return
+
+            await asyncio.sleep(delay.total_seconds())
+            delay = min(delay * 2, config.backoff)
+
+    async def _upload_whole(
+        self, client: AsyncClient, path: Path, manifest: Manifest
+    ) -> None:
+        url = self._get_url(manifest)
+
+        await self._retry(
+            lambda: self._send(client, url, path, 0, manifest.size, manifest.sha256)
+        )
+
+    async def _upload_segment(
+        self,
+        client: AsyncClient,
+        path: Path,
+        manifest: Manifest,
+        segment: ManifestSegment,
+    ) -> None:
+        url = f"{self._get_url(manifest)}/segments/{segment.index}"
+
+        await self._retry(
+            lambda: self._send(
+                client, url, path, segment.offset, segment.size, segment.sha256
+            )
+        )
+
+    async def _upload_segmented(
+        self, client: AsyncClient, path: Path, manifest: Manifest
+    ) -> None:
+        semaphore = asyncio.Semaphore(self._config.recordings.segments.concurrency)
+
+        async def _upload_bounded(segment: ManifestSegment) -> None:
+            async with semaphore:
+                await self._upload_segment(client, path, manifest, segment)
+
+        # Each segment goes over its own connection from the pool
+        tasks = [
+            asyncio.create_task(_upload_bounded(segment))
+            for segment in manifest.segments
+        ]
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _upload_manifest(self, client: AsyncClient, manifest: Manifest) -> None:
+        data = manifest.model_dump_json(round_trip=True).encode()
+
+        await self._retry(
+            lambda: self._put(
+                client,
+                f"{self._get_url(manifest)}/manifest",
+                data,
+                len(data),
+                "application/json",
+            )
+        )
+
+    async def _upload_index(
+        self,
+        client: AsyncClient,
+        recording: m.Recording,
+        path: Path,
+        builder: SeekIndexBuilder,
+    ) -> None:
+        # Only pages written since the last update while recording are read
+        index = await asyncio.to_thread(builder.build, path)
+        data = index.to_bytes()
+
+        await self._retry(
+            lambda: self._put(
+                client,
+                f"{self._get_url(recording)}/index",
+                data,
+                len(data),
+                "application/octet-stream",
+            )
+        )
+
+    async def _compute_peaks(self, path: Path) -> bytes:
+        config = self._config.recordings.peaks
+        builder = peaks.PeaksBuilder(
+            config.rate, config.resolution, config.factor, config.levels
+        )
+
+        # Audio is decoded to a pipe, so the decoded copy never touches the disk
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg",
+            "-nostdin",
+            "-i",
+            str(path),
+            "-map",
+            "0:a:0",
+            "-ac",
+            "1",
+            "-ar",
+            str(config.rate),
+            "-f",
+            "s16le",
+            "-",
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+
+        try:
+            # Output is always piped, but its type doesn't reflect that
+            if process.stdout is None:
+                raise e.DecodingError
+
+            while chunk := await process.stdout.read(CHUNK_SIZE):
+                builder.feed(chunk)
+        finally:
+            if process.returncode is None:
+                process.kill()
+
+            await process.wait()
+
+        if process.returncode != 0:
+            raise e.DecodingError
+
+        return builder.build()
+
+    async def _upload_peaks(
+        self, client: AsyncClient, recording: m.Recording, path: Path
+    ) -> None:
+        try:
+            data = await self._compute_peaks(path)
+        except (e.DecodingError, OSError):
+            # Peaks are only a preview, so they shouldn't hold back the recording
+            return
+
+        await self._retry(
+            lambda: self._put(
+                client,
+                f"{self._get_url(recording)}/peaks",
+                data,
+                len(data),
+                "application/octet-stream",
+            )
+        )
+
+    def _build_builders(self) -> _Builders:
+        config = self._config.recordings
+
+        manifest = ManifestBuilder(
+            config.segments.duration if config.segments.enabled else None
+        )
+        index = (
+            SeekIndexBuilder(config.index.interval) if config.index.enabled else None
+        )
+
+        return _Builders(manifest=manifest, index=index)
+
+    async def _follow(
+        self, builders: _Builders, path: Path, stopped: asyncio.Event
+    ) -> None:
+        interval = self._config.recordings.manifest.interval.total_seconds()
+
+        while not stopped.is_set():
+            # Nothing might have been written yet
+            with suppress(OSError):
+                await asyncio.to_thread(builders.feed, path)
+
+            with suppress(TimeoutError):
+                await asyncio.wait_for(stopped.wait(), interval)
+
+    async def _unfollow(self, recording: m.Recording) -> None:
+        if (follower := self._followers.pop(recording, None)) is None:
+            return
+
+        stopped, task = follower
+        stopped.set()
+
+        # Builders are not thread-safe, so the last update must finish first
+        await task
+
+    async def _upload(self, client: AsyncClient, recording: m.Recording) -> None:
+        path = self._get_path(recording)
+
+        # Recordings left by a previous run have to be read anew
+        builders = self._builders.pop(recording, None) or self._build_builders()
+
+        # Recording might have been evicted in the meantime
+        with self._lock(path, shared=True) as locked:
+            if locked:
+                await self._upload_locked(client, recording, path, builders)
+
+    async def _upload_locked(
+        self,
+        client: AsyncClient,
+        recording: m.Recording,
+        path: Path,
+        builders: _Builders,
+    ) -> None:
+        config = self._config.recordings
+
+        try:
+            # Only audio written since the last update while recording is read
+            manifest = await asyncio.to_thread(builders.manifest.build, recording, path)
+
+            segmented = config.segments.enabled
+
+            if segmented:
+                try:
+                    await self._upload_segmented(client, path, manifest)
+                except e.UnsupportedError:
+                    # Older gecko only accepts whole recordings
+                    logger.warning(
+                        "Segments are not supported, uploading %s whole.", path
+                    )
+                    segmented = False
+
+            if not segmented:
+                await self._upload_whole(client, path, manifest)
+
+            # Extras only help players, so recordings are kept without them if needed
+            if builders.index is not None:
+                with suppress(e.UnsupportedError):
+                    await self._upload_index(client, recording, path, builders.index)
+
+            if config.peaks.enabled:
+                with suppress(e.UnsupportedError):
+                    await self._upload_peaks(client, recording, path)
+
+            # Manifest goes last, so its presence means that the recording is complete
+            if segmented or config.manifest.enabled:
+                with suppress(e.UnsupportedError):
+                    await self._upload_manifest(client, manifest)
+        except (e.UploadError, OSError):
+            # Recording stays in the spool and is retried after a restart
+            return
+
+        path.unlink(missing_ok=True)
+
+    async def spool(self, request: m.SpoolRequest) -> m.SpoolResponse:
+        """Prepare a spool file for a recording."""
+        path = self._get_path(request.recording, partial=True)
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._evict()
+        except OSError as ex:
+            raise e.ServiceError from ex
+
+        # Checksums and the seek index are updated while the recording is written
+        await self._unfollow(request.recording)
+        builders = self._build_builders()
+        stopped = asyncio.Event()
+        task = asyncio.create_task(self._follow(builders, path, stopped))
+        self._builders[request.recording] = builders
+        self._followers[request.recording] = (stopped, task)
+
+        return m.SpoolResponse(path=path)
+
+    async def finish(self, request: m.FinishRequest) -> m.FinishResponse:
+        """Finish a recording and schedule its upload."""
+        partial = self._get_path(request.recording, partial=True)
+
+        await self._unfollow(request.recording)
+
+        try:
+            # Nothing was recorded if nobody connected to the stream
+            if self._get_size(partial) == 0:
+                self._builders.pop(request.recording, None)
+                partial.unlink(missing_ok=True)
+                return m.FinishResponse()
+
+            partial.rename(self._get_path(request.recording))
+        except OSError as ex:
+            self._builders.pop(request.recording, None)
+            raise e.ServiceError from ex
+
+        self._queue.put_nowait(request.recording)
+
+        return m.FinishResponse()
+
+    async def run(self) -> None:
+        """Upload finished recordings in the background."""
+        if self._claim_recovery():
+            self._recover()
+
+        try:
+            async with AsyncClient(
+                base_url=self._config.gecko.http.url,
+                timeout=Timeout(self._config.recordings.upload.timeout.total_seconds()),
+            ) as client:
+                while True:
+                    recording = await self._queue.get()
+
+                    try:
+                        await self._upload(client, recording)
+                    except Exception:
+                        # A single bad recording shouldn't stop uploads for good
+                        logger.exception(
+                            "Failed to upload %s.", self._get_path(recording)
+                        )
+        finally:
+            self._release_recovery()
@@ -0,0 +1,9 @@
+class ServiceError(Exception):
+    """Base class for service errors."""
+
+
+class ResolutionError(ServiceError):
+    """Raised when a host can't be resolved."""
+
+    def __init__(self, host: str) -> None:
+        super().__init__(f"Failed to resolve host {host}.")
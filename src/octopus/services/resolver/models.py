@@ -0,0 +1,50 @@
+from datetime import timedelta
+
+from octopus.models.base import datamodel
+
+
+@datamodel
+class ResolveRequest:
+    """Request to resolve a host."""
+
+    host: str
+    """Host name to resolve."""
+
+
+@datamodel
+class ResolveResponse:
+    """Response for resolving a host."""
+
+    address: str
+    """IPv4 address of the host."""
+
+
+@datamodel
+class StatsRequest:
+    """Request to get statistics of resolutions."""
+
+
+@datamodel
+class StatsResponse:
+    """Response for getting statistics of resolutions."""
+
+    hits: int
+    """Number of resolutions served from the cache."""
+
+    misses: int
+    """Number of resolutions that had to wait for a lookup."""
+
+    lookups: int
+    """Number of lookups made, including background refreshes."""
+
+    failures: int
+    """Number of lookups that failed."""
+
+    stale: int
+    """Number of failed lookups that fell back to a previously resolved address."""
+
+    latency: timedelta
+    """Mean time taken by lookups."""
+
+    peak: timedelta
+    """Maximum time taken by a lookup."""
@@ -0,0 +1,129 @@
+import asyncio
+import socket
+import time
+from contextlib import suppress
+from datetime import timedelta
+
+from octopus.config.models import ResolverConfig
+from octopus.models.base import datamodel
+from octopus.services.resolver import errors as e
+from octopus.services.resolver import models as m
+
+
+@datamodel
+class Entry:
+    """Resolved address of a host."""
+
+    address: str
+    """IPv4 address of the host."""
+
+    resolved_at: float
+    """Monotonic time at which the address was resolved."""
+
+
+class ResolverService:
+    """Service for resolving hosts without blocking the event loop.
+
+    Resolved addresses are cached and refreshed in the background before they expire.
+    If a lookup fails, the last known address is used instead.
+    """
+
+    def __init__(self, config: ResolverConfig) -> None:
+        self._config = config
+        self._entries: dict[str, Entry] = {}
+        self._pending: dict[str, asyncio.Future[Entry]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._lookups = 0
+        self._failures = 0
+        self._stale = 0
+        self._elapsed = 0.0
+        self._peak = 0.0
+
+    def _is_fresh(self, entry: Entry) -> bool:
+        return time.monotonic() - entry.resolved_at < self._config.ttl.total_seconds()
+
+    def _measure(self, elapsed: float) -> None:
+        self._lookups += 1
+        self._elapsed += elapsed
+        self._peak = max(self._peak, elapsed)
+
+    async def _lookup(self, host: str) -> str:
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+
+        try:
+            async with asyncio.timeout(self._config.timeout.total_seconds()):
+                infos = await loop.getaddrinfo(
+                    host, None, family=socket.AF_INET, type=socket.SOCK_STREAM
+                )
+        except (OSError, TimeoutError) as ex:
+            self._failures += 1
+            raise e.ResolutionError(host) from ex
+        finally:
+            self._measure(time.perf_counter() - start)
+
+        if not infos:
+            self._failures += 1
+            raise e.ResolutionError(host)
+
+        return str(infos[0][4][0])
+
+    async def _refresh(self, host: str) -> Entry:
+        try:
+            address = await self._lookup(host)
+        except e.ResolutionError:
+            if (entry := self._entries.get(host)) is None:
+                raise
+
+            # Keep using the last known address while the resolver is unavailable
+            self._stale += 1
+            return entry
+
+        entry = Entry(address=address, resolved_at=time.monotonic())
+        self._entries[host] = entry
+        return entry
+
+    async def _get(self, host: str) -> Entry:
+        # Share a single lookup between concurrent resolutions of the same host
+        if (pending := self._pending.get(host)) is None:
+            pending = asyncio.ensure_future(self._refresh(host))
+            self._pending[host] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(host, None))
+
+        return await asyncio.shield(pending)
+
+    async def resolve(self, request: m.ResolveRequest) -> m.ResolveResponse:
+        """Resolve a host to an IPv4 address."""
+        entry = self._entries.get(request.host)
+
+        if entry is not None and self._is_fresh(entry):
+            self._hits += 1
+        else:
+            self._misses += 1
+            entry = await self._get(request.host)
+
+        return m.ResolveResponse(address=entry.address)
+
+    async def run(self) -> None:
+        """Keep refreshing resolved hosts in the background."""
+        while True:
+            await asyncio.sleep(self._config.refresh.total_seconds())
+
+            for host in list(self._entries):
+                with suppress(e.ResolutionError):
+                    await self._get(host)
+
+    async def stats(self, request: m.StatsRequest) -> m.StatsResponse:
+        """Get statistics of resolutions."""
+        return m.StatsResponse(
+            hits=self._hits,
+            misses=self._misses,
+            lookups=self._lookups,
+            failures=self._failures,
+            stale=self._stale,
+            latency=timedelta(seconds=self._elapsed / self._lookups)
+            if self._lookups
+            else timedelta(),
+            peak=timedelta(seconds=self._peak),
+        )
@@ -0,0 +1,80 @@
+import math
+from array import array
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+
+from octopus.services.stats import models as m
+
+
+class SamplesBuffer:
+    """Ring buffer of samples of statistics of a stream.
+
+    Each field is kept in a preallocated array of machine values,
+    so the buffer takes a small and fixed amount of memory.
+    Once the buffer is full, new samples replace the oldest ones.
+
+    Args:
+        capacity: Maximum number of samples to keep.
+
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._times = array("d", [0.0]) * capacity
+        self._bitrates = array("d", [math.nan]) * capacity
+        self._sizes = array("q", [-1]) * capacity
+        self._durations = array("d", [math.nan]) * capacity
+        self._speeds = array("d", [math.nan]) * capacity
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _encode_float(self, value: float | None) -> float:
+        return math.nan if value is None else value
+
+    def _decode_float(self, value: float) -> float | None:
+        return None if math.isnan(value) else value
+
+    def _encode_int(self, value: int | None) -> int:
+        return -1 if value is None else value
+
+    def _decode_int(self, value: int) -> int | None:
+        return None if value < 0 else value
+
+    def _encode_timedelta(self, value: timedelta | None) -> float:
+        return math.nan if value is None else value.total_seconds()
+
+    def _decode_timedelta(self, value: float) -> timedelta | None:
+        return None if math.isnan(value) else timedelta(seconds=value)
+
+    def append(self, sample: m.Sample) -> None:
+        """Append a sample, replacing the oldest one if the buffer is full."""
+        index = self._next
+
+        self._times[index] = sample.sampled_at.timestamp()
+        self._bitrates[index] = self._encode_float(sample.bitrate)
+        self._sizes[index] = self._encode_int(sample.size)
+        self._durations[index] = self._encode_timedelta(sample.duration)
+        self._speeds[index] = self._encode_float(sample.speed)
+
+        self._next = (index + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
+
+    def samples(self) -> Sequence[m.Sample]:
+        """Get the samples from oldest to newest."""
+        start = (self._next - self._count) % self._capacity
+
+        return [
+            m.Sample(
+                sampled_at=datetime.fromtimestamp(self._times[index], UTC),
+                bitrate=self._decode_float(self._bitrates[index]),
+                size=self._decode_int(self._sizes[index]),
+                duration=self._decode_timedelta(self._durations[index]),
+                speed=self._decode_float(self._speeds[index]),
+            )
+            for index in (
+                (start + offset) % self._capacity for offset in range(self._count)
+            )
+        ]
@@ -0,0 +1,90 @@
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+
+from octopus.models.base import datamodel
+from octopus.services.streaming import models as sm
+
+
+@datamodel
+class Sample:
+    """Sample of statistics of the ffmpeg pipeline of a stream."""
+
+    sampled_at: datetime
+    """Datetime in UTC at which the sample was taken."""
+
+    bitrate: float | None
+    """Bitrate of the outgoing stream in kilobits per second."""
+
+    size: int | None
+    """Total size of the outgoing stream in bytes."""
+
+    duration: timedelta | None
+    """Duration of the audio that was streamed so far."""
+
+    speed: float | None
+    """Processing speed relative to real time."""
+
+
+@datamodel
+class StreamStats:
+    """Statistics of a stream."""
+
+    slot: int
+    """Identifier of the slot that the stream is handled in."""
+
+    instance: sm.Instance
+    """Instance that the stream is for."""
+
+    started_at: datetime
+    """Datetime in UTC at which the stream was started."""
+
+    samples: Sequence[Sample]
+    """Recent samples of statistics, from oldest to newest."""
+
+
+@datamodel
+class StartRequest:
+    """Request to start collecting statistics of a stream."""
+
+    slot: int
+    """Identifier of the slot that the stream is handled in."""
+
+    instance: sm.Instance
+    """Instance that the stream is for."""
+
+
+@datamodel
+class StartResponse:
+    """Response for starting to collect statistics of a stream."""
+
+
+@datamodel
+class RecordRequest:
+    """Request to record progress of a stream."""
+
+    slot: int
+    """Identifier of the slot that the stream is handled in."""
+
+    progress: sm.Progress
+    """Progress of the stream."""
+
+
+@datamodel
+class RecordResponse:
+    """Response for recording progress of a stream."""
+
+
+@datamodel
+class GetRequest:
+    """Request to get statistics of streams."""
+
+    slot: int | None = None
+    """Identifier of the slot to get statistics for or None for all slots."""
+
+
+@datamodel
+class GetResponse:
+    """Response for getting statistics of streams."""
+
+    streams: Sequence[StreamStats]
+    """Statistics of the latest stream in each requested slot."""
@@ -0,0 +1,78 @@
+from datetime import datetime
+
+from octopus.config.models import StatsConfig
+from octopus.models.base import datamodel
+from octopus.services.stats import models as m
+from octopus.services.stats.buffer import SamplesBuffer
+from octopus.services.streaming import models as sm
+from octopus.utils.time import awareutcnow
+
+
+@datamodel
+class Entry:
+    """Statistics collected for a stream."""
+
+    instance: sm.Instance
+    """Instance that the stream is for."""
+
+    started_at: datetime
+    """Datetime in UTC at which the stream was started."""
+
+    samples: SamplesBuffer
+    """Recent samples of statistics."""
+
+
+class StatsService:
+    """Service for statistics of streams.
+
+    Statistics are taken from the progress reported by the ffmpeg pipeline of a stream,
+    so they describe the pipeline and not the SRT connections it uses.
+    ffmpeg doesn't report round-trip time, loss or retransmissions of its SRT sockets.
+
+    Statistics of the latest stream in each slot are kept,
+    so they can still be inspected after the stream ends.
+    """
+
+    def __init__(self, config: StatsConfig) -> None:
+        self._config = config
+        self._entries: dict[int, Entry] = {}
+
+    async def start(self, request: m.StartRequest) -> m.StartResponse:
+        """Start collecting statistics of a stream."""
+        self._entries[request.slot] = Entry(
+            instance=request.instance,
+            started_at=awareutcnow(),
+            samples=SamplesBuffer(self._config.samples),
+        )
+
+        return m.StartResponse()
+
+    async def record(self, request: m.RecordRequest) -> m.RecordResponse:
+        """Record progress of a stream."""
+        if (entry := self._entries.get(request.slot)) is not None:
+            entry.samples.append(
+                m.Sample(
+                    sampled_at=awareutcnow(),
+                    bitrate=request.progress.bitrate,
+                    size=request.progress.size,
+                    duration=request.progress.duration,
+                    speed=request.progress.speed,
+                )
+            )
+
+        return m.RecordResponse()
+
+    async def get(self, request: m.GetRequest) -> m.GetResponse:
+        """Get statistics of streams."""
+        streams = [
+            m.StreamStats(
+                slot=slot,
+                instance=entry.instance,
+                started_at=entry.started_at,
+                samples=entry.samples.samples(),
+            )
+            for slot, entry in sorted(self._entries.items())
+            if request.slot is None or slot == request.slot
+        ]
+
+        return m.GetResponse(streams=streams)
@@ -25,9 +25,16 @@ class UnrecordableEventError(ServiceError):
 
 
 class StreamBusyError(ServiceError):
-    """Raised when another stream is already being handled at the moment."""
+    """Raised when a stream is already being handled for the instance."""
 
     def __init__(self, instance: m.Instance) -> None:
         super().__init__(
             f"Stream is reserved for instance of event {instance.event} starting at {isostringify(instance.start)}."
         )
+
+
+class NoFreeSlotError(ServiceError):
+    """Raised when all slots are already reserved."""
+
+    def __init__(self, slots: int) -> None:
+        super().__init__(f"All {slots} slots are reserved.")
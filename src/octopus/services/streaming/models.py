@@ -1,5 +1,5 @@
-from collections.abc import Mapping
-from datetime import datetime
+from collections.abc import Mapping, Sequence
+from datetime import datetime, timedelta
 from enum import StrEnum
 from uuid import UUID
 
@@ -24,16 +24,69 @@ class Instance:
 
 
 @datamodel
-class Availability:
-    """Availability of a stream."""
+class Reservation:
+    """Reservation of a slot."""
+
+    instance: Instance
+    """Instance that the slot is reserved for."""
+
+    token: int
+    """Fencing token that distinguishes the reservation from later ones."""
+
+    expires_at: datetime
+    """Datetime in UTC after which the reservation is no longer valid."""
+
+
+type Reservations = tuple[Reservation | None, ...]
+
+
+@datamodel
+class Slot:
+    """Slot data."""
+
+    id: int
+    """Identifier of the slot."""
+
+    port: int
+    """Port to listen for SRT connections on."""
+
+
+@datamodel
+class SlotAvailability:
+    """Availability of a slot."""
+
+    slot: Slot
+    """Slot that the availability refers to."""
 
     instance: Instance | None
-    """Instance that is currently being streamed."""
+    """Instance that is currently being streamed in the slot."""
+
+
+@datamodel
+class Availability:
+    """Availability of streams."""
+
+    slots: Sequence[SlotAvailability]
+    """Availability of each slot."""
 
     checked_at: datetime
     """Datetime in UTC at which the availability was checked."""
 
 
+@datamodel
+class AvailabilitySnapshot:
+    """Versioned snapshot of the availability of streams."""
+
+    version: int
+    """Version of the snapshot."""
+
+    availability: Availability
+    """Availability of streams."""
+
+    slots: bytes
+    """Availability of each slot encoded as JSON."""
+
+
 @datamodel
 class Credentials:
     """Credentials for accessing the stream."""
@@ -45,17 +98,56 @@ class Credentials:
     """Datetime in UTC at which the token expires if not used."""
 
 
+class EndReason(StrEnum):
+    """Reason why a stream ended."""
+
+    UNCONNECTED = "unconnected"
+    """Nobody connected to the stream before it was stopped."""
+
+    FINISHED = "finished"
+    """The stream was connected to and finished normally."""
+
+    ABORTED = "aborted"
+    """The stream was connected to, but stopped before finishing."""
+
+
+@datamodel
+class Progress:
+    """Progress of a stream reported by its pipeline."""
+
+    bitrate: float | None
+    """Bitrate of the outgoing stream in kilobits per second."""
+
+    size: int | None
+    """Total size of the outgoing stream in bytes."""
+
+    duration: timedelta | None
+    """Duration of the audio that was streamed so far."""
+
+    speed: float | None
+    """Processing speed relative to real time."""
+
+    finished: bool
+    """Whether this is the last update, written after the stream finished."""
+
+
 @datamodel
 class CheckRequest:
-    """Request to check the availability of a stream."""
+    """Request to check the availability of streams."""
+
+    version: int | None = None
+    """Version of the availability already known to the client."""
+
+    wait: timedelta | None = None
+    """Maximum time to wait for the availability to change."""
 
 
 @datamodel
 class CheckResponse:
-    """Response for checking the availability of a stream."""
+    """Response for checking the availability of streams."""
 
-    availability: Availability
-    """Availability of the stream."""
+    snapshot: AvailabilitySnapshot
+    """Snapshot of the availability of streams."""
 
 
 @datamodel
@@ -81,3 +173,6 @@ class ReserveResponse:
 
     credentials: Credentials
     """Credentials to use to connect to the stream."""
+
+    slot: Slot
+    """Slot that was reserved for the stream."""
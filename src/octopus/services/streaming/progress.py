@@ -0,0 +1,133 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import suppress
+from datetime import timedelta
+from pathlib import Path
+
+from octopus.services.streaming import models as m
+
+
+class ProgressParser:
+    """Parser of progress written by ffmpeg with the `-progress` option.
+
+    Progress is written in blocks of `key=value` lines,
+    each ending with a `progress` key that is either `continue` or `end`.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[str, str] = {}
+
+    def _parse_float(self, value: str | None, suffix: str) -> float | None:
+        if value is None:
+            return None
+
+        try:
+            return float(value.strip().removesuffix(suffix))
+        except ValueError:
+            return None
+
+    def _parse_int(self, value: str | None) -> int | None:
+        if value is None:
+            return None
+
+        try:
+            return int(value.strip())
+        except ValueError:
+            return None
+
+    def _parse_duration(self, value: str | None) -> timedelta | None:
+        microseconds = self._parse_int(value)
+        if microseconds is None or microseconds < 0:
+            return None
+
+        return timedelta(microseconds=microseconds)
+
+    def _build(self, values: dict[str, str]) -> m.Progress:
+        return m.Progress(
+            bitrate=self._parse_float(values.get("bitrate"), "kbits/s"),
+            size=self._parse_int(values.get("total_size")),
+            duration=self._parse_duration(values.get("out_time_us")),
+            speed=self._parse_float(values.get("speed"), "x"),
+            finished=values.get("progress") == "end",
+        )
+
+    def feed(self, line: str) -> m.Progress | None:
+        """Feed a line of output and return the progress if a block was completed."""
+        key, separator, value = line.strip().partition("=")
+        if not separator:
+            return None
+
+        self._values[key] = value
+
+        if key != "progress":
+            return None
+
+        values, self._values = self._values, {}
+        return self._build(values)
+
+
+class ProgressListener:
+    """Listener that receives progress of a stream over a Unix socket.
+
+    The pipeline of the stream connects to the socket and writes its progress,
+    which is parsed into updates.
+    Updates end after the listener is closed.
+
+    Args:
+        path: Path of the Unix socket to listen on.
+
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._updates = asyncio.Queue[m.Progress | None]()
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        """URL that the pipeline should write its progress to."""
+        return f"unix://{self._path}"
+
+    async def open(self) -> None:
+        """Start listening for progress."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Socket might be left over from a stream that was not stopped cleanly
+        self._path.unlink(missing_ok=True)
+
+        self._server = await asyncio.start_unix_server(self._handle, self._path)
+
+    async def close(self) -> None:
+        """Stop listening for progress and end the updates."""
+        server, self._server = self._server, None
+
+        if server is not None:
+            server.close()
+
+            # Waits for the connection of the pipeline to be handled completely
+            await server.wait_closed()
+
+        self._path.unlink(missing_ok=True)
+        self._updates.put_nowait(None)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        parser = ProgressParser()
+
+        try:
+            while line := await reader.readline():
+                if (progress := parser.feed(line.decode(errors="replace"))) is not None:
+                    self._updates.put_nowait(progress)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def updates(self) -> AsyncIterator[m.Progress]:
+        """Iterate over updates of the progress until the listener is closed."""
+        while (progress := await self._updates.get()) is not None:
+            yield progress
@@ -1,5 +1,7 @@
 from collections.abc import Mapping, Sequence
+from datetime import timedelta
 from math import ceil
+from pathlib import Path
 
 from pystreams.base import Stream
 from pystreams.ffmpeg import FFmpegNode, FFmpegStreamMetadata, FFmpegTeeNode
@@ -7,34 +9,50 @@ from pystreams.process import ProcessBasedStreamFactory, ProcessBasedStreamMetad
 
 from octopus.config.models import Config
 from octopus.services.apis.beaver import models as bm
+from octopus.services.latency import models as lm
+from octopus.services.resolver import models as rm
+from octopus.services.resolver.service import ResolverService
 from octopus.services.streaming import models as m
-from octopus.utils.time import awareutcnow, isostringify
+from octopus.utils.time import awareutcnow
 
 
 class Runner:
     """Utility class for building and running a stream."""
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, resolver: ResolverService) -> None:
         self._config = config
+        self._resolver = resolver
 
-    def _build_input(self, credentials: m.Credentials, port: int) -> FFmpegNode:
+    def _build_latency(self, latency: timedelta) -> int:
+        return ceil(latency.total_seconds() * 1000000)
+
+    def _build_input(
+        self,
+        credentials: m.Credentials,
+        port: int,
+        latency: lm.Latency,
+        progress: str,
+    ) -> FFmpegNode:
         timeout = credentials.expires_at - awareutcnow()
         timeout = ceil(timeout.total_seconds() * 1000000)
         timeout = max(timeout, 0)
 
         target = f"srt://{self._config.server.host}:{port}"
+        period = self._config.streaming.progress.period.total_seconds()
 
-        return FFmpegNode(
-            target=target,
-            options={
-                "listen_timeout": timeout,
-                "mode": "listener",
-                "passphrase": credentials.token,
-            },
-        )
+        options = {
+            "listen_timeout": timeout,
+            "mode": "listener",
+            "passphrase": credentials.token,
+            # ffmpeg accepts global options before any input, so they can go here
+            "progress": progress,
+            "stats_period": period,
+        }
+
+        if latency.ingest is not None:
+            options["latency"] = self._build_latency(latency.ingest)
 
-    def _build_ffmpeg_fifo_options(self, options: Mapping[str, str]) -> str:
-        return "\\:".join(f"{key}={value}" for key, value in options.items())
+        return FFmpegNode(target=target, options=options)
 
     def _build_ffmpeg_metadata_options(
         self, metadata: Mapping[str, str]
@@ -58,52 +76,43 @@ class Runner:
             case m.Format.OGG:
                 return "ogg"
 
-    def _map_content_type(self, fmt: m.Format) -> str:
-        match fmt:
-            case m.Format.OGG:
-                return "audio/ogg"
-
     def _build_dingo_output(
-        self, fmt: m.Format, *, options: Mapping[str, str] | None = None
+        self,
+        fmt: m.Format,
+        dingo: str,
+        latency: lm.Latency,
+        *,
+        options: Mapping[str, str] | None = None,
     ) -> FFmpegNode:
-        latency = ceil(self._config.streaming.latency.total_seconds() * 1000000)
-
         return FFmpegNode(
-            target=self._config.dingo.srt.url,
+            target=f"srt://{dingo}:{self._config.dingo.srt.port}",
             options={
                 **(options or {}),
                 "f": self._map_format(fmt),
-                "latency": latency,
+                "latency": self._build_latency(latency.egress),
                 "mode": "caller",
             },
         )
 
-    def _build_gecko_output(
-        self,
-        instance: bm.InstanceWithEventWithShow,
-        fmt: m.Format,
-        *,
-        options: Mapping[str, str] | None = None,
+    def _build_spool_output(
+        self, fmt: m.Format, spool: Path, *, options: Mapping[str, str] | None = None
     ) -> FFmpegNode:
-        target = f"{self._config.gecko.http.url}/recordings/{instance.event.id}/{isostringify(instance.start)}"
-
         return FFmpegNode(
-            target=target,
+            target=str(spool),
             options={
                 **(options or {}),
-                "content_type": self._map_content_type(fmt),
                 "f": self._map_format(fmt),
-                "method": "PUT",
             },
         )
 
-    def _build_output(
+    def _build_output(  # noqa: PLR0913
         self,
         instance: bm.InstanceWithEventWithShow,
         fmt: m.Format,
+        dingo: str,
+        latency: lm.Latency,
         metadata: Mapping[str, str] | None,
-        *,
-        record: bool,
+        spool: Path | None,
     ) -> FFmpegNode:
         options = {
             "acodec": "copy",
@@ -111,26 +120,14 @@ class Runner:
             "metadata": self._build_metadata(instance, metadata),
         }
 
-        if not record:
-            return self._build_dingo_output(fmt, options=options)
+        if spool is None:
+            return self._build_dingo_output(fmt, dingo, latency, options=options)
 
         return FFmpegTeeNode(
             nodes=[
-                self._build_dingo_output(fmt),
-                self._build_gecko_output(
-                    instance,
-                    fmt,
-                    options={
-                        "fifo_options": self._build_ffmpeg_fifo_options(
-                            {
-                                "drop_pkts_on_overflow": "1",
-                                "queue_size": "1024",
-                            }
-                        ),
-                        "onfail": "ignore",
-                        "use_fifo": "1",
-                    },
-                ),
+                self._build_dingo_output(fmt, dingo, latency),
+                # Failures of the spool shouldn't interrupt the live stream
+                self._build_spool_output(fmt, spool, options={"onfail": "ignore"}),
             ],
             options=options,
         )
@@ -141,13 +138,15 @@ class Runner:
         credentials: m.Credentials,
         port: int,
         fmt: m.Format,
+        dingo: str,
+        latency: lm.Latency,
         metadata: Mapping[str, str] | None,
-        *,
-        record: bool,
+        progress: str,
+        spool: Path | None,
     ) -> ProcessBasedStreamMetadata:
         return FFmpegStreamMetadata(
-            input=self._build_input(credentials, port),
-            output=self._build_output(instance, fmt, metadata, record=record),
+            input=self._build_input(credentials, port, latency, progress),
+            output=self._build_output(instance, fmt, dingo, latency, metadata, spool),
         )
 
     async def _run_stream(self, metadata: ProcessBasedStreamMetadata) -> Stream:
@@ -159,12 +158,28 @@ class Runner:
         credentials: m.Credentials,
         port: int,
         fmt: m.Format,
+        latency: lm.Latency,
         metadata: Mapping[str, str] | None,
-        *,
-        record: bool,
+        progress: str,
+        spool: Path | None,
     ) -> Stream:
-        """Run the stream."""
+        """Run the stream, writing its progress to the given URL.
+
+        If a spool path is given, the stream is also recorded to it.
+        """
+        # SRT needs an address, so the host is resolved without blocking the loop
+        resolve_request = rm.ResolveRequest(host=self._config.dingo.srt.host)
+        resolve_response = await self._resolver.resolve(resolve_request)
+
         meta = self._build_stream_metadata(
-            instance, credentials, port, fmt, metadata, record=record
+            instance,
+            credentials,
+            port,
+            fmt,
+            resolve_response.address,
+            latency,
+            metadata,
+            progress,
+            spool,
         )
         return await self._run_stream(meta)
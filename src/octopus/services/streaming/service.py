@@ -1,43 +1,89 @@
 import asyncio
+import logging
 import secrets
-from collections.abc import Mapping
+import time
+from collections.abc import Coroutine, Mapping, Sequence
+from contextlib import suppress
+from datetime import datetime
+from pathlib import Path
+from typing import Any
 
-from litestar.channels import ChannelsPlugin
-from pylocks.base import Lock
-from pystores.base import Store
+from pydantic import TypeAdapter
 from pystreams.base import Stream
 
 from octopus.config.models import Config
 from octopus.models.events import stream as ev
+from octopus.models.events.enums import EventType
 from octopus.models.events.types import Event
 from octopus.services.apis.beaver import errors as be
 from octopus.services.apis.beaver import models as bm
 from octopus.services.apis.beaver.service import BeaverService
+from octopus.services.events import models as evm
+from octopus.services.events.service import EventsService
+from octopus.services.latency import models as lm
+from octopus.services.latency.service import LatencyService
+from octopus.services.mirror import models as mm
+from octopus.services.mirror.service import MirrorService
+from octopus.services.recordings import errors as rce
+from octopus.services.recordings import models as rcm
+from octopus.services.recordings.service import RecordingsService
+from octopus.services.resolver import errors as rve
+from octopus.services.resolver.service import ResolverService
+from octopus.services.stats import models as stm
+from octopus.services.stats.service import StatsService
 from octopus.services.streaming import errors as e
 from octopus.services.streaming import models as m
+from octopus.services.streaming.progress import ProgressListener
 from octopus.services.streaming.runner import Runner
+from octopus.services.streaming.view import AvailabilityView
+from octopus.stores import errors as se
+from octopus.stores.base import Versioned, VersionedStore
 from octopus.utils.time import awareutcnow
 
+logger = logging.getLogger(__name__)
+
 
 class StreamingService:
     """Service to manage streaming."""
 
-    def __init__(
+    _slots = TypeAdapter[Sequence[ev.SlotAvailability]](Sequence[ev.SlotAvailability])
+
+    def __init__(  # noqa: PLR0913
         self,
         config: Config,
-        store: Store[m.Instance | None],
-        lock: Lock,
+        reservations: VersionedStore[m.Reservations],
         beaver: BeaverService,
-        channels: ChannelsPlugin,
+        mirror: MirrorService,
+        events: EventsService,
+        view: AvailabilityView,
+        resolver: ResolverService,
+        stats: StatsService,
+        latency: LatencyService,
+        recordings: RecordingsService,
     ) -> None:
         self._config = config
-        self._store = store
-        self._lock = lock
+        self._reservations = reservations
         self._beaver = beaver
-        self._channels = channels
+        self._mirror = mirror
+        self._events = events
+        self._view = view
+        self._resolver = resolver
+        self._stats = stats
+        self._latency = latency
+        self._recordings = recordings
         self._tasks = set[asyncio.Task]()
 
+    async def _get_mirrored_instance(
+        self, instance: m.Instance
+    ) -> bm.InstanceWithEventWithShow | None:
+        get_request = mm.GetRequest(event=instance.event, start=instance.start)
+        get_response = await self._mirror.get(get_request)
+        return get_response.instance
+
     async def _get_instance(self, instance: m.Instance) -> bm.InstanceWithEventWithShow:
+        if (mirrored := await self._get_mirrored_instance(instance)) is not None:
+            return mirrored
+
         instances_get_request = bm.InstancesGetRequest(
             event_id=instance.event,
             start=instance.start,
@@ -66,75 +112,605 @@ class StreamingService:
             expires_at=awareutcnow() + self._config.streaming.timeout,
         )
 
-    def _emit_event(self, event: Event) -> None:
-        data = event.model_dump_json(round_trip=True)
-        self._channels.publish(data, "events")
+    async def _emit_event(self, event: Event) -> None:
+        publish_request = evm.PublishRequest(event=event)
+        await self._events.publish(publish_request)
 
-    def _emit_availability_changed_event(self, instance: m.Instance | None) -> None:
-        self._emit_event(
+    async def _emit_availability_changed_event(
+        self, availability: ev.Availability, version: int
+    ) -> None:
+        await self._emit_event(
             ev.AvailabilityChangedEvent(
                 data=ev.AvailabilityChangedEventData(
-                    availability=ev.Availability.map(
-                        m.Availability(instance=instance, checked_at=awareutcnow())
+                    availability=availability, version=version
+                )
+            )
+        )
+
+    async def _emit_stream_ready_event(
+        self, instance: m.Instance, slot: m.Slot
+    ) -> None:
+        await self._emit_event(
+            ev.StreamReadyEvent(
+                data=ev.StreamReadyEventData(
+                    instance=ev.Instance.map(instance), slot=ev.Slot.map(slot)
+                )
+            )
+        )
+
+    async def _emit_stream_failed_event(
+        self, instance: m.Instance, slot: m.Slot
+    ) -> None:
+        await self._emit_event(
+            ev.StreamFailedEvent(
+                data=ev.StreamFailedEventData(
+                    instance=ev.Instance.map(instance), slot=ev.Slot.map(slot)
+                )
+            )
+        )
+
+    async def _emit_stream_connected_event(
+        self, instance: m.Instance, slot: m.Slot
+    ) -> None:
+        await self._emit_event(
+            ev.StreamConnectedEvent(
+                data=ev.StreamConnectedEventData(
+                    instance=ev.Instance.map(instance), slot=ev.Slot.map(slot)
+                )
+            )
+        )
+
+    async def _emit_stream_stats_event(
+        self, instance: m.Instance, slot: m.Slot, progress: m.Progress
+    ) -> None:
+        await self._emit_event(
+            ev.StreamStatsEvent(
+                data=ev.StreamStatsEventData(
+                    instance=ev.Instance.map(instance),
+                    slot=ev.Slot.map(slot),
+                    stats=ev.Stats.map(progress),
+                )
+            )
+        )
+
+    async def _emit_stream_ended_event(
+        self, instance: m.Instance, slot: m.Slot, reason: m.EndReason
+    ) -> None:
+        await self._emit_event(
+            ev.StreamEndedEvent(
+                data=ev.StreamEndedEventData(
+                    instance=ev.Instance.map(instance),
+                    slot=ev.Slot.map(slot),
+                    reason=reason,
+                )
+            )
+        )
+
+    def _supervise(self, coroutine: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _get_slot(self, slot: int) -> m.Slot:
+        return m.Slot(id=slot, port=self._config.server.ports.srt + slot)
+
+    def _get_availability(self, reservations: m.Reservations) -> m.Availability:
+        slots = [
+            m.SlotAvailability(
+                slot=self._get_slot(slot),
+                instance=reservation.instance if reservation is not None else None,
+            )
+            for slot, reservation in enumerate(reservations)
+        ]
+
+        return m.Availability(slots=slots, checked_at=awareutcnow())
+
+    def _encode_slots(self, availability: ev.Availability) -> bytes:
+        # Slots change rarely, so they are encoded once per change, not per check
+        return self._slots.dump_json(availability.slots, round_trip=True)
+
+    def _update_view(
+        self, reservations: Versioned[m.Reservations]
+    ) -> tuple[m.AvailabilitySnapshot, ev.Availability] | None:
+        availability = self._get_availability(reservations.value)
+
+        # Renewals of leases change the reservations but not the availability
+        current = self._view.snapshot
+        if current is not None and current.availability.slots == availability.slots:
+            return None
+
+        data = ev.Availability.map(availability)
+        snapshot = self._view.update(
+            reservations.version, availability, self._encode_slots(data)
+        )
+
+        return (snapshot, data) if snapshot is not None else None
+
+    async def _availability_changed(
+        self, reservations: Versioned[m.Reservations]
+    ) -> None:
+        # Skip changes that were already superseded by newer ones
+        if (updated := self._update_view(reservations)) is not None:
+            snapshot, data = updated
+            await self._emit_availability_changed_event(data, snapshot.version)
+
+    async def _get_reservations(self) -> Versioned[m.Reservations]:
+        try:
+            return await self._reservations.get()
+        except se.StoreError as ex:
+            raise e.ServiceError from ex
+
+    async def _set_reservations(
+        self, version: int, reservations: m.Reservations
+    ) -> Versioned[m.Reservations] | None:
+        try:
+            return await self._reservations.compare_and_set(version, reservations)
+        except se.StoreError as ex:
+            raise e.ServiceError from ex
+
+    def _is_expired(self, reservation: m.Reservation | None, now: datetime) -> bool:
+        return reservation is not None and reservation.expires_at <= now
+
+    def _without_expired(
+        self, reservations: Versioned[m.Reservations]
+    ) -> m.Reservations:
+        # Leases are measured with the clock of the store,
+        # so replicas with skewed clocks can't steal live leases from each other
+        return tuple(
+            None if self._is_expired(reservation, reservations.read_at) else reservation
+            for reservation in reservations.value
+        )
+
+    async def _clear_expired_slots(self) -> Versioned[m.Reservations] | None:
+        while True:
+            current = await self._get_reservations()
+            if not any(self._is_expired(r, current.read_at) for r in current.value):
+                return None
+
+            updated = await self._set_reservations(
+                current.version, self._without_expired(current)
+            )
+            if updated is not None:
+                return updated
+
+    async def _refresh(self) -> None:
+        # Only the replica that changed the reservations announces the change
+        if (cleared := await self._clear_expired_slots()) is not None:
+            await self._availability_changed(cleared)
+            return
+
+        # Catch up on changes whose announcements were missed
+        self._update_view(await self._get_reservations())
+
+    def _map_availability(self, availability: ev.Availability) -> m.Availability:
+        return m.Availability(
+            slots=[
+                m.SlotAvailability(
+                    slot=m.Slot(id=slot.id, port=slot.port),
+                    instance=m.Instance(
+                        event=slot.instance.event, start=slot.instance.start
                     )
+                    if slot.instance is not None
+                    else None,
                 )
+                for slot in availability.slots
+            ],
+            checked_at=availability.checked_at,
+        )
+
+    def _get_availability_changed_event(self) -> ev.AvailabilityChangedEvent | None:
+        if (snapshot := self._view.snapshot) is None:
+            return None
+
+        return ev.AvailabilityChangedEvent(
+            data=ev.AvailabilityChangedEventData(
+                availability=ev.Availability.map(snapshot.availability),
+                version=snapshot.version,
             )
         )
 
-    async def _reserve(self, instance: bm.InstanceWithEventWithShow) -> None:
-        async with self._lock:
-            current = await self._store.get()
+    async def _follow(self) -> None:
+        listen_request = evm.ListenRequest(types={EventType.AVAILABILITY_CHANGED})
+
+        # Listening ends if the backlog overflows, so it is simply restarted
+        while True:
+            listen_response = await self._events.listen(listen_request)
+
+            async for event in listen_response.events:
+                if not isinstance(event, ev.AvailabilityChangedEvent):
+                    continue
+
+                # Changes announced by any replica, including this one
+                self._view.update(
+                    event.data.version,
+                    self._map_availability(event.data.availability),
+                    self._encode_slots(event.data.availability),
+                )
+
+    async def _keep_refreshed(self) -> None:
+        interval = self._config.streaming.refresh.total_seconds()
+
+        while True:
+            # Keep serving the last known availability if the store is unavailable
+            with suppress(e.ServiceError):
+                await self._refresh()
+
+            await asyncio.sleep(interval)
+
+    async def _get_snapshot(self) -> m.AvailabilitySnapshot:
+        # The view is empty only until the first refresh
+        while (snapshot := self._view.snapshot) is None:
+            await self._refresh()
+
+        return snapshot
+
+    def _find_free_slot(
+        self, current: Versioned[m.Reservations], instance: m.Instance
+    ) -> int:
+        reservations = self._without_expired(current)
+
+        for reservation in reservations:
+            if reservation is not None and reservation.instance == instance:
+                raise e.StreamBusyError(instance)
+
+        for slot, reservation in enumerate(reservations):
+            if reservation is None:
+                return slot
+
+        raise e.NoFreeSlotError(len(reservations))
+
+    def _replace(
+        self,
+        reservations: m.Reservations,
+        slot: int,
+        reservation: m.Reservation | None,
+    ) -> m.Reservations:
+        return (*reservations[:slot], reservation, *reservations[slot + 1 :])
+
+    def _holds(
+        self, reservations: m.Reservations, slot: int, token: int
+    ) -> m.Reservation | None:
+        reservation = reservations[slot] if slot < len(reservations) else None
+        return (
+            reservation
+            if reservation is not None and reservation.token == token
+            else None
+        )
+
+    async def _claim_slot(
+        self, instance: m.Instance
+    ) -> tuple[int, int, Versioned[m.Reservations]]:
+        while True:
+            current = await self._get_reservations()
+            slot = self._find_free_slot(current, instance)
+
+            # Only one claim can succeed from a given version, so it is a unique token
+            reservation = m.Reservation(
+                instance=instance,
+                token=current.version,
+                expires_at=current.read_at + self._config.streaming.lease,
+            )
+            reservations = self._replace(current.value, slot, reservation)
+
+            # Retry if someone else changed the reservations in the meantime
+            updated = await self._set_reservations(current.version, reservations)
+            if updated is not None:
+                return slot, reservation.token, updated
+
+    async def _renew_slot(
+        self, slot: int, token: int
+    ) -> Versioned[m.Reservations] | None:
+        while True:
+            current = await self._get_reservations()
+
+            # The lease expired and the slot was claimed by someone else
+            if (reservation := self._holds(current.value, slot, token)) is None:
+                return None
+
+            renewed = m.Reservation(
+                instance=reservation.instance,
+                token=token,
+                expires_at=current.read_at + self._config.streaming.lease,
+            )
+            reservations = self._replace(current.value, slot, renewed)
+
+            updated = await self._set_reservations(current.version, reservations)
+            if updated is not None:
+                return updated
+
+    async def _free_slot(
+        self, slot: int, token: int
+    ) -> Versioned[m.Reservations] | None:
+        while True:
+            current = await self._get_reservations()
+
+            # Never free a slot that was claimed by someone else in the meantime
+            if self._holds(current.value, slot, token) is None:
+                return None
+
+            reservations = self._replace(current.value, slot, None)
 
-            if current is not None:
-                raise e.StreamBusyError(current)
+            updated = await self._set_reservations(current.version, reservations)
+            if updated is not None:
+                return updated
 
-            new = m.Instance(event=instance.event.id, start=instance.start)
-            await self._store.set(new)
-            self._emit_availability_changed_event(new)
+    async def _reserve(self, instance: m.Instance) -> tuple[m.Slot, int]:
+        slot, token, reservations = await self._claim_slot(instance)
 
-    async def _free_event(self) -> None:
-        async with self._lock:
-            await self._store.set(None)
-            self._emit_availability_changed_event(None)
+        await self._availability_changed(reservations)
+        return self._get_slot(slot), token
+
+    async def _free_event(self, slot: m.Slot, token: int) -> None:
+        reservations = await self._free_slot(slot.id, token)
+
+        if reservations is not None:
+            await self._availability_changed(reservations)
+
+    async def _keep_reserved(self, stream: Stream, slot: m.Slot, token: int) -> None:
+        lease = self._config.streaming.lease.total_seconds()
+        renewed_at = time.monotonic()
+
+        while True:
+            await asyncio.sleep(lease / 3)
+
+            # Lease is extended from the moment the store was read, not after the write
+            attempted_at = time.monotonic()
+
+            # Keep trying until the lease expires if the store is unavailable
+            try:
+                renewed = await self._renew_slot(slot.id, token)
+            except e.ServiceError:
+                if time.monotonic() - renewed_at < lease:
+                    continue
+
+                renewed = None
+
+            # The slot might already be used by someone else, so the stream must stop
+            if renewed is None:
+                await stream.end()
+                return
+
+            renewed_at = attempted_at
+
+    async def _report_progress(
+        self, listener: ProgressListener, instance: m.Instance, slot: m.Slot
+    ) -> m.EndReason:
+        interval = self._config.streaming.progress.interval.total_seconds()
+        reason = m.EndReason.UNCONNECTED
+        reported_at: float | None = None
+
+        start_request = stm.StartRequest(slot=slot.id, instance=instance)
+        await self._stats.start(start_request)
+
+        async for progress in listener.updates():
+            record_request = stm.RecordRequest(slot=slot.id, progress=progress)
+            await self._stats.record(record_request)
+
+            # Pipeline writes progress only after the input is connected
+            if reason == m.EndReason.UNCONNECTED:
+                reason = m.EndReason.ABORTED
+                await self._emit_stream_connected_event(instance, slot)
+
+            if progress.finished:
+                reason = m.EndReason.FINISHED
+
+            # Progress is cumulative, so skipped updates are covered by later ones
+            now = time.monotonic()
+            if (
+                progress.finished
+                or reported_at is None
+                or now - reported_at >= interval
+            ):
+                reported_at = now
+                await self._emit_stream_stats_event(instance, slot, progress)
+
+        return reason
+
+    async def _observe(self, instance: m.Instance, slot: m.Slot) -> None:
+        get_request = stm.GetRequest(slot=slot.id)
+        get_response = await self._stats.get(get_request)
+
+        for stream in get_response.streams:
+            observe_request = lm.ObserveRequest(
+                event=instance.event, samples=stream.samples
+            )
+            await self._latency.observe(observe_request)
+
+    async def _spool(self, recording: rcm.Recording) -> Path:
+        spool_request = rcm.SpoolRequest(recording=recording)
+
+        try:
+            spool_response = await self._recordings.spool(spool_request)
+        except rce.ServiceError as ex:
+            raise e.ServiceError from ex
+
+        return spool_response.path
+
+    async def _finish_recording(self, recording: rcm.Recording | None) -> None:
+        if recording is None:
+            return
+
+        finish_request = rcm.FinishRequest(recording=recording)
+
+        # Recording stays in the spool if it can't be finished
+        with suppress(rce.ServiceError):
+            await self._recordings.finish(finish_request)
+
+    async def _clean_up(
+        self, listener: ProgressListener, recording: rcm.Recording | None
+    ) -> None:
+        await listener.close()
+        await self._finish_recording(recording)
+
+    async def _watch_stream(  # noqa: PLR0913
+        self,
+        stream: Stream,
+        listener: ProgressListener,
+        recording: rcm.Recording | None,
+        instance: m.Instance,
+        slot: m.Slot,
+        token: int,
+    ) -> None:
+        renewal = asyncio.create_task(self._keep_reserved(stream, slot, token))
+        reporting = asyncio.create_task(self._report_progress(listener, instance, slot))
 
-    async def _watch_stream(self, stream: Stream) -> None:
         try:
             await stream.wait()
+        except asyncio.CancelledError:
+            # Nobody would watch the stream anymore, so it can't be left running
+            await stream.end()
+            raise
         finally:
-            await self._free_event()
+            renewal.cancel()
+
+            with suppress(asyncio.CancelledError):
+                await renewal
+
+            await listener.close()
+            reason = await reporting
+
+            if reason != m.EndReason.UNCONNECTED:
+                await self._observe(instance, slot)
 
-    async def _run(
+            await self._free_event(slot, token)
+            await self._emit_stream_ended_event(instance, slot, reason)
+            await self._finish_recording(recording)
+
+    async def _run(  # noqa: PLR0913
         self,
         instance: bm.InstanceWithEventWithShow,
         credentials: m.Credentials,
+        slot: m.Slot,
+        token: int,
         fmt: m.Format,
         metadata: Mapping[str, str] | None,
         *,
         record: bool,
     ) -> None:
-        runner = Runner(self._config)
-        stream = await runner.run(
-            instance=instance,
-            credentials=credentials,
-            port=self._config.server.ports.srt,
-            fmt=fmt,
-            metadata=metadata,
-            record=record,
+        runner = Runner(self._config, self._resolver)
+        reserved = m.Instance(event=instance.event.id, start=instance.start)
+
+        choose_request = lm.ChooseRequest(event=instance.event.id)
+        choose_response = await self._latency.choose(choose_request)
+
+        recording = (
+            rcm.Recording(event=instance.event.id, start=instance.start)
+            if record
+            else None
         )
+        spool = await self._spool(recording) if recording is not None else None
 
-        task = asyncio.create_task(self._watch_stream(stream))
-        self._tasks.add(task)
-        task.add_done_callback(self._tasks.discard)
+        listener = ProgressListener(
+            self._config.streaming.progress.sockets / f"{slot.port}.sock"
+        )
 
-    async def check(self, request: m.CheckRequest) -> m.CheckResponse:
-        """Check the availability of the stream."""
-        async with self._lock:
-            instance = await self._store.get()
+        # Recording is already followed, so it must be finished on any failure
+        try:
+            await listener.open()
+            stream = await runner.run(
+                instance=instance,
+                credentials=credentials,
+                port=slot.port,
+                fmt=fmt,
+                latency=choose_response.latency,
+                metadata=metadata,
+                progress=listener.url,
+                spool=spool,
+            )
+        except rve.ServiceError as ex:
+            await self._clean_up(listener, recording)
+            raise e.ServiceError from ex
+        except:
+            await self._clean_up(listener, recording)
+            raise
 
-        return m.CheckResponse(
-            availability=m.Availability(instance=instance, checked_at=awareutcnow())
+        self._supervise(
+            self._watch_stream(stream, listener, recording, reserved, slot, token)
         )
 
+    async def _start(  # noqa: PLR0913
+        self,
+        instance: bm.InstanceWithEventWithShow,
+        credentials: m.Credentials,
+        slot: m.Slot,
+        token: int,
+        fmt: m.Format,
+        metadata: Mapping[str, str] | None,
+        *,
+        record: bool,
+    ) -> None:
+        reserved = m.Instance(event=instance.event.id, start=instance.start)
+
+        try:
+            await self._run(
+                instance, credentials, slot, token, fmt, metadata, record=record
+            )
+        except:
+            # The failure is reported even if the slot can't be freed right now
+            try:
+                await self._emit_stream_failed_event(reserved, slot)
+            finally:
+                await self._free_event(slot, token)
+
+            raise
+
+        await self._emit_stream_ready_event(reserved, slot)
+
+    async def _start_in_background(  # noqa: PLR0913
+        self,
+        instance: bm.InstanceWithEventWithShow,
+        credentials: m.Credentials,
+        slot: m.Slot,
+        token: int,
+        fmt: m.Format,
+        metadata: Mapping[str, str] | None,
+        *,
+        record: bool,
+    ) -> None:
+        # The response was already sent, so failures are reported only with events
+        try:
+            await self._start(
+                instance, credentials, slot, token, fmt, metadata, record=record
+            )
+        except Exception:
+            logger.exception("Failed to start a stream in slot %d.", slot.id)
+
+    async def open(self) -> None:
+        """Start keeping the availability up to date in the background."""
+        # Subscribers that missed changes get the current availability instead
+        provide_request = evm.ProvideRequest(
+            type=EventType.AVAILABILITY_CHANGED,
+            snapshot=self._get_availability_changed_event,
+        )
+        await self._events.provide(provide_request)
+
+        self._supervise(self._follow())
+        self._supervise(self._keep_refreshed())
+
+    async def close(self) -> None:
+        """Stop all streams and background tasks."""
+        tasks = list(self._tasks)
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def check(self, request: m.CheckRequest) -> m.CheckResponse:
+        """Check the availability of streams."""
+        snapshot = await self._get_snapshot()
+
+        if request.wait is not None:
+            version = (
+                request.version if request.version is not None else snapshot.version
+            )
+
+            with suppress(TimeoutError):
+                async with asyncio.timeout(request.wait.total_seconds()):
+                    snapshot = await self._view.changed(version)
+
+        return m.CheckResponse(snapshot=snapshot)
+
     async def reserve(self, request: m.ReserveRequest) -> m.ReserveResponse:
         """Reserve a stream."""
         instance = await self._get_instance(request.instance)
@@ -144,18 +720,32 @@ class StreamingService:
 
         credentials = self._generate_credentials()
 
-        await self._reserve(instance)
+        slot, token = await self._reserve(
+            m.Instance(event=instance.event.id, start=instance.start)
+        )
 
-        try:
-            await self._run(
+        if self._config.streaming.background:
+            # Respond right away, the stream can't be connected to much sooner anyway
+            self._supervise(
+                self._start_in_background(
+                    instance,
+                    credentials,
+                    slot,
+                    token,
+                    request.format,
+                    request.metadata,
+                    record=request.record,
+                )
+            )
+        else:
+            await self._start(
                 instance,
                 credentials,
+                slot,
+                token,
                 request.format,
                 request.metadata,
                 record=request.record,
             )
-        except:
-            await self._free_event()
-            raise
 
-        return m.ReserveResponse(credentials=credentials)
+        return m.ReserveResponse(credentials=credentials, slot=slot)
@@ -0,0 +1,47 @@
+import asyncio
+
+from octopus.services.streaming import models as m
+
+
+class AvailabilityView:
+    """Materialized view of the availability of streams.
+
+    Keeps the latest availability as a snapshot
+    versioned the same as the reservations it was built from,
+    so it can be served without rebuilding it on every check.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: m.AvailabilitySnapshot | None = None
+        self._changed = asyncio.Event()
+
+    @property
+    def snapshot(self) -> m.AvailabilitySnapshot | None:
+        """Latest snapshot or None if the view was never updated."""
+        return self._snapshot
+
+    def update(
+        self, version: int, availability: m.Availability, slots: bytes
+    ) -> m.AvailabilitySnapshot | None:
+        """Replace the snapshot with a newer version and wake up waiters.
+
+        Returns the new snapshot or None if the current one is not older.
+        """
+        if self._snapshot is not None and self._snapshot.version >= version:
+            return None
+
+        self._snapshot = m.AvailabilitySnapshot(
+            version=version, availability=availability, slots=slots
+        )
+
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+        return self._snapshot
+
+    async def changed(self, version: int | None) -> m.AvailabilitySnapshot:
+        """Wait until the version of the snapshot is different from the given one."""
+        while self._snapshot is None or self._snapshot.version == version:
+            await self._changed.wait()
+
+        return self._snapshot
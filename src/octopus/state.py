@@ -1,23 +1,47 @@
 from litestar.datastructures import State as LitestarState
-from pylocks.base import Lock
-from pystores.base import Store
 
 from octopus.config.models import Config
 from octopus.services.apis.beaver.service import BeaverService
-from octopus.services.streaming.models import Instance
+from octopus.services.container import Services
+from octopus.services.events.history import EventsHistory
+from octopus.services.events.registry import ConnectionsRegistry
+from octopus.services.mirror.service import MirrorService
+from octopus.services.recordings.service import RecordingsService
+from octopus.services.resolver.service import ResolverService
+from octopus.services.streaming.models import Reservations
+from octopus.services.streaming.view import AvailabilityView
+from octopus.stores.base import VersionedStore
 
 
 class State(LitestarState):
     """Use this class as a type hint for the state of the service."""
 
+    availability: AvailabilityView
+    """Materialized view of the availability of streams."""
+
     beaver: BeaverService
     """Service for beaver API."""
 
     config: Config
     """Configuration for the service."""
 
-    lock: Lock
-    """Lock for the store."""
+    connections: ConnectionsRegistry
+    """Registry of active connections of subscribers to events."""
+
+    history: EventsHistory
+    """History of recent events for replaying."""
+
+    mirror: MirrorService
+    """Service for the schedule mirror."""
+
+    recordings: RecordingsService
+    """Service for recordings."""
+
+    resolver: ResolverService
+    """Service for resolving hosts."""
+
+    reservations: VersionedStore[Reservations]
+    """Store for the instances currently streamed in each slot."""
 
-    store: Store[Instance | None]
-    """Store for the state of currently streamed instance."""
+    services: Services
+    """Services shared by all requests."""
@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from octopus.models.base import datamodel
+
+
+@datamodel
+class Versioned[T]:
+    """Value with the version it was stored at."""
+
+    value: T
+    """Stored value."""
+
+    version: int
+    """Version of the value."""
+
+    read_at: datetime
+    """Datetime in UTC at which the value was read, according to the clock of the store."""
+
+
+class VersionedStore[T](ABC):
+    """Store of a single value with versions and atomic compare-and-set.
+
+    Every successful write increases the version,
+    so writers can detect that the value changed since they read it.
+    Every read also tells the time of the store,
+    so replicas with different clocks can still agree on when something expires.
+    """
+
+    async def open(self) -> None:
+        """Open resources needed to access the store."""
+        return
+
+    async def close(self) -> None:
+        """Close resources needed to access the store."""
+        return
+
+    @abstractmethod
+    async def get(self) -> Versioned[T]:
+        """Get the current value with its version."""
+
+    @abstractmethod
+    async def compare_and_set(self, version: int, value: T) -> Versioned[T] | None:
+        """Set the value only if the current version matches the given one.
+
+        Returns the new value with its version or None if the version didn't match.
+        """
@@ -0,0 +1,2 @@
+class StoreError(Exception):
+    """Raised when a store can't be reached or fails to handle a request."""
@@ -0,0 +1,40 @@
+import time
+from typing import override
+
+from octopus.stores.base import Versioned, VersionedStore
+from octopus.utils.time import awareutcnow
+
+
+class MemoryVersionedStore[T](VersionedStore[T]):
+    """Versioned store that keeps the value in memory.
+
+    Reads and writes never wait, so they are atomic within an event loop.
+    Versions start from the current time in microseconds,
+    so they keep increasing across restarts of the service.
+
+    Args:
+        default: Initial value.
+
+    """
+
+    def __init__(self, default: T) -> None:
+        self._value = default
+        self._version = time.time_ns() // 1000
+
+    def _read(self) -> Versioned[T]:
+        return Versioned(
+            value=self._value, version=self._version, read_at=awareutcnow()
+        )
+
+    @override
+    async def get(self) -> Versioned[T]:
+        return self._read()
+
+    @override
+    async def compare_and_set(self, version: int, value: T) -> Versioned[T] | None:
+        if self._version != version:
+            return None
+
+        self._value = value
+        self._version = version + 1
+        return self._read()
@@ -0,0 +1,27 @@
+from pydantic import JsonValue
+
+from octopus.models.base import SerializableModel
+from octopus.utils.time import UTCDatetime
+
+
+class StoredValue(SerializableModel):
+    """Value stored on the store server with its version."""
+
+    value: JsonValue
+    """Stored value or null if nothing was stored yet."""
+
+    version: int
+    """Version of the value."""
+
+    read_at: UTCDatetime
+    """Datetime in UTC at which the value was read, according to the clock of the server."""
+
+
+class CompareAndSetRequest(SerializableModel):
+    """Request to set the value on the store server if the version matches."""
+
+    version: int
+    """Version that the current value must have."""
+
+    value: JsonValue
+    """New value."""
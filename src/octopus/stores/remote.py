@@ -0,0 +1,118 @@
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from http import HTTPStatus
+from typing import override
+
+from httpx import AsyncClient, AsyncHTTPTransport, HTTPError, Response
+from pydantic import TypeAdapter, ValidationError
+
+from octopus.config.models import StoreHTTPConfig
+from octopus.stores import errors as e
+from octopus.stores import models as m
+from octopus.stores.base import Versioned, VersionedStore
+
+
+class RemoteVersionedStore[T](VersionedStore[T]):
+    """Versioned store that keeps the value on a store server.
+
+    All replicas of the service connected to the same server share the value.
+    The server decides which compare-and-set wins,
+    so versions act as fencing tokens across replicas:
+    a replica that acted on an outdated value can't overwrite newer ones.
+    Times of reads come from the clock of the server, which all replicas share.
+
+    Args:
+        config: Configuration for the HTTP API of the store server.
+        adapter: Adapter for converting values to and from JSON.
+        default: Value to use while nothing is stored on the server.
+
+    """
+
+    def __init__(
+        self, config: StoreHTTPConfig, adapter: TypeAdapter[T], default: T
+    ) -> None:
+        self._config = config
+        self._adapter = adapter
+        self._default = default
+        self._client: AsyncClient | None = None
+
+    def _build_client(self) -> AsyncClient:
+        timeout = self._config.timeout
+
+        socket = self._config.socket
+
+        return AsyncClient(
+            base_url=self._config.url,
+            timeout=timeout.total_seconds() if timeout is not None else None,
+            transport=AsyncHTTPTransport(uds=str(socket))
+            if socket is not None
+            else None,
+        )
+
+    @asynccontextmanager
+    async def _get_client(self) -> AsyncGenerator[AsyncClient]:
+        if self._client is not None:
+            yield self._client
+            return
+
+        async with self._build_client() as client:
+            yield client
+
+    @override
+    async def open(self) -> None:
+        if self._client is None:
+            self._client = self._build_client()
+
+    @override
+    async def close(self) -> None:
+        client, self._client = self._client, None
+
+        if client is not None:
+            await client.aclose()
+
+    def _parse(self, response: Response) -> Versioned[T]:
+        try:
+            stored = m.StoredValue.model_validate_json(response.content)
+            value = (
+                self._default
+                if stored.value is None
+                else self._adapter.validate_python(stored.value)
+            )
+        except ValidationError as ex:
+            raise e.StoreError from ex
+
+        return Versioned(value=value, version=stored.version, read_at=stored.read_at)
+
+    @override
+    async def get(self) -> Versioned[T]:
+        try:
+            async with self._get_client() as client:
+                response = await client.get("/value")
+                response.raise_for_status()
+        except HTTPError as ex:
+            raise e.StoreError from ex
+
+        return self._parse(response)
+
+    @override
+    async def compare_and_set(self, version: int, value: T) -> Versioned[T] | None:
+        request = m.CompareAndSetRequest(
+            version=version, value=self._adapter.dump_python(value, mode="json")
+        )
+
+        try:
+            async with self._get_client() as client:
+                response = await client.put(
+                    "/value",
+                    content=request.model_dump_json(),
+                    headers={"Content-Type": "application/json"},
+                )
+
+                if response.status_code == HTTPStatus.CONFLICT:
+                    return None
+
+                response.raise_for_status()
+        except HTTPError as ex:
+            raise e.StoreError from ex
+
+        return self._parse(response)
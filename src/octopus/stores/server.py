@@ -0,0 +1,73 @@
+import typer
+import uvicorn
+from litestar import Litestar, Response, get, put
+from litestar.status_codes import HTTP_200_OK, HTTP_409_CONFLICT
+from pydantic import JsonValue
+
+from octopus.api.plugins.pydantic import PydanticPlugin
+from octopus.cli import CliBuilder
+from octopus.stores import models as m
+from octopus.stores.memory import MemoryVersionedStore
+
+cli = CliBuilder().build()
+
+
+class StoreServerBuilder:
+    """Builds a store server that keeps a single versioned value in memory.
+
+    It is a stand-in for a shared store,
+    used to run several replicas of the service locally and in tests.
+    """
+
+    def build(self) -> Litestar:
+        """Build the server."""
+        store = MemoryVersionedStore[JsonValue](None)
+
+        @get("/value")
+        async def get_value() -> m.StoredValue:
+            current = await store.get()
+            return m.StoredValue(
+                value=current.value,
+                version=current.version,
+                read_at=current.read_at,
+            )
+
+        @put("/value", status_code=HTTP_200_OK)
+        async def set_value(data: m.CompareAndSetRequest) -> Response[m.StoredValue]:
+            updated = await store.compare_and_set(data.version, data.value)
+
+            if updated is None:
+                current = await store.get()
+                return Response(
+                    m.StoredValue(
+                        value=current.value,
+                        version=current.version,
+                        read_at=current.read_at,
+                    ),
+                    status_code=HTTP_409_CONFLICT,
+                )
+
+            return Response(
+                m.StoredValue(
+                    value=updated.value,
+                    version=updated.version,
+                    read_at=updated.read_at,
+                )
+            )
+
+        return Litestar(
+            route_handlers=[get_value, set_value], plugins=[PydanticPlugin()]
+        )
+
+
+@cli.command()
+def main(
+    host: str = typer.Option("localhost", help="Host to run the server on."),
+    port: int = typer.Option(10310, help="Port to run the server on."),
+) -> None:
+    """Run a store server for sharing state between replicas."""
+    uvicorn.run(StoreServerBuilder().build(), host=host, port=port)
+
+
+if __name__ == "__main__":
+    cli()
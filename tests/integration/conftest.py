@@ -1,15 +1,21 @@
 import asyncio
 from collections.abc import AsyncGenerator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from datetime import UTC
 
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient, BasicAuth
 from litestar import Litestar
 from litestar.testing import AsyncTestClient
+from uvicorn import Config as UvicornConfig
+from uvicorn import Server as UvicornServer
 
 from octopus.api.app import AppBuilder
 from octopus.config.builder import ConfigBuilder
 from octopus.config.models import Config
+from octopus.stores.server import StoreServerBuilder
+from octopus.utils.time import isostringify, naiveutcnow
 from tests.utils.containers import AsyncDockerContainer
 from tests.utils.waiting.conditions import CallableCondition, CommandCondition
 from tests.utils.waiting.strategies import TimeoutStrategy
@@ -179,6 +185,38 @@ async def beaver(
         yield container
 
 
+@pytest_asyncio.fixture(loop_scope="session", scope="session")
+async def store(config: Config) -> AsyncGenerator[UvicornServer]:
+    """Run store server."""
+
+    async def _check() -> None:
+        async with AsyncClient(base_url=config.store.http.url) as client:
+            response = await client.get("/value")
+            response.raise_for_status()
+
+    server = UvicornServer(
+        UvicornConfig(
+            StoreServerBuilder().build(),
+            host=config.store.http.host,
+            port=config.store.http.port or 80,
+        )
+    )
+
+    waiter = Waiter(
+        condition=CallableCondition(_check),
+        strategy=TimeoutStrategy(30),
+    )
+
+    task = asyncio.create_task(server.serve())
+
+    try:
+        await waiter.wait()
+        yield server
+    finally:
+        server.should_exit = True
+        await task
+
+
 @pytest_asyncio.fixture(loop_scope="session", scope="session")
 async def gecko_client(
     gecko: AsyncDockerContainer,
@@ -206,3 +244,57 @@ async def client(
     """Build test client."""
     async with AsyncTestClient(app=app) as client:
         yield client
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def show_manager(
+    beaver_client: AsyncClient,
+) -> AbstractAsyncContextManager[dict]:
+    """Context manager that sets up a show in the database."""
+
+    @asynccontextmanager
+    async def _setup_show() -> AsyncGenerator[dict]:
+        response = await beaver_client.post("/shows", json={"title": "foo"})
+        response.raise_for_status()
+
+        show = response.json()
+
+        try:
+            yield show
+        finally:
+            response = await beaver_client.delete(f"/shows/{show['id']}")
+            response.raise_for_status()
+
+    return _setup_show()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def event_manager(
+    beaver_client: AsyncClient, show_manager: AbstractAsyncContextManager[dict]
+) -> AbstractAsyncContextManager[dict]:
+    """Context manager that sets up an event in the database."""
+
+    @asynccontextmanager
+    async def _setup_event() -> AsyncGenerator[dict]:
+        async with show_manager as show:
+            response = await beaver_client.post(
+                "/events",
+                json={
+                    "type": "live",
+                    "showId": show["id"],
+                    "start": isostringify(naiveutcnow()),
+                    "duration": "PT1H",
+                    "timezone": str(UTC),
+                },
+            )
+            response.raise_for_status()
+
+            event = response.json()
+
+            try:
+                yield event
+            finally:
+                response = await beaver_client.delete(f"/events/{event['id']}")
+                response.raise_for_status()
+
+    return _setup_event()
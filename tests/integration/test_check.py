@@ -1,7 +1,7 @@
 from datetime import datetime
 
 import pytest
-from litestar.status_codes import HTTP_200_OK
+from litestar.status_codes import HTTP_200_OK, HTTP_304_NOT_MODIFIED
 from litestar.testing import AsyncTestClient
 
 
@@ -14,11 +14,39 @@ async def test_get(client: AsyncTestClient) -> None:
     assert status == HTTP_200_OK
 
     data = response.json()
-    assert "instance" in data
+    assert "slots" in data
     assert "checkedAt" in data
 
-    instance = data["instance"]
-    assert instance is None
+    slots = data["slots"]
+    assert isinstance(slots, list)
+    assert len(slots) > 0
+
+    for slot in slots:
+        assert "id" in slot
+        assert "port" in slot
+        assert "instance" in slot
+
+        instance = slot["instance"]
+        assert instance is None
 
     checked_at = data["checkedAt"]
     assert datetime.fromisoformat(checked_at)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_not_modified(client: AsyncTestClient) -> None:
+    """Test if GET /check returns 304 when availability did not change."""
+    response = await client.get("/check")
+
+    status = response.status_code
+    assert status == HTTP_200_OK
+
+    etag = response.headers["ETag"]
+    assert etag
+
+    response = await client.get("/check", headers={"If-None-Match": etag})
+
+    status = response.status_code
+    assert status == HTTP_304_NOT_MODIFIED
+
+    assert response.headers["ETag"] == etag
@@ -0,0 +1,57 @@
+from contextlib import AbstractAsyncContextManager
+
+import pytest
+from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED
+from litestar.testing import AsyncTestClient
+
+
+def _get_value(text: str, name: str) -> float:
+    """Get the value of an unlabelled metric from the Prometheus text format."""
+    for line in text.splitlines():
+        if line.startswith(f"{name} "):
+            return float(line.removeprefix(f"{name} "))
+
+    message = f"Metric {name} not found."
+    raise AssertionError(message)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get(client: AsyncTestClient) -> None:
+    """Test if GET /metrics returns correct response."""
+    response = await client.get("/metrics")
+
+    status = response.status_code
+    assert status == HTTP_200_OK
+
+    content_type = response.headers.get("Content-Type")
+    assert content_type is not None
+    assert content_type.startswith("text/plain")
+
+    assert "# TYPE octopus_stream_bitrate_kilobits_per_second gauge" in response.text
+    assert "# TYPE octopus_beaver_cache_hits_total counter" in response.text
+    assert "# TYPE octopus_resolver_lookup_latency_seconds gauge" in response.text
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_reserved(
+    client: AsyncTestClient, event_manager: AbstractAsyncContextManager[dict]
+) -> None:
+    """Test if GET /metrics counts lookups made for reservations."""
+    async with event_manager as event:
+        response = await client.post(
+            "/reserve",
+            json={"instance": {"event": event["id"], "start": event["start"]}},
+        )
+
+    status = response.status_code
+    assert status == HTTP_201_CREATED
+
+    response = await client.get("/metrics")
+
+    status = response.status_code
+    assert status == HTTP_200_OK
+
+    # Streams are sent to dingo, so its host must have been resolved at least once
+    hits = _get_value(response.text, "octopus_resolver_hits_total")
+    misses = _get_value(response.text, "octopus_resolver_misses_total")
+    assert hits + misses >= 1
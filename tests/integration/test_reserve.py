@@ -1,68 +1,43 @@
 from collections.abc import AsyncGenerator
-from contextlib import AbstractAsyncContextManager, asynccontextmanager
-from datetime import UTC, datetime
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime
 
 import pytest
 import pytest_asyncio
-from httpx import AsyncClient
 from litestar.status_codes import HTTP_201_CREATED
 from litestar.testing import AsyncTestClient
 
-from octopus.utils.time import isostringify, naiveutcnow
+from octopus.api.app import AppBuilder
+from octopus.config.models import Config
+from tests.utils.containers import AsyncDockerContainer
+from tests.utils.waiting.conditions import CallableCondition
+from tests.utils.waiting.strategies import TimeoutStrategy
+from tests.utils.waiting.waiter import Waiter
 
 
 @pytest_asyncio.fixture(loop_scope="session")
-async def show_manager(
-    beaver_client: AsyncClient,
-) -> AbstractAsyncContextManager[dict]:
-    """Context manager that sets up a show in the database."""
-
-    @asynccontextmanager
-    async def _setup_show() -> AsyncGenerator[dict]:
-        response = await beaver_client.post("/shows", json={"title": "foo"})
-        response.raise_for_status()
-
-        show = response.json()
-
-        try:
-            yield show
-        finally:
-            response = await beaver_client.delete(f"/shows/{show['id']}")
-            response.raise_for_status()
-
-    return _setup_show()
-
-
-@pytest_asyncio.fixture(loop_scope="session")
-async def event_manager(
-    beaver_client: AsyncClient, show_manager: AbstractAsyncContextManager[dict]
-) -> AbstractAsyncContextManager[dict]:
-    """Context manager that sets up an event in the database."""
-
-    @asynccontextmanager
-    async def _setup_event() -> AsyncGenerator[dict]:
-        async with show_manager as show:
-            response = await beaver_client.post(
-                "/events",
-                json={
-                    "type": "live",
-                    "showId": show["id"],
-                    "start": isostringify(naiveutcnow()),
-                    "duration": "PT1H",
-                    "timezone": str(UTC),
-                },
-            )
-            response.raise_for_status()
-
-            event = response.json()
-
-            try:
-                yield event
-            finally:
-                response = await beaver_client.delete(f"/events/{event['id']}")
-                response.raise_for_status()
-
-    return _setup_event()
+async def background_client(
+    config: Config,
+    dingo: AsyncDockerContainer,
+    gecko: AsyncDockerContainer,
+) -> AsyncGenerator[AsyncTestClient]:
+    """Build test client for an app that starts streams in the background."""
+    # Use other ports, so streams don't clash with the ones of the main app
+    config = config.model_copy(
+        update={
+            "server": config.server.model_copy(
+                update={
+                    "ports": config.server.ports.model_copy(
+                        update={"srt": config.server.ports.srt + config.streaming.slots}
+                    )
+                }
+            ),
+            "streaming": config.streaming.model_copy(update={"background": True}),
+        }
+    )
+
+    async with AsyncTestClient(app=AppBuilder(config).build()) as client:
+        yield client
 
 
 @pytest.mark.asyncio(loop_scope="session")
@@ -81,6 +56,7 @@ async def test_post(
 
     data = response.json()
     assert "credentials" in data
+    assert "slot" in data
 
     credentials = data["credentials"]
     assert "token" in credentials
@@ -93,3 +69,42 @@ async def test_post(
     expires_at = credentials["expiresAt"]
     assert isinstance(expires_at, str)
     assert datetime.fromisoformat(expires_at)
+
+    slot = data["slot"]
+    assert "id" in slot
+    assert "port" in slot
+
+    port = slot["port"]
+    assert isinstance(port, int)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_post_background(
+    background_client: AsyncTestClient,
+    event_manager: AbstractAsyncContextManager[dict],
+) -> None:
+    """Test if POST /reserve starts the stream after responding in background mode."""
+    async with event_manager as event:
+        response = await background_client.post(
+            "/reserve",
+            json={"instance": {"event": event["id"], "start": event["start"]}},
+        )
+
+        status = response.status_code
+        assert status == HTTP_201_CREATED
+
+        slot = response.json()["slot"]
+
+        async def _check() -> None:
+            response = await background_client.get("/stats")
+            response.raise_for_status()
+
+            streams = response.json()["streams"]
+            assert any(stream["slot"] == slot["id"] for stream in streams)
+
+        waiter = Waiter(
+            condition=CallableCondition(_check),
+            strategy=TimeoutStrategy(30),
+        )
+
+        await waiter.wait()
@@ -0,0 +1,227 @@
+import json
+from collections.abc import AsyncGenerator, Sequence
+from datetime import timedelta
+
+import pytest
+import pytest_asyncio
+from litestar.status_codes import (
+    HTTP_200_OK,
+    HTTP_429_TOO_MANY_REQUESTS,
+    HTTP_503_SERVICE_UNAVAILABLE,
+)
+from litestar.testing import AsyncTestClient
+
+from octopus.api.app import AppBuilder
+from octopus.config.models import Config
+from octopus.models.events import stream as sev
+from octopus.models.events import test as tev
+from octopus.models.events.enums import EventType
+from octopus.services.events.channels import EventChannels
+from octopus.services.events.frames import FrameParser
+from tests.utils.containers import AsyncDockerContainer
+from tests.utils.waiting.conditions import CallableCondition
+from tests.utils.waiting.strategies import TimeoutStrategy
+from tests.utils.waiting.waiter import Waiter
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def sse_client(
+    config: Config,
+    dingo: AsyncDockerContainer,
+    gecko: AsyncDockerContainer,
+) -> AsyncGenerator[AsyncTestClient]:
+    """Build test client for an app that closes connections shortly after opening."""
+    # Test client waits for the whole response, so streams have to end on their own
+    config = config.model_copy(
+        update={
+            "events": config.events.model_copy(
+                update={
+                    "connections": config.events.connections.model_copy(
+                        update={
+                            "lifetime": timedelta(seconds=1),
+                            "retry": timedelta(seconds=1),
+                            "jitter": timedelta(),
+                        }
+                    )
+                }
+            )
+        }
+    )
+
+    async with AsyncTestClient(app=AppBuilder(config).build()) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def limited_client(
+    config: Config,
+    dingo: AsyncDockerContainer,
+    gecko: AsyncDockerContainer,
+) -> AsyncGenerator[AsyncTestClient]:
+    """Build test client for an app that allows only a few connections."""
+    config = config.model_copy(
+        update={
+            "events": config.events.model_copy(
+                update={
+                    "connections": config.events.connections.model_copy(
+                        update={
+                            "limit": 2,
+                            "client": 1,
+                            "lifetime": timedelta(seconds=1),
+                            "retry": timedelta(seconds=1),
+                            "jitter": timedelta(),
+                        }
+                    )
+                }
+            )
+        }
+    )
+
+    async with AsyncTestClient(app=AppBuilder(config).build()) as client:
+        yield client
+
+
+def _parse_frames(content: bytes) -> Sequence[bytes]:
+    frames = [frame + b"\r\n\r\n" for frame in content.split(b"\r\n\r\n") if frame]
+    return [frame for frame in frames if frame.startswith(b"id: ")]
+
+
+async def _publish(client: AsyncTestClient, message: str) -> None:
+    response = await client.get(
+        "/test", params={"parameters": json.dumps({"message": message})}
+    )
+    response.raise_for_status()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_resume(sse_client: AsyncTestClient) -> None:
+    """Test if GET /sse replays events published after Last-Event-ID."""
+    history = sse_client.app.state.history
+    position = history.last
+
+    messages = ["foo", "bar"]
+
+    for message in messages:
+        await _publish(sse_client, message)
+
+    channel = EventChannels().get(EventType.TEST)
+
+    async def _check() -> None:
+        assert len(history.replay([channel], position)) == len(messages)
+
+    # Events get their identifiers when they are delivered in the background
+    waiter = Waiter(
+        condition=CallableCondition(_check),
+        strategy=TimeoutStrategy(30),
+    )
+    await waiter.wait()
+
+    response = await sse_client.get(
+        "/sse",
+        params={"types": EventType.TEST},
+        headers={"Last-Event-ID": str(position)},
+    )
+
+    status = response.status_code
+    assert status == HTTP_200_OK
+
+    parser = FrameParser()
+    frames = _parse_frames(response.content)
+    assert len(frames) == len(messages)
+
+    ids = [parser.id(frame) for frame in frames]
+    assert all(event_id > position for event_id in ids)
+    assert ids == sorted(ids)
+
+    events = [parser.event(frame) for frame in frames]
+
+    for event, message in zip(events, messages, strict=True):
+        assert isinstance(event, tev.TestEvent)
+        assert event.data.message == message
+
+    # Clients are told when to reconnect before the connection is closed
+    assert b"retry: 1000\r\n" in response.content
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_resume_snapshot(sse_client: AsyncTestClient) -> None:
+    """Test if GET /sse sends the current availability when events can't be replayed."""
+    response = await sse_client.get("/check")
+    response.raise_for_status()
+
+    # Identifiers from before the start of the service can't be replayed
+    response = await sse_client.get(
+        "/sse",
+        params={"types": EventType.AVAILABILITY_CHANGED},
+        headers={"Last-Event-ID": "0"},
+    )
+
+    status = response.status_code
+    assert status == HTTP_200_OK
+
+    parser = FrameParser()
+    frames = _parse_frames(response.content)
+    assert len(frames) >= 1
+
+    event = parser.event(frames[0])
+    assert isinstance(event, sev.AvailabilityChangedEvent)
+    assert len(event.data.availability.slots) > 0
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_too_many_client_connections(limited_client: AsyncTestClient) -> None:
+    """Test if GET /sse returns 429 when the client has too many connections."""
+    connections = limited_client.app.state.connections
+
+    # Test client always connects from the same address
+    connection = connections.open("testclient")
+
+    try:
+        response = await limited_client.get("/sse")
+    finally:
+        connections.close(connection)
+
+    status = response.status_code
+    assert status == HTTP_429_TOO_MANY_REQUESTS
+
+    headers = response.headers
+    assert "Retry-After" in headers
+    assert headers["Retry-After"] == "1"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_too_many_connections(limited_client: AsyncTestClient) -> None:
+    """Test if GET /sse returns 503 when there are too many connections in total."""
+    connections = limited_client.app.state.connections
+
+    opened = [connections.open("foo"), connections.open("bar")]
+
+    try:
+        response = await limited_client.get("/sse")
+    finally:
+        for connection in opened:
+            connections.close(connection)
+
+    status = response.status_code
+    assert status == HTTP_503_SERVICE_UNAVAILABLE
+
+    headers = response.headers
+    assert "Retry-After" in headers
+    assert headers["Retry-After"] == "1"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_after_connections_closed(limited_client: AsyncTestClient) -> None:
+    """Test if GET /sse accepts connections again after others are closed."""
+    connections = limited_client.app.state.connections
+
+    connection = connections.open("testclient")
+    connections.close(connection)
+
+    response = await limited_client.get("/sse")
+
+    status = response.status_code
+    assert status == HTTP_200_OK
+
+    # Connections are released once their streams end
+    assert connections.count == 0
@@ -0,0 +1,64 @@
+from contextlib import AbstractAsyncContextManager
+
+import pytest
+from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED
+from litestar.testing import AsyncTestClient
+
+from tests.utils.waiting.conditions import CallableCondition
+from tests.utils.waiting.strategies import TimeoutStrategy
+from tests.utils.waiting.waiter import Waiter
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get(client: AsyncTestClient) -> None:
+    """Test if GET /stats returns correct response."""
+    response = await client.get("/stats")
+
+    status = response.status_code
+    assert status == HTTP_200_OK
+
+    data = response.json()
+    assert "streams" in data
+
+    streams = data["streams"]
+    assert isinstance(streams, list)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_reserved(
+    client: AsyncTestClient, event_manager: AbstractAsyncContextManager[dict]
+) -> None:
+    """Test if GET /stats includes streams of reservations."""
+    async with event_manager as event:
+        response = await client.post(
+            "/reserve",
+            json={"instance": {"event": event["id"], "start": event["start"]}},
+        )
+
+        status = response.status_code
+        assert status == HTTP_201_CREATED
+
+        slot = response.json()["slot"]
+
+        async def _check() -> None:
+            response = await client.get("/stats")
+            response.raise_for_status()
+
+            streams = [
+                stream
+                for stream in response.json()["streams"]
+                if stream["slot"] == slot["id"]
+            ]
+            assert len(streams) == 1
+
+            stream = streams[0]
+            assert stream["instance"]["event"] == event["id"]
+            assert stream["instance"]["start"] == event["start"]
+            assert isinstance(stream["samples"], list)
+
+        waiter = Waiter(
+            condition=CallableCondition(_check),
+            strategy=TimeoutStrategy(30),
+        )
+
+        await waiter.wait()
@@ -0,0 +1,41 @@
+import pytest
+from pydantic import TypeAdapter
+from uvicorn import Server as UvicornServer
+
+from octopus.config.models import Config
+from octopus.stores.remote import RemoteVersionedStore
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_remote_compare_and_set(config: Config, store: UvicornServer) -> None:
+    """Test if only one of replicas sharing a remote store wins a conflicting write."""
+    first = RemoteVersionedStore(
+        config=config.store.http, adapter=TypeAdapter(int), default=0
+    )
+    second = RemoteVersionedStore(
+        config=config.store.http, adapter=TypeAdapter(int), default=0
+    )
+
+    await first.open()
+    await second.open()
+
+    try:
+        current = await first.get()
+        other = await second.get()
+        assert (other.value, other.version) == (current.value, current.version)
+
+        # Both replicas see the time of the same server
+        assert other.read_at >= current.read_at
+
+        updated = await first.compare_and_set(current.version, current.value + 1)
+        assert updated is not None
+        assert updated.version > current.version
+
+        conflicting = await second.compare_and_set(current.version, current.value + 2)
+        assert conflicting is None
+
+        latest = await second.get()
+        assert (latest.value, latest.version) == (updated.value, updated.version)
+    finally:
+        await first.close()
+        await second.close()
@@ -0,0 +1,10 @@
+from octopus.api.app import AppBuilder
+from octopus.config.builder import ConfigBuilder
+
+
+def test_build() -> None:
+    """Test if the app with all its routes can be imported and built."""
+    app = AppBuilder(ConfigBuilder().build()).build()
+
+    paths = {route.path for route in app.routes}
+    assert {"/check", "/metrics", "/ping", "/reserve", "/sse", "/stats"} <= paths
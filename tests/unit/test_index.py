@@ -0,0 +1,113 @@
+import struct
+from datetime import timedelta
+from pathlib import Path
+
+from octopus.services.recordings.index import SeekIndexBuilder
+from tests.utils.ogg import RATE, OggBuilder
+
+INTERVAL = timedelta(seconds=10)
+SKIP = 312
+
+
+def _build_recording(path: Path, seconds: int) -> tuple[int, int]:
+    """Write a recording with a page every second and get the sizes of its parts."""
+    builder = OggBuilder(skip=SKIP)
+    granules = [SKIP + i * RATE for i in range(1, seconds + 1)]
+
+    path.write_bytes(builder.build(granules))
+
+    headers = len(b"".join(builder.headers()))
+    page = len(builder.page(0, b"a" * 300))
+
+    return headers, page
+
+
+def test_build(tmp_path: Path) -> None:
+    """Test if entries are added at the start of audio and then every interval."""
+    path = tmp_path / "recording.ogg"
+    seconds = 30
+    headers, page = _build_recording(path, seconds)
+
+    index = SeekIndexBuilder(INTERVAL).build(path)
+
+    assert len(index) == timedelta(seconds=seconds) // INTERVAL + 1
+
+    # Audio from the start is found at the first page after the codec headers
+    assert index.find(timedelta()) == headers
+
+    # Audio after an entry starts after the page that ends at the entry
+    assert index.find(timedelta(seconds=10)) == headers + 10 * page
+    assert index.find(timedelta(seconds=25)) == headers + 20 * page
+    assert index.find(timedelta(seconds=45)) == headers + 30 * page
+
+
+def test_build_empty(tmp_path: Path) -> None:
+    """Test if a recording without audio has an empty index."""
+    path = tmp_path / "recording.ogg"
+    _build_recording(path, 0)
+
+    index = SeekIndexBuilder(INTERVAL).build(path)
+
+    assert len(index) == 0
+    assert index.find(timedelta()) is None
+
+
+def test_find_before_start(tmp_path: Path) -> None:
+    """Test if nothing is found for times before the start of audio."""
+    path = tmp_path / "recording.ogg"
+    _build_recording(path, 30)
+
+    index = SeekIndexBuilder(INTERVAL).build(path)
+
+    assert index.find(-timedelta(seconds=1)) is None
+
+
+def test_to_bytes(tmp_path: Path) -> None:
+    """Test if the binary form contains the header and all entries."""
+    path = tmp_path / "recording.ogg"
+    headers, page = _build_recording(path, 30)
+
+    index = SeekIndexBuilder(INTERVAL).build(path)
+    data = index.to_bytes()
+
+    header = struct.Struct("<4sBIIQ")
+    magic, version, rate, skip, count = header.unpack_from(data)
+
+    assert magic == b"OIDX"
+    assert version == 1
+    assert rate == RATE
+    assert skip == SKIP
+    assert count == len(index)
+
+    assert len(data) == header.size + 2 * 8 * count
+
+    entries = struct.unpack_from(f"<{2 * count}q", data, header.size)
+    granules, offsets = entries[:count], entries[count:]
+
+    assert granules == (0, *(SKIP + i * RATE for i in (10, 20, 30)))
+    assert offsets == (headers, *(headers + i * page for i in (10, 20, 30)))
+
+
+def test_feed(tmp_path: Path) -> None:
+    """Test if an index built while writing equals one built at once."""
+    builder = OggBuilder(skip=SKIP)
+    data = builder.build([SKIP + i * RATE for i in range(1, 31)])
+
+    path = tmp_path / "recording.ogg"
+    path.write_bytes(b"")
+
+    incremental = SeekIndexBuilder(INTERVAL)
+
+    # Writes don't have to end on page boundaries
+    chunk = 1000
+
+    for start in range(0, len(data), chunk):
+        with path.open("ab") as file:
+            file.write(data[start : start + chunk])
+
+        incremental.feed(path)
+
+    index = incremental.build(path)
+    expected = SeekIndexBuilder(INTERVAL).build(path)
+
+    assert index.to_bytes() == expected.to_bytes()
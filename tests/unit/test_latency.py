@@ -0,0 +1,96 @@
+from collections.abc import Sequence
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+
+from octopus.config.models import Config, LatencyConfig
+from octopus.services.latency import models as m
+from octopus.services.latency.service import LatencyService
+from octopus.services.stats import models as stm
+from octopus.utils.time import awareutcnow
+
+PERIOD = timedelta(seconds=1)
+
+
+def _build_samples(steps: Sequence[float]) -> Sequence[stm.Sample]:
+    """Build samples taken every period with audio advancing by the given steps."""
+    start = awareutcnow()
+    durations = [timedelta()]
+
+    for step in steps:
+        durations.append(durations[-1] + step * PERIOD)
+
+    return [
+        stm.Sample(
+            sampled_at=start + index * PERIOD,
+            bitrate=None,
+            size=None,
+            duration=duration,
+            speed=None,
+        )
+        for index, duration in enumerate(durations)
+    ]
+
+
+async def _observe_and_choose(
+    service: LatencyService, samples: Sequence[stm.Sample]
+) -> m.Latency:
+    event = uuid4()
+
+    await service.observe(m.ObserveRequest(event=event, samples=samples))
+    response = await service.choose(m.ChooseRequest(event=event))
+
+    return response.latency
+
+
+@pytest.mark.asyncio
+async def test_choose_not_adaptive() -> None:
+    """Test if the listener latency is left at the default when not adapting."""
+    config = Config(latency=LatencyConfig(adaptive=False))
+
+    service = LatencyService(config)
+    response = await service.choose(m.ChooseRequest(event=uuid4()))
+
+    assert response.latency.ingest is None
+    assert response.latency.egress == config.streaming.latency
+
+
+@pytest.mark.asyncio
+async def test_observe_stall() -> None:
+    """Test if a stall late in a stream raises its latency."""
+    config = Config(latency=LatencyConfig(adaptive=True))
+    service = LatencyService(config)
+
+    # Cumulative speed stays above the lag, but one interval is much slower
+    latency = await _observe_and_choose(service, _build_samples([1.0] * 30 + [0.2]))
+
+    assert latency.ingest == config.streaming.latency * config.latency.increase
+
+
+@pytest.mark.asyncio
+async def test_observe_steady() -> None:
+    """Test if a stream that keeps up lowers its latency."""
+    config = Config(latency=LatencyConfig(adaptive=True))
+    service = LatencyService(config)
+
+    latency = await _observe_and_choose(service, _build_samples([1.0] * 30))
+
+    assert latency.ingest == config.streaming.latency * config.latency.decrease
+
+
+@pytest.mark.asyncio
+async def test_observe_without_durations() -> None:
+    """Test if samples without durations don't change latency."""
+    config = Config(latency=LatencyConfig(adaptive=True))
+    service = LatencyService(config)
+
+    samples = [
+        stm.Sample(
+            sampled_at=awareutcnow(), bitrate=None, size=None, duration=None, speed=0.1
+        )
+    ]
+
+    latency = await _observe_and_choose(service, samples)
+
+    assert latency.ingest == config.streaming.latency
@@ -0,0 +1,110 @@
+import hashlib
+from datetime import timedelta
+from itertools import pairwise
+from pathlib import Path
+from uuid import uuid4
+
+from octopus.services.recordings import models as m
+from octopus.services.recordings.manifest import ManifestBuilder
+from octopus.utils.time import naiveutcnow
+from tests.utils.ogg import RATE, OggBuilder
+
+DURATION = timedelta(seconds=10)
+
+
+def _build_recording() -> m.Recording:
+    return m.Recording(event=uuid4(), start=naiveutcnow())
+
+
+def test_build(tmp_path: Path) -> None:
+    """Test if a manifest without segmentation describes the whole recording."""
+    granules = [i * RATE for i in range(1, 11)]
+
+    path = tmp_path / "recording.ogg"
+    path.write_bytes(data := OggBuilder().build(granules))
+
+    recording = _build_recording()
+    manifest = ManifestBuilder(None).build(recording, path)
+
+    assert manifest.event == recording.event
+    assert manifest.start == recording.start
+    assert manifest.size == len(data)
+    assert manifest.sha256 == hashlib.sha256(data).hexdigest()
+
+    # Each page with codec headers finishes a packet too
+    assert manifest.packets == len(granules) + 2
+
+    (segment,) = manifest.segments
+    assert segment.index == 0
+    assert segment.offset == 0
+    assert segment.size == len(data)
+    assert segment.sha256 == manifest.sha256
+    assert segment.start == timedelta()
+    assert segment.end == timedelta(seconds=len(granules))
+
+
+def test_build_segments(tmp_path: Path) -> None:
+    """Test if segments can be reassembled into the recording."""
+    granules = [i * RATE for i in range(1, 31)]
+
+    path = tmp_path / "recording.ogg"
+    path.write_bytes(data := OggBuilder().build(granules))
+
+    manifest = ManifestBuilder(DURATION).build(_build_recording(), path)
+
+    segments = manifest.segments
+    assert [segment.index for segment in segments] == list(range(len(segments)))
+    assert len(segments) == timedelta(seconds=len(granules)) // DURATION
+
+    parts = [data[s.offset : s.offset + s.size] for s in segments]
+    assert b"".join(parts) == data
+
+    for segment, part in zip(segments, parts, strict=True):
+        assert segment.sha256 == hashlib.sha256(part).hexdigest()
+        assert segment.end - segment.start == DURATION
+
+    for previous, segment in pairwise(segments):
+        assert segment.start == previous.end
+
+    assert sum(segment.packets for segment in segments) == manifest.packets
+
+
+def test_build_incomplete(tmp_path: Path) -> None:
+    """Test if an incomplete page at the end is kept in the last segment."""
+    data = OggBuilder().build([RATE]) + b"OggS\x00"
+
+    path = tmp_path / "recording.ogg"
+    path.write_bytes(data)
+
+    manifest = ManifestBuilder(None).build(_build_recording(), path)
+
+    assert manifest.size == len(data)
+    assert manifest.sha256 == hashlib.sha256(data).hexdigest()
+    assert manifest.segments[-1].offset + manifest.segments[-1].size == len(data)
+
+
+def test_feed(tmp_path: Path) -> None:
+    """Test if a manifest built while writing equals one built at once."""
+    builder = OggBuilder()
+    granules = [i * RATE for i in range(1, 31)]
+    data = builder.build(granules)
+
+    path = tmp_path / "recording.ogg"
+    path.write_bytes(b"")
+
+    recording = _build_recording()
+    incremental = ManifestBuilder(DURATION)
+
+    # Writes don't have to end on page boundaries
+    chunk = 1000
+
+    for start in range(0, len(data), chunk):
+        with path.open("ab") as file:
+            file.write(data[start : start + chunk])
+
+        incremental.feed(path)
+
+    manifest = incremental.build(recording, path)
+    expected = ManifestBuilder(DURATION).build(recording, path)
+
+    assert manifest == expected
@@ -0,0 +1,110 @@
+from datetime import timedelta
+from itertools import pairwise
+from pathlib import Path
+
+from octopus.services.recordings.ogg import DEFAULT_RATE, OggClock, OggReader
+from tests.utils.ogg import RATE, OggBuilder
+
+
+def test_pages(tmp_path: Path) -> None:
+    """Test if all pages are read with their positions and sizes."""
+    granules = [RATE, 2 * RATE, 3 * RATE]
+
+    path = tmp_path / "recording.ogg"
+    path.write_bytes(data := OggBuilder().build(granules))
+
+    with path.open("rb") as file:
+        pages = list(OggReader(file).pages())
+
+    assert [page.granule for page in pages] == [0, 0, *granules]
+    assert all(page.packets == 1 for page in pages)
+
+    assert pages[0].offset == 0
+    for previous, page in pairwise(pages):
+        assert page.offset == previous.offset + previous.size
+
+    assert sum(page.size for page in pages) == len(data)
+
+
+def test_pages_offset(tmp_path: Path) -> None:
+    """Test if pages are read starting at an offset."""
+    path = tmp_path / "recording.ogg"
+    path.write_bytes(OggBuilder().build([RATE, 2 * RATE]))
+
+    with path.open("rb") as file:
+        reader = OggReader(file)
+        pages = list(reader.pages())
+        rest = list(reader.pages(pages[2].offset))
+
+    assert rest == pages[2:]
+
+
+def test_pages_incomplete(tmp_path: Path) -> None:
+    """Test if reading stops at the first incomplete page."""
+    builder = OggBuilder()
+    data = builder.build([RATE])
+    page = builder.page(2 * RATE, b"a" * 300)
+
+    path = tmp_path / "recording.ogg"
+    path.write_bytes(data + page[:-1])
+
+    with path.open("rb") as file:
+        pages = list(OggReader(file).pages())
+
+    assert sum(page.size for page in pages) == len(data)
+
+
+def test_pages_invalid(tmp_path: Path) -> None:
+    """Test if reading stops at the first invalid page."""
+    data = OggBuilder().build([RATE])
+
+    path = tmp_path / "recording.ogg"
+    path.write_bytes(data + b"garbage" * 10)
+
+    with path.open("rb") as file:
+        pages = list(OggReader(file).pages())
+
+    assert sum(page.size for page in pages) == len(data)
+
+
+def test_packets(tmp_path: Path) -> None:
+    """Test if packets spanning several lacing values are counted once."""
+    builder = OggBuilder()
+
+    # Packets of a multiple of 255 bytes end with a zero lacing value
+    path = tmp_path / "recording.ogg"
+    path.write_bytes(builder.page(RATE, b"a" * 255 * 2))
+
+    with path.open("rb") as file:
+        reader = OggReader(file)
+        (page,) = reader.pages()
+        body = reader.body(page)
+
+    assert page.packets == 1
+    assert body == b"a" * 255 * 2
+
+
+def test_clock(tmp_path: Path) -> None:
+    """Test if the clock of an Opus stream takes pre-skip into account."""
+    skip = 312
+
+    path = tmp_path / "recording.ogg"
+    path.write_bytes(OggBuilder(skip=skip).build([RATE]))
+
+    with path.open("rb") as file:
+        clock = OggReader(file).clock()
+
+    assert clock == OggClock(rate=RATE, skip=skip)
+    assert clock.time(skip + RATE) == timedelta(seconds=1)
+    assert clock.time(0) == timedelta()
+
+
+def test_clock_unknown(tmp_path: Path) -> None:
+    """Test if the default clock is used for unknown codecs."""
+    path = tmp_path / "recording.ogg"
+    path.write_bytes(OggBuilder().page(0, b"unknown"))
+
+    with path.open("rb") as file:
+        clock = OggReader(file).clock()
+
+    assert clock == OggClock(rate=DEFAULT_RATE, skip=0)
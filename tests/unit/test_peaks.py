@@ -0,0 +1,99 @@
+import struct
+from collections.abc import Sequence
+
+import pytest
+
+from octopus.services.recordings import peaks
+
+np = pytest.importorskip("numpy")
+
+RATE = 8000
+RESOLUTION = 100
+FACTOR = 4
+LEVELS = 3
+
+
+def _build_samples(count: int) -> bytes:
+    samples = np.sin(np.arange(count) / 10) * 1000 + np.arange(count) % 7
+    return samples.astype("<i2").tobytes()
+
+
+def _parse(data: bytes) -> tuple[tuple, Sequence]:
+    header = struct.Struct("<4sBIIIB")
+    values = header.unpack_from(data)
+    offset = header.size
+
+    levels = []
+    for _ in range(values[-1]):
+        (count,) = struct.unpack_from("<Q", data, offset)
+        offset += 8
+
+        level = np.frombuffer(data, dtype="<i2", count=3 * count, offset=offset)
+        levels.append(level.reshape(count, 3))
+        offset += 3 * 2 * count
+
+    assert offset == len(data)
+    return values, levels
+
+
+def _reduce(samples: bytes, size: int) -> Sequence[tuple[int, int, int]]:
+    values = np.frombuffer(samples, dtype="<i2").astype(np.float64)
+
+    return [
+        (
+            int(block.min()),
+            int(block.max()),
+            round(float(np.sqrt(np.mean(block**2)))),
+        )
+        for block in (values[i : i + size] for i in range(0, len(values), size))
+    ]
+
+
+def test_is_available() -> None:
+    """Test if peaks are available when NumPy is installed."""
+    assert peaks.is_available()
+
+
+def test_build() -> None:
+    """Test if peaks of each zoom level summarize the audio."""
+    # Last block is shorter than the others
+    samples = _build_samples(RESOLUTION * FACTOR**2 + RESOLUTION // 2)
+
+    builder = peaks.PeaksBuilder(RATE, RESOLUTION, FACTOR, LEVELS)
+    builder.feed(samples)
+
+    header, levels = _parse(builder.build())
+
+    assert header == (b"OPKS", 1, RATE, RESOLUTION, FACTOR, LEVELS)
+    assert len(levels) == LEVELS
+
+    for index, level in enumerate(levels):
+        expected = _reduce(samples, RESOLUTION * FACTOR**index)
+        assert [tuple(int(value) for value in peak) for peak in level] == expected
+
+
+def test_feed_blocks() -> None:
+    """Test if audio fed in blocks gives the same peaks as audio fed at once."""
+    samples = _build_samples(RESOLUTION * FACTOR**2 + RESOLUTION // 2)
+
+    whole = peaks.PeaksBuilder(RATE, RESOLUTION, FACTOR, LEVELS)
+    whole.feed(samples)
+
+    # Blocks don't have to end on sample boundaries
+    blocks = peaks.PeaksBuilder(RATE, RESOLUTION, FACTOR, LEVELS)
+    chunk = 333
+
+    for start in range(0, len(samples), chunk):
+        blocks.feed(samples[start : start + chunk])
+
+    assert blocks.build() == whole.build()
+
+
+def test_build_empty() -> None:
+    """Test if audio without samples gives empty zoom levels."""
+    builder = peaks.PeaksBuilder(RATE, RESOLUTION, FACTOR, LEVELS)
+
+    _, levels = _parse(builder.build())
+
+    assert len(levels) == LEVELS
+    assert all(len(level) == 0 for level in levels)
@@ -0,0 +1,84 @@
+from datetime import timedelta
+
+from octopus.services.streaming.progress import ProgressParser
+
+
+def test_feed() -> None:
+    """Test if a completed block of progress is parsed."""
+    parser = ProgressParser()
+
+    bitrate, size, duration, speed = 128.0, 1024, timedelta(seconds=2.5), 1.01
+
+    lines = [
+        f"bitrate= {bitrate}kbits/s\n",
+        f"total_size={size}\n",
+        f"out_time_us={duration // timedelta(microseconds=1)}\n",
+        f"speed={speed}x\n",
+    ]
+
+    for line in lines:
+        assert parser.feed(line) is None
+
+    progress = parser.feed("progress=continue\n")
+    assert progress is not None
+
+    assert progress.bitrate == bitrate
+    assert progress.size == size
+    assert progress.duration == duration
+    assert progress.speed == speed
+    assert not progress.finished
+
+
+def test_feed_end() -> None:
+    """Test if the last block of progress is marked as finished."""
+    parser = ProgressParser()
+
+    size = 2048
+
+    assert parser.feed(f"total_size={size}\n") is None
+
+    progress = parser.feed("progress=end\n")
+    assert progress is not None
+
+    assert progress.size == size
+    assert progress.finished
+
+
+def test_feed_unknown() -> None:
+    """Test if values that ffmpeg can't determine yet are parsed as unknown."""
+    parser = ProgressParser()
+
+    lines = [
+        "bitrate=N/A\n",
+        "total_size=N/A\n",
+        "out_time_us=-9223372036854775807\n",
+        "speed=N/A\n",
+    ]
+
+    for line in lines:
+        assert parser.feed(line) is None
+
+    progress = parser.feed("progress=continue\n")
+    assert progress is not None
+
+    assert progress.bitrate is None
+    assert progress.size is None
+    assert progress.duration is None
+    assert progress.speed is None
+
+
+def test_feed_blocks() -> None:
+    """Test if values don't leak from one block of progress to the next one."""
+    parser = ProgressParser()
+
+    assert parser.feed("total_size=1024\n") is None
+    assert parser.feed("progress=continue\n") is not None
+
+    # Lines that are not key-value pairs are ignored
+    assert parser.feed("\n") is None
+    assert parser.feed("garbage\n") is None
+
+    progress = parser.feed("progress=continue\n")
+    assert progress is not None
+
+    assert progress.size is None
@@ -0,0 +1,47 @@
+import pytest
+
+from octopus.config.models import EventsConnectionsConfig
+from octopus.services.events import errors as e
+from octopus.services.events.registry import ConnectionsRegistry
+
+LIMIT = 10
+CLIENT = 5
+WORKERS = 4
+
+
+def _build_registry() -> ConnectionsRegistry:
+    config = EventsConnectionsConfig(limit=LIMIT, client=CLIENT)
+    return ConnectionsRegistry(config, workers=WORKERS)
+
+
+def test_limit_split() -> None:
+    """Test if the total limit is split between workers and rounded up."""
+    registry = _build_registry()
+
+    for index in range(3):
+        registry.open(f"client-{index}")
+
+    with pytest.raises(e.TooManyConnectionsError):
+        registry.open("client-3")
+
+
+def test_client_split() -> None:
+    """Test if the limit for a single client is split between workers and rounded up."""
+    registry = _build_registry()
+
+    registry.open("client")
+    registry.open("client")
+
+    with pytest.raises(e.TooManyClientConnectionsError):
+        registry.open("client")
+
+
+def test_close() -> None:
+    """Test if closing a connection frees its place."""
+    registry = _build_registry()
+
+    connections = [registry.open(f"client-{index}") for index in range(3)]
+    registry.close(connections[0])
+
+    registry.open("client-3")
+    assert registry.count == len(connections)
@@ -0,0 +1,95 @@
+from typing import Literal
+
+import pytest
+from litestar.channels import ChannelsPlugin
+from litestar.channels.backends.memory import MemoryChannelsBackend
+
+from octopus.config.models import EventsBacklogConfig
+from octopus.services.events.subscriber import RESYNC, EventsSubscriber
+
+SIZE = 2
+
+
+def _build_subscriber(
+    policy: Literal["coalesce", "disconnect", "drop-oldest"], size: int = SIZE
+) -> EventsSubscriber:
+    plugin = ChannelsPlugin(
+        backend=MemoryChannelsBackend(), arbitrary_channels_allowed=True
+    )
+    config = EventsBacklogConfig(size=size, policy=policy)
+
+    return EventsSubscriber.configured(config)(plugin)
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest() -> None:
+    """Test if the drop-oldest policy drops the oldest waiting event."""
+    subscriber = _build_subscriber("drop-oldest")
+
+    assert subscriber.put_nowait(b"foo")
+    assert subscriber.put_nowait(b"bar")
+    assert subscriber.put_nowait(b"baz")
+
+    assert await subscriber.receive() == b"bar"
+    assert await subscriber.receive() == b"baz"
+
+    stats = subscriber.stats
+    assert stats.backlog == 0
+    assert stats.peak == SIZE
+    assert stats.dropped == 1
+    assert stats.resyncs == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesce() -> None:
+    """Test if the coalesce policy replaces waiting events with a resync marker."""
+    subscriber = _build_subscriber("coalesce")
+
+    assert subscriber.put_nowait(b"foo")
+    assert subscriber.put_nowait(b"bar")
+    assert not subscriber.put_nowait(b"baz")
+
+    assert await subscriber.receive() == RESYNC
+
+    stats = subscriber.stats
+    assert stats.backlog == 0
+    # The event that did not fit counts as dropped too
+    assert stats.dropped == SIZE + 1
+    assert stats.resyncs == 1
+
+    # Events published after the marker are delivered as usual
+    assert subscriber.put_nowait(b"qux")
+    assert await subscriber.receive() == b"qux"
+
+
+@pytest.mark.asyncio
+async def test_disconnect() -> None:
+    """Test if the disconnect policy ends the stream."""
+    subscriber = _build_subscriber("disconnect")
+
+    assert subscriber.put_nowait(b"foo")
+    assert subscriber.put_nowait(b"bar")
+    assert not subscriber.put_nowait(b"baz")
+
+    assert await subscriber.receive() is None
+
+    stats = subscriber.stats
+    assert stats.backlog == 0
+    assert stats.dropped == SIZE + 1
+    assert stats.resyncs == 0
+
+    # Nothing is delivered after the end of the stream
+    assert not subscriber.put_nowait(b"qux")
+    assert subscriber.stats.backlog == 0
+
+
+@pytest.mark.asyncio
+async def test_end_when_full() -> None:
+    """Test if the end of the stream is signalled even when the backlog is full."""
+    subscriber = _build_subscriber("drop-oldest", size=1)
+
+    assert subscriber.put_nowait(b"foo")
+    assert subscriber.put_nowait(None)
+
+    assert await subscriber.receive() == b"foo"
+    assert await subscriber.receive() is None
@@ -0,0 +1,47 @@
+import struct
+from collections.abc import Sequence
+
+RATE = 48000
+"""Number of granule positions per second of Opus streams."""
+
+
+class OggBuilder:
+    """Builder of synthetic Ogg Opus files with pages of arbitrary content.
+
+    Bodies of pages are not valid audio, only the structure of the file is.
+
+    Args:
+        skip: Pre-skip declared in the Opus header.
+
+    """
+
+    _header = struct.Struct("<4sBBqIIIB")
+    _serial = 1
+
+    def __init__(self, skip: int = 0) -> None:
+        self._skip = skip
+
+    def _lace(self, body: bytes) -> bytes:
+        lacing = [255] * (len(body) // 255)
+        lacing.append(len(body) % 255)
+        return bytes(lacing)
+
+    def page(self, granule: int, body: bytes) -> bytes:
+        """Build a page that finishes a single packet."""
+        lacing = self._lace(body)
+        header = self._header.pack(
+            b"OggS", 0, 0, granule, self._serial, 0, 0, len(lacing)
+        )
+        return header + lacing + body
+
+    def headers(self) -> Sequence[bytes]:
+        """Build the pages with codec headers."""
+        head = b"OpusHead" + struct.pack("<BBHIhB", 1, 2, self._skip, RATE, 0, 0)
+        tags = b"OpusTags" + b"\x00" * 8
+
+        return [self.page(0, head), self.page(0, tags)]
+
+    def build(self, granules: Sequence[int], size: int = 300) -> bytes:
+        """Build a file with codec headers and pages ending at granule positions."""
+        pages = [*self.headers(), *(self.page(g, b"a" * size) for g in granules)]
+        return b"".join(pages)